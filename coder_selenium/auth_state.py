@@ -0,0 +1,138 @@
+"""
+Authenticated-state snapshot cache
+Captures cookies and web storage after a login and restores them into fresh sessions
+"""
+
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from coder_selenium.cdp import try_cdp
+
+AUTH_CACHE_PATH = os.environ.get("SELENIUM_AUTH_CACHE", "/home/coder/.selenium-auth-state.json")
+
+STORAGE_JS = """
+function dump(storage) {
+  const out = {};
+  for (let i = 0; i < storage.length; i++) out[storage.key(i)] = storage.getItem(storage.key(i));
+  return out;
+}
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+# Runs on every new document in the tab, but only applies the snapshot once per tab
+RESTORE_STORAGE_FN = """function (origin, local, session) {
+  if (location.origin !== origin || sessionStorage.getItem('__coderRestored')) return;
+  Object.keys(local).forEach(function (k) { localStorage.setItem(k, local[k]); });
+  Object.keys(session).forEach(function (k) { sessionStorage.setItem(k, session[k]); });
+  sessionStorage.setItem('__coderRestored', '1');
+}"""
+RESTORE_STORAGE_JS = "(" + RESTORE_STORAGE_FN + ")(%s, %s, %s);"
+# WebDriver fallback: the snapshot travels as script arguments, which the flight recorder redacts
+RESTORE_STORAGE_ARGS_JS = "(" + RESTORE_STORAGE_FN + ")(arguments[0], arguments[1], arguments[2]);"
+
+
+def origin_of(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class AuthStateCache:
+    """Login snapshots keyed by user and base URL, with a TTL"""
+
+    def __init__(self, path=AUTH_CACHE_PATH, ttl=900):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                # A damaged cache only costs one fresh login per user
+                print(f"⚠️  Ignoring unreadable auth cache {path}: {e}")
+            if not isinstance(self.entries, dict):
+                self.entries = {}
+
+    def _key(self, user, base_url):
+        return f"{user}@{origin_of(base_url)}"
+
+    def _save(self):
+        # Private from the first byte (session cookies are credentials); one temp file per process
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump(self.entries, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def capture(self, driver, user, base_url):
+        """Snapshot cookies and storage of a logged-in session"""
+        storage = driver.execute_script(STORAGE_JS)
+        entry = {
+            "captured_at": time.time(),
+            "cookies": driver.get_cookies(),
+            "local": storage["local"],
+            "session": storage["session"],
+        }
+        with self._lock:
+            self.entries[self._key(user, base_url)] = entry
+            self._save()
+
+    def invalidate(self, user, base_url):
+        with self._lock:
+            if self.entries.pop(self._key(user, base_url), None) is not None:
+                self._save()
+
+    def get(self, user, base_url):
+        """A fresh snapshot, or None when missing or older than the TTL"""
+        with self._lock:
+            entry = self.entries.get(self._key(user, base_url))
+        if entry is None or time.time() - entry["captured_at"] > self.ttl:
+            return None
+        now = time.time()
+        cookies = [c for c in entry["cookies"] if c.get("expiry", now + 1) > now]
+        return dict(entry, cookies=cookies) if cookies else None
+
+    def restore(self, driver, user, base_url):
+        """Load a snapshot into a fresh session before its first navigation
+
+        Returns a token for finish_restore(), or None if there was nothing to restore.
+        """
+        entry = self.get(user, base_url)
+        if entry is None:
+            return None
+        origin = origin_of(base_url)
+        script = RESTORE_STORAGE_JS % (json.dumps(origin), json.dumps(entry["local"]), json.dumps(entry["session"]))
+        
+        # One step via CDP: cookies go into the jar, storage is applied on first load
+        cdp_cookies = [
+            {
+                "name": c["name"], "value": c["value"], "url": origin,
+                "path": c.get("path", "/"), "secure": c.get("secure", False),
+                "httpOnly": c.get("httpOnly", False),
+                **({"domain": c["domain"]} if c.get("domain") else {}),
+                **({"expires": c["expiry"]} if "expiry" in c else {}),
+                **({"sameSite": c["sameSite"]} if c.get("sameSite") else {}),
+            }
+            for c in entry["cookies"]
+        ]
+        if try_cdp(driver, "Network.setCookies", {"cookies": cdp_cookies}) is not None:
+            added = try_cdp(driver, "Page.addScriptToEvaluateOnNewDocument", {"source": script})
+            if added is not None:
+                return added.get("identifier", "")
+        
+        # Without CDP, cookies can only be set from a page on the same origin
+        driver.get(origin + "/")
+        for cookie in entry["cookies"]:
+            driver.add_cookie({k: v for k, v in cookie.items() if k != "sameSite" or v in ("Strict", "Lax", "None")})
+        driver.execute_script(RESTORE_STORAGE_ARGS_JS, origin, entry["local"], entry["session"])
+        return ""
+
+    def finish_restore(self, driver, token):
+        """Stop applying the storage snapshot to later documents"""
+        if token:
+            try_cdp(driver, "Page.removeScriptToEvaluateOnNewDocument", {"identifier": token})
@@ -0,0 +1,157 @@
+"""
+Batched element queries
+Resolve many locators and read many fields in a single execute_script round trip
+"""
+
+import threading
+
+from selenium.common.exceptions import NoSuchElementException
+
+# Finds elements for a (by, value) pair the way WebDriver locator strategies do
+FIND_JS = """
+function coderFind(root, by, value) {
+  switch (by) {
+    case 'id': return Array.from(root.querySelectorAll('#' + CSS.escape(value)));
+    case 'class name': return Array.from(root.querySelectorAll('.' + CSS.escape(value)));
+    case 'name': return Array.from(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+    case 'tag name': return Array.from(root.querySelectorAll(value));
+    case 'css selector': return Array.from(root.querySelectorAll(value));
+    case 'link text':
+    case 'partial link text':
+      return Array.from(root.querySelectorAll('a')).filter(function (a) {
+        const text = a.innerText.trim();
+        return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+      });
+    case 'xpath': {
+      const found = [];
+      const snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      for (let i = 0; i < snapshot.snapshotLength; i++) found.push(snapshot.snapshotItem(i));
+      return found;
+    }
+  }
+  throw new Error('Unsupported locator strategy: ' + by);
+}
+function coderRead(el, fields) {
+  const out = {};
+  fields.forEach(function (field) {
+    if (field === 'element') out[field] = el;
+    else if (field === 'tag') out[field] = el.tagName.toLowerCase();
+    else if (field === 'text') out[field] = el.innerText.trim();
+    else if (field === 'displayed') out[field] = !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    else {
+      let value = el.getAttribute(field);
+      if (value === null && field in el) value = el[field];
+      out[field] = value === null || value === undefined ? null : String(value);
+    }
+  });
+  return out;
+}
+"""
+
+QUERY_JS = FIND_JS + """
+const specs = arguments[0], root = arguments[1] || document, result = {};
+Object.keys(specs).forEach(function (key) {
+  const spec = specs[key];
+  result[key] = coderFind(root, spec[0], spec[1]).map(function (el) { return coderRead(el, spec[2]); });
+});
+return result;
+"""
+
+READ_JS = FIND_JS + "return coderRead(arguments[0], arguments[1]);"
+
+# Uses the native value setter so framework-controlled inputs (React) see the change
+FILL_JS = FIND_JS + """
+const fields = arguments[0], missing = [];
+fields.forEach(function (field) {
+  const el = coderFind(document, field[0], field[1])[0];
+  if (!el) { missing.push(field[0] + '=' + field[1]); return; }
+  const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+  Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, field[2]);
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return missing;
+"""
+
+
+class CommandTally:
+    """Counts WebDriver commands that batching replaced"""
+
+    def __init__(self):
+        self.labels = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self.labels = {}
+
+    def record(self, label, individual, batched=1):
+        with self._lock:
+            entry = self.labels.setdefault(label, [0, 0])
+            entry[0] += individual
+            entry[1] += batched
+
+    def report(self):
+        """Print per-label command counts before and after batching"""
+        if not self.labels:
+            return
+        print("\n📦 Batched WebDriver commands")
+        total_individual = total_batched = 0
+        for label, (individual, batched) in self.labels.items():
+            total_individual += individual
+            total_batched += batched
+            print(f"   {label:<40} {individual:>4} → {batched:<4} commands")
+        print(f"   {'Total':<40} {total_individual:>4} → {total_batched:<4} "
+              f"({total_individual - total_batched} round trips saved)")
+
+
+tally = CommandTally()
+
+
+def query(driver, specs, root=None, label="query"):
+    """Resolve locators and read fields in one round trip
+
+    specs maps a key to (by, value, fields); fields may name attributes or
+    'element', 'tag', 'text', 'displayed'. Returns {key: [ {field: value} ]}.
+    """
+    payload = {key: [by, value, list(fields)] for key, (by, value, fields) in specs.items()}
+    if getattr(driver, "backend", None) == "static":
+        return driver.query(payload, root)  # parsed in-process: no round trips to save
+    result = driver.execute_script(QUERY_JS, payload, root)
+    
+    # One find per locator plus one command per field read per element
+    individual = sum(
+        1 + len(result[key]) * len([f for f in fields if f != "element"])
+        for key, (_, _, fields) in specs.items()
+    )
+    tally.record(label, individual)
+    return result
+
+
+def query_one(driver, by, value, fields, root=None, label="query"):
+    """Like query() for a single required element"""
+    matches = query(driver, {"match": (by, value, fields)}, root=root, label=label)["match"]
+    if not matches:
+        raise NoSuchElementException(f"No element found for {by}={value}")
+    return matches[0]
+
+
+def read_element(driver, element, fields, label="read"):
+    """Read many attributes/properties of one element in one round trip"""
+    values = driver.execute_script(READ_JS, element, list(fields))
+    tally.record(label, len(fields))
+    return values
+
+
+def fill_form(driver, values, label="fill_form"):
+    """Fill many inputs in one round trip; values maps (by, value) to text"""
+    fields = [[by, value, text] for (by, value), text in values.items()]
+    missing = driver.execute_script(FILL_JS, fields)
+    if missing:
+        raise NoSuchElementException(f"Form fields not found: {', '.join(missing)}")
+    # Each field would otherwise cost a find plus a send_keys
+    tally.record(label, 2 * len(fields))
+    return len(fields)
+
+
+report = tally.report
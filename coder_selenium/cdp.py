@@ -0,0 +1,25 @@
+"""
+Chrome DevTools Protocol access for both direct and Grid sessions
+"""
+
+from selenium.common.exceptions import WebDriverException
+
+CDP_COMMAND = ("POST", "/session/$sessionId/goog/cdp/execute")
+
+
+def execute_cdp(driver, cmd, params=None):
+    """Run a CDP command on the current tab, local or through the Grid"""
+    if hasattr(driver, "execute_cdp_cmd"):
+        return driver.execute_cdp_cmd(cmd, params or {})
+    
+    # Remote drivers don't register the chromium vendor endpoint themselves
+    driver.command_executor.add_command("executeCdpCommand", *CDP_COMMAND)
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params or {}})["value"]
+
+
+def try_cdp(driver, cmd, params=None):
+    """Like execute_cdp, but return None when CDP is unavailable"""
+    try:
+        return execute_cdp(driver, cmd, params)
+    except (WebDriverException, AttributeError, KeyError):
+        return None
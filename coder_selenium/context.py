@@ -0,0 +1,16 @@
+"""
+Per-thread "current test" shared by the measurement helpers
+"""
+
+import threading
+
+_local = threading.local()
+
+
+def begin_test(name):
+    """Attribute measurements made on this thread to `name`"""
+    _local.test = name
+
+
+def current_test():
+    return getattr(_local, "test", "(unknown)")
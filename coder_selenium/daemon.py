@@ -0,0 +1,215 @@
+"""
+Pre-warmed test daemon
+Keeps Python, Selenium and warm browsers loaded; runs test scripts sent over a Unix socket
+
+Start with `python -m coder_selenium.daemon` (selenium-client.py does this on demand).
+Protocol: the client sends one JSON line ({"cmd": "run" | "status" | "stop", ...}); the
+daemon answers with JSON lines {"out": text} while a script runs and a final {"exit": code}.
+A run whose environment changes a setting read at import time gets {"restart": [names]}
+instead, and the client restarts the daemon with its own environment.
+"""
+
+import io
+import json
+import os
+import runpy
+import signal
+import socketserver
+import sys
+import threading
+import time
+import traceback
+
+SOCKET_PATH = os.environ.get("SELENIUM_DAEMON_SOCKET", "/home/coder/.selenium-daemon.sock")
+
+# Read once when coder_selenium is imported, so a run can't change them in a warm daemon
+IMPORT_TIME_SETTINGS = (
+    "SELENIUM_GRID_URL", "CHROMEDRIVER_PATH", "SELENIUM_DISPATCH",
+    "SELENIUM_TIMEOUT_POLICY", "SELENIUM_LOCATOR_LATENCY", "SELENIUM_LOCATOR_FLOOR",
+    "SELENIUM_ARTIFACTS", "SELENIUM_FAILURES_DIR", "SELENIUM_FLIGHT_RECORDER_SIZE",
+    "SELENIUM_STATIC_TIER", "SELENIUM_MEMORY_WATERMARK", "SELENIUM_BROWSER_MEMORY_CAP_MB",
+    "SELENIUM_GOVERNOR_INTERVAL", "SELENIUM_ADMISSION_TIMEOUT",
+    "SELENIUM_HISTORY_DB", "SCREENSHOT_STORE", "SELENIUM_ARCHIVE_DIR",
+    "SELENIUM_AUTH_CACHE", "SELENIUM_RESOURCE_SIZES", "NAV_BUDGETS",
+)
+
+
+class StreamWriter(io.TextIOBase):
+    """File-like object that forwards writes to the client as {"out": ...} lines"""
+
+    def __init__(self, send):
+        self._send = send
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if text:
+            self._send({"out": text})
+        return len(text)
+
+
+class ThreadRouter(io.TextIOBase):
+    """sys.stdout/stderr replacement: output goes to the active run, or the daemon log"""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.target = None
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        return (self.target or self.fallback).write(text)
+
+    def flush(self):
+        (self.target or self.fallback).flush()
+
+
+def reset_measurements():
+    """Clear the per-run collectors that live at module level"""
+    from coder_selenium import batch, flight_recorder, static, timeouts, waits
+    from coder_selenium.governor import governor
+    from coder_selenium.driver_factory import default_factory
+    from coder_selenium.instrumentation import timings
+    from coder_selenium.nav_timing import navigation
+
+    for collector in (timings, navigation, waits.default_recorder, batch.tally, static.tally,
+                      timeouts.default_policy, flight_recorder.default_recorder, governor,
+                      default_factory.dispatcher):
+        collector.clear()
+    default_factory.acquisitions.clear()
+
+
+class Daemon:
+    """Runs one script at a time in this process, so imports and pools carry over"""
+
+    def __init__(self, socket_path=SOCKET_PATH):
+        self.socket_path = socket_path
+        self.started = time.time()
+        self.runs = 0
+        self.current = None
+        self._run_lock = threading.Lock()
+        self.settings = {name: os.environ.get(name) for name in IMPORT_TIME_SETTINGS}
+        self.stdout = ThreadRouter(sys.stdout)
+        self.stderr = ThreadRouter(sys.stderr)
+        self.server = None
+
+    def warm_up(self):
+        """Import everything a run needs so the first run doesn't pay for it"""
+        started = time.perf_counter()
+        import selenium.webdriver  # noqa: F401
+        import selenium.webdriver.support.expected_conditions  # noqa: F401
+        from coder_selenium import (auth_state, batch, driver_factory, fixture_app, flight_recorder,  # noqa: F401
+                                    governor, history, network_policy, parallel, replay_proxy,
+                                    screenshots, static, tabs, timeouts, viewports, waits)
+        from coder_selenium.session_pool import keep_warm
+        keep_warm()
+        driver_factory.default_factory.backend  # probe the Grid once, up front
+        print(f"🔥 Modules loaded in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    def changed_settings(self, env):
+        """Import-time settings that `env` sets differently from this daemon's environment"""
+        return [name for name, value in self.settings.items() if env.get(name) != value]
+
+    def run_script(self, request, send):
+        """Execute a test script as __main__ with the client's argv, cwd and environment"""
+        script = request["script"]
+        if not self._run_lock.acquire(blocking=False):
+            send({"out": f"⏳ Waiting for the current run ({self.current}) to finish...\n"})
+            self._run_lock.acquire()
+        saved = (sys.argv[:], os.getcwd(), dict(os.environ), sys.path[:])
+        writer = StreamWriter(send)
+        self.current = os.path.basename(script)
+        started = time.perf_counter()
+        code = 0
+        try:
+            os.environ.clear()
+            os.environ.update(request.get("env", {}))
+            os.chdir(request.get("cwd", os.path.dirname(script)))
+            sys.argv = [script] + request.get("args", [])
+            sys.path.insert(0, os.path.dirname(script))
+            self.stdout.target = self.stderr.target = writer
+            reset_measurements()
+            # Re-executing the file picks up edits; coder_selenium and the pools stay loaded
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            if e.code is not None and not isinstance(e.code, int):
+                writer.write(f"{e.code}\n")
+        except BaseException:
+            writer.write(traceback.format_exc())
+            code = 1
+        finally:
+            self.stdout.target = self.stderr.target = None
+            sys.argv, cwd, env, sys.path[:] = saved
+            os.chdir(cwd)
+            os.environ.clear()
+            os.environ.update(env)
+            self.runs += 1
+            self.current = None
+            self._run_lock.release()
+        print(f"🏁 {os.path.basename(script)} {' '.join(request.get('args', []))} "
+              f"exited {code} in {time.perf_counter() - started:.1f}s")
+        return code
+
+    def status(self):
+        from coder_selenium import session_pool
+        pools = {
+            " / ".join(str(part) for part in key[:1] + key[2:]): {
+                "size": pool.size, "idle": pool._idle.qsize(), "leased": len(pool._leased)
+            }
+            for key, pool in session_pool._warm_pools.items()
+        }
+        return {"pid": os.getpid(), "uptime_s": time.time() - self.started,
+                "runs": self.runs, "running": self.current, "pools": pools}
+
+    def serve(self):
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                def send(message):
+                    try:
+                        self.wfile.write((json.dumps(message) + "\n").encode())
+                        self.wfile.flush()
+                    except OSError:
+                        pass  # client went away; let the run finish anyway
+
+                request = json.loads(self.rfile.readline() or b"{}")
+                cmd = request.get("cmd")
+                if cmd == "run":
+                    changed = daemon.changed_settings(request.get("env", {}))
+                    if changed:
+                        send({"restart": changed})
+                    else:
+                        send({"exit": daemon.run_script(request, send)})
+                elif cmd == "status":
+                    send({"status": daemon.status()})
+                elif cmd == "stop":
+                    send({"exit": 0})
+                    threading.Thread(target=daemon.server.shutdown).start()
+                else:
+                    send({"out": f"Unknown command {cmd!r}\n", "exit": 2})
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)  # stale socket from a previous daemon
+        sys.stdout, sys.stderr = self.stdout, self.stderr
+        self.warm_up()
+        self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        self.server.daemon_threads = True
+        # Quit the warm browsers on `kill` too, not only on a client's stop
+        signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=self.server.shutdown).start())
+        print(f"🧪 Selenium daemon listening on {self.socket_path} (pid {os.getpid()})")
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            os.unlink(self.socket_path)
+            from coder_selenium.session_pool import close_warm_pools
+            close_warm_pools()
+            print("👋 Selenium daemon stopped")
+
+
+if __name__ == "__main__":
+    Daemon().serve()
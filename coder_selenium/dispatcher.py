@@ -0,0 +1,132 @@
+"""
+Client-side Grid session dispatch
+Reads slot availability from the Grid's /status and steers each new session to the
+least-loaded node, or to direct ChromeDriver when no node has a free slot
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+
+NODE_CAPABILITY = "coder:node"
+DISPATCH_ENABLED = os.environ.get("SELENIUM_DISPATCH", "1") != "0"
+
+
+class NodeLoad:
+    """Slot usage of one Grid node as seen in /status"""
+
+    def __init__(self, name, uri, up, busy, slots):
+        self.name = name
+        self.uri = uri
+        self.up = up
+        self.busy = busy
+        self.slots = slots
+
+    @property
+    def free(self):
+        return self.slots - self.busy
+
+
+def parse_status(status):
+    """NodeLoad for every node in a /status payload; only nodes with a coder:node stereotype"""
+    nodes = []
+    for node in status.get("value", {}).get("nodes", []):
+        slots = node.get("slots", [])
+        names = {slot.get("stereotype", {}).get(NODE_CAPABILITY) for slot in slots} - {None}
+        if len(names) != 1:
+            continue  # not one of ours, e.g. a standalone server
+        nodes.append(NodeLoad(
+            names.pop(), node.get("uri"), node.get("availability") == "UP",
+            sum(1 for slot in slots if slot.get("session")), len(slots),
+        ))
+    return nodes
+
+
+class GridDispatcher:
+    """Chooses a node per session; a node that failed to start a session sits out `cooldown` seconds"""
+
+    def __init__(self, grid_url, timeout=1.0, cooldown=60.0, enabled=DISPATCH_ENABLED):
+        self.grid_url = grid_url
+        self.timeout = timeout
+        self.cooldown = cooldown
+        self.enabled = enabled
+        self.placements = {}  # node name, "grid" or "direct" -> sessions started there
+        self._pending = {}  # node -> sessions requested but not yet reported by /status
+        self._failed = {}  # node -> time it last failed
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Forget this run's placements; node cooldowns carry over"""
+        with self._lock:
+            self.placements = {}
+
+    def status(self):
+        try:
+            with urllib.request.urlopen(f"{self.grid_url}/status", timeout=self.timeout) as response:
+                return json.load(response)
+        except (urllib.error.URLError, OSError, ValueError):
+            return None
+
+    def choose(self):
+        """A node name, None to let the Grid place the session, or "direct" when the Grid is full"""
+        status = self.status() if self.enabled else None
+        if status is None:
+            return None
+        nodes = parse_status(status)
+        if not nodes:
+            return None  # no coder nodes: plain Grid scheduling
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                node for node in nodes
+                if node.up and now - self._failed.get(node.name, float("-inf")) > self.cooldown
+                and node.free - self._pending.get(node.name, 0) > 0
+            ]
+            if not candidates:
+                return "direct"
+            # Least loaded first; ties go to the node with the most room
+            best = min(candidates, key=lambda n: ((n.busy + self._pending.get(n.name, 0)) / n.slots,
+                                                  -n.free, n.name))
+            self._pending[best.name] = self._pending.get(best.name, 0) + 1
+        return best.name
+
+    def route(self, options):
+        """(backend, options, node) for the next session; options are copied before pinning a node"""
+        node = self.choose()
+        if node == "direct":
+            print("🧭 No free Grid slot; starting this session on direct ChromeDriver")
+            return "direct", options, None
+        if node is None:
+            return "grid", options, None
+        pinned = copy.deepcopy(options)
+        pinned.set_capability(NODE_CAPABILITY, node)
+        return "grid", pinned, node
+
+    def started(self, backend, node):
+        """The session routed to `node` is up (or failed over to `backend`)"""
+        with self._lock:
+            if node is not None:
+                self._pending[node] = max(0, self._pending.get(node, 0) - 1)
+            key = node if backend == "grid" and node else backend
+            self.placements[key] = self.placements.get(key, 0) + 1
+
+    def failed(self, node):
+        """Starting a session on `node` failed; keep new sessions away from it for a while"""
+        if node is None:
+            return
+        with self._lock:
+            self._pending[node] = max(0, self._pending.get(node, 0) - 1)
+            self._failed[node] = time.monotonic()
+        print(f"⚠️  Grid node {node} failed to start a session; avoiding it for {self.cooldown:.0f}s")
+
+    def report(self):
+        """Print where sessions were started"""
+        if not self.placements:
+            return
+        print("\n🧭 Sessions by placement")
+        for place, count in sorted(self.placements.items()):
+            print(f"   {place:<20} {count:>4}")
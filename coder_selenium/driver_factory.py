@@ -0,0 +1,142 @@
+"""
+Shared driver factory
+Probes the Selenium Grid once and caches which backend to use
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from coder_selenium import flight_recorder, timeouts
+from coder_selenium.dispatcher import GridDispatcher
+from coder_selenium.governor import governor
+from coder_selenium.instrumentation import timings
+from coder_selenium.nav_timing import navigation
+
+GRID_URL = os.environ.get("SELENIUM_GRID_URL", "http://localhost:4444")
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH", "/home/coder/selenium-drivers/chromedriver")
+
+
+class DriverFactory:
+    """Create drivers on the Grid or direct ChromeDriver, whichever is up"""
+
+    def __init__(self, grid_url=GRID_URL, chromedriver_path=CHROMEDRIVER_PATH,
+                 probe_timeout=1.0, implicit_wait=10):
+        self.grid_url = grid_url
+        self.chromedriver_path = chromedriver_path
+        self.probe_timeout = probe_timeout
+        self.implicit_wait = implicit_wait
+        self.acquisitions = []  # (backend, seconds)
+        self.dispatcher = GridDispatcher(grid_url, timeout=probe_timeout)
+        self._backend = None
+        self._lock = threading.Lock()
+
+    def probe_grid(self):
+        """Ask the Grid whether it can take sessions, with a short timeout"""
+        try:
+            with urllib.request.urlopen(f"{self.grid_url}/status", timeout=self.probe_timeout) as response:
+                status = json.load(response)
+            return bool(status.get("value", {}).get("ready"))
+        except (urllib.error.URLError, OSError, ValueError):
+            return False
+
+    @property
+    def backend(self):
+        """Cached backend choice: 'grid' or 'direct'"""
+        with self._lock:
+            if self._backend is None:
+                started = time.perf_counter()
+                self._backend = "grid" if self.probe_grid() else "direct"
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"🔌 Selected {self._backend} backend (probe took {elapsed:.0f} ms)")
+            return self._backend
+
+    def invalidate(self):
+        """Forget the cached backend so the next session re-probes"""
+        with self._lock:
+            self._backend = None
+
+    def _create(self, backend, options):
+        if backend == "grid":
+            return webdriver.Remote(command_executor=self.grid_url, options=options)
+        service = Service(self.chromedriver_path)
+        return webdriver.Chrome(service=service, options=options)
+
+    def _start(self, options):
+        """(driver, backend, node, seconds) for a new session, failing over once"""
+        backend, session_options, node = self.backend, options, None
+        if backend == "grid":
+            # Least-loaded node, or direct ChromeDriver when every node is busy
+            backend, session_options, node = self.dispatcher.route(options)
+        started = time.perf_counter()
+        try:
+            driver = self._create(backend, session_options)
+        except Exception as e:
+            print(f"⚠️  {backend} session failed: {e}")
+            if node is not None:
+                self.dispatcher.failed(node)  # one wedged node; the Grid itself is fine
+                backend = "direct"
+            else:
+                self.invalidate()
+                backend = "direct" if backend == "grid" else "grid"
+            node = None
+            started = time.perf_counter()
+            driver = self._create(backend, options)
+        return driver, backend, node, time.perf_counter() - started
+
+    def create(self, options, policy=None):
+        """Start a new session on the cached backend, failing over once"""
+        if policy is not None:
+            policy.configure(options)
+        flight_recorder.default_recorder.configure(options)
+        governor.admit()  # queue here while the pod is near its memory limit
+        try:
+            driver, backend, node, elapsed = self._start(options)
+        except BaseException:
+            governor.release()  # no browser started; free the memory reserved for it
+            raise
+        driver.backend = backend
+        driver.node = node
+        governor.register(driver)  # takes over the admission's reservation
+        
+        self.dispatcher.started(backend, node)
+        self.acquisitions.append((backend, elapsed))
+        timings.record("session.start", elapsed, backend)
+        print(f"⏱️  Acquired {backend} session{f' on {node}' if node else ''} in {elapsed * 1000:.0f} ms")
+        
+        timings.instrument(driver)
+        navigation.attach(driver)
+        if policy is not None:
+            # Block now and account for every later driver.get; the pool re-applies it after resets
+            policy.attach(driver)
+        driver.network_policy = policy
+        if timeouts.enabled:
+            timeouts.default_policy.instrument(driver)  # learned per-locator budgets
+        else:
+            driver.implicitly_wait(self.implicit_wait)
+        flight_recorder.instrument(driver)
+        return driver
+
+    def summary(self):
+        """Acquisition count and mean time per backend"""
+        stats = {}
+        for backend, elapsed in self.acquisitions:
+            stats.setdefault(backend, []).append(elapsed)
+        return {
+            backend: {"count": len(times), "mean_ms": sum(times) / len(times) * 1000}
+            for backend, times in stats.items()
+        }
+
+
+default_factory = DriverFactory()
+
+
+def create_driver(options, policy=None):
+    """Create a driver with the process-wide factory"""
+    return default_factory.create(options, policy)
@@ -0,0 +1,265 @@
+"""
+Local saucedemo stand-in
+Serves the same DOM contract the e-commerce tests use, from memory, on a random port
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PRODUCTS = [
+    (4, "Sauce Labs Backpack", 29.99),
+    (0, "Sauce Labs Bike Light", 9.99),
+    (1, "Sauce Labs Bolt T-Shirt", 15.99),
+    (5, "Sauce Labs Fleece Jacket", 49.99),
+    (2, "Sauce Labs Onesie", 7.99),
+    (3, "Test.allTheThings() T-Shirt (Red)", 15.99),
+]
+
+USERS = {"standard_user": "secret_sauce"}
+
+STYLE = """
+body { font-family: Arial, sans-serif; margin: 0; }
+.login_logo, .app_logo { font-size: 24px; padding: 16px; text-align: center; }
+.login_wrapper, .inventory_container, .checkout_info { max-width: 640px; margin: 0 auto; padding: 16px; }
+input { display: block; width: 100%; margin: 8px 0; padding: 8px; box-sizing: border-box; }
+.inventory_item, .cart_item { border-bottom: 1px solid #ddd; padding: 8px 0; }
+.header_container { display: flex; justify-content: space-between; align-items: center; padding: 0 16px; }
+.shopping_cart_badge { background: #e2231a; color: white; border-radius: 50%; padding: 2px 7px; }
+"""
+
+# Shared page script: session cookie and cart state, the same keys saucedemo uses
+SCRIPT = """
+const PRODUCTS = %(products)s;
+function cookie(name) {
+  const match = document.cookie.match(new RegExp('(?:^|; )' + name + '=([^;]*)'));
+  return match ? decodeURIComponent(match[1]) : null;
+}
+function cart() { return JSON.parse(localStorage.getItem('cart-contents') || '[]'); }
+function saveCart(items) { localStorage.setItem('cart-contents', JSON.stringify(items)); renderBadge(); }
+function renderBadge() {
+  const link = document.querySelector('.shopping_cart_link');
+  if (!link) return;
+  let badge = link.querySelector('.shopping_cart_badge');
+  const count = cart().length;
+  if (!count) { if (badge) badge.remove(); return; }
+  if (!badge) { badge = document.createElement('span'); badge.className = 'shopping_cart_badge'; link.appendChild(badge); }
+  badge.textContent = String(count);
+}
+function requireLogin() { if (!cookie('session-username')) { location.href = '/'; } }
+"""
+
+HEADER = """
+<div class="header_container">
+  <div class="app_logo">Swag Labs</div>
+  <a class="shopping_cart_link" href="/cart.html">🛒</a>
+</div>
+"""
+
+
+def _page(title, body, script="", protected=True):
+    guard = "requireLogin();" if protected else ""
+    products = json.dumps([{"id": i, "name": n, "price": p} for i, n, p in PRODUCTS])
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>{STYLE}</style>
+<script>{SCRIPT % {"products": products}} {guard}</script>
+</head>
+<body>
+{body}
+<script>renderBadge(); {script}</script>
+</body>
+</html>"""
+
+
+def _login_page():
+    body = """
+<div class="login_logo">Swag Labs</div>
+<div class="login_wrapper">
+  <input id="user-name" data-test="username" placeholder="Username" type="text">
+  <input id="password" data-test="password" placeholder="Password" type="password">
+  <h3 class="error-message-container" data-test="error"></h3>
+  <input id="login-button" data-test="login-button" class="submit-button btn_action" type="submit" value="Login">
+</div>"""
+    script = """
+const USERS = %s;
+document.getElementById('login-button').addEventListener('click', function () {
+  const user = document.getElementById('user-name').value;
+  const password = document.getElementById('password').value;
+  if (USERS[user] !== password) {
+    document.querySelector('[data-test=error]').textContent =
+      'Epic sadface: Username and password do not match any user in this service';
+    return;
+  }
+  document.cookie = 'session-username=' + encodeURIComponent(user) + '; path=/';
+  location.href = '/inventory.html';
+});""" % json.dumps(USERS)
+    return _page("Swag Labs", body, script, protected=False)
+
+
+def _inventory_page():
+    items = "".join(f"""
+  <div class="inventory_item">
+    <div class="inventory_item_name" data-test="inventory-item-name">{name}</div>
+    <div class="inventory_item_price">${price:.2f}</div>
+    <button class="btn btn_primary btn_small btn_inventory" data-id="{item_id}">Add to cart</button>
+  </div>""" for item_id, name, price in PRODUCTS)
+    body = f"""{HEADER}
+<div class="inventory_container"><div class="inventory_list">{items}
+</div></div>"""
+    script = """
+document.querySelectorAll('.btn_inventory').forEach(function (button) {
+  const id = Number(button.dataset.id);
+  if (cart().includes(id)) button.textContent = 'Remove';
+  button.addEventListener('click', function () {
+    const items = cart();
+    const index = items.indexOf(id);
+    if (index === -1) { items.push(id); button.textContent = 'Remove'; }
+    else { items.splice(index, 1); button.textContent = 'Add to cart'; }
+    saveCart(items);
+  });
+});"""
+    return _page("Swag Labs", body, script)
+
+
+def _cart_page():
+    body = f"""{HEADER}
+<div class="inventory_container">
+  <div class="cart_list"></div>
+  <button id="checkout" class="btn btn_action checkout_button">Checkout</button>
+</div>"""
+    script = """
+const list = document.querySelector('.cart_list');
+cart().forEach(function (id) {
+  const product = PRODUCTS.find(function (p) { return p.id === id; });
+  const item = document.createElement('div');
+  item.className = 'cart_item';
+  item.innerHTML = '<div class="inventory_item_name">' + product.name + '</div>' +
+                   '<div class="inventory_item_price">$' + product.price.toFixed(2) + '</div>';
+  list.appendChild(item);
+});
+document.getElementById('checkout').addEventListener('click', function () {
+  location.href = '/checkout-step-one.html';
+});"""
+    return _page("Swag Labs", body, script)
+
+
+def _checkout_step_one_page():
+    body = f"""{HEADER}
+<div class="checkout_info">
+  <input id="first-name" data-test="firstName" placeholder="First Name" type="text">
+  <input id="last-name" data-test="lastName" placeholder="Last Name" type="text">
+  <input id="postal-code" data-test="postalCode" placeholder="Zip/Postal Code" type="text">
+  <h3 data-test="error"></h3>
+  <input id="continue" class="submit-button btn btn_primary" type="submit" value="Continue">
+</div>"""
+    script = """
+document.getElementById('continue').addEventListener('click', function () {
+  const missing = ['first-name', 'last-name', 'postal-code'].find(function (id) {
+    return !document.getElementById(id).value;
+  });
+  if (missing) {
+    document.querySelector('[data-test=error]').textContent = 'Error: ' + missing + ' is required';
+    return;
+  }
+  location.href = '/checkout-step-two.html';
+});"""
+    return _page("Swag Labs", body, script)
+
+
+def _checkout_step_two_page():
+    body = f"""{HEADER}
+<div class="checkout_info">
+  <div class="cart_list"></div>
+  <div class="summary_info">
+    <div class="summary_subtotal_label"></div>
+    <div class="summary_tax_label"></div>
+    <div class="summary_total_label"></div>
+  </div>
+  <button id="finish" class="btn btn_action cart_button">Finish</button>
+</div>"""
+    script = """
+let subtotal = 0;
+cart().forEach(function (id) {
+  const product = PRODUCTS.find(function (p) { return p.id === id; });
+  subtotal += product.price;
+  const item = document.createElement('div');
+  item.className = 'cart_item';
+  item.innerHTML = '<div class="inventory_item_name">' + product.name + '</div>';
+  document.querySelector('.cart_list').appendChild(item);
+});
+const tax = Math.round(subtotal * 8) / 100;
+document.querySelector('.summary_subtotal_label').textContent = 'Item total: $' + subtotal.toFixed(2);
+document.querySelector('.summary_tax_label').textContent = 'Tax: $' + tax.toFixed(2);
+document.querySelector('.summary_total_label').textContent = 'Total: $' + (subtotal + tax).toFixed(2);
+document.getElementById('finish').addEventListener('click', function () {
+  saveCart([]);
+  location.href = '/checkout-complete.html';
+});"""
+    return _page("Swag Labs", body, script)
+
+
+def _checkout_complete_page():
+    body = f"""{HEADER}
+<div class="checkout_complete_container">
+  <h2 class="complete-header">Thank you for your order!</h2>
+  <div class="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>
+</div>"""
+    return _page("Swag Labs", body)
+
+
+# Pages are rendered once at import time and served from memory
+PAGES = {
+    "/": _login_page(),
+    "/inventory.html": _inventory_page(),
+    "/cart.html": _cart_page(),
+    "/checkout-step-one.html": _checkout_step_one_page(),
+    "/checkout-step-two.html": _checkout_step_two_page(),
+    "/checkout-complete.html": _checkout_complete_page(),
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serve the in-memory fixture pages"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        page = PAGES.get(self.path.split("?", 1)[0])
+        body = (page or "Not Found").encode("utf-8")
+        self.send_response(200 if page else 404)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # keep test output clean
+
+
+class FixtureServer:
+    """In-process HTTP server for the saucedemo fixture"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), FixtureHandler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
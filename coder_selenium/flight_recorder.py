@@ -0,0 +1,184 @@
+"""
+Flight recorder for failing tests
+Keeps the last commands of every driver in memory and writes rich artifacts only when a test fails
+"""
+
+import functools
+import json
+import os
+import re
+import time
+import traceback
+import unittest
+from collections import deque
+from datetime import datetime
+
+from selenium.webdriver.remote.command import Command
+
+from coder_selenium.context import current_test
+
+FAILURES_DIR = os.environ.get("SELENIUM_FAILURES_DIR", "/home/coder/failures")
+BUFFER_SIZE = int(os.environ.get("SELENIUM_FLIGHT_RECORDER_SIZE", "200"))
+# "failures" writes artifacts for failing tests only; "always" keeps success screenshots too
+ARTIFACT_MODE = os.environ.get("SELENIUM_ARTIFACTS", "failures")
+
+# Typed text, script arguments (batch.fill_form passes passwords), cookie values and CDP
+# parameters (auth_state restores session cookies through Network.setCookies) can be
+# credentials; never write them to disk
+REDACTED = "<redacted>"
+SCRIPT_COMMANDS = {Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC}
+CDP_COMMAND = "executeCdpCommand"
+
+
+def _redact(command, params):
+    if command == Command.SEND_KEYS_TO_ELEMENT:
+        return {"id": params.get("id"), "text": REDACTED}
+    if command in SCRIPT_COMMANDS and params.get("args"):
+        return dict(params, args=REDACTED)
+    if command == Command.ADD_COOKIE and isinstance(params.get("cookie"), dict):
+        return dict(params, cookie=dict(params["cookie"], value=REDACTED))
+    if command == CDP_COMMAND and params.get("params"):
+        return dict(params, params=REDACTED)
+    return params
+
+
+def _describe_params(command, params):
+    if not params:
+        return None
+    params = _redact(command, params)
+    text = json.dumps({k: v for k, v in params.items() if k != "sessionId"}, default=str)
+    return text if len(text) <= 300 else text[:300] + "…"
+
+
+class FlightRecorder:
+    """Per-driver ring buffer of (time, test, command, params, duration, url, error)
+
+    Recording is one deque append per command; nothing is formatted or written
+    until dump() is called for a failure.
+    """
+
+    def __init__(self, size=BUFFER_SIZE, directory=FAILURES_DIR, mode=ARTIFACT_MODE):
+        self.size = size
+        self.directory = directory
+        self.success_artifacts = mode == "always"
+        self.dumps = []
+
+    def clear(self):
+        self.dumps = []
+
+    def configure(self, options):
+        """Ask ChromeDriver to keep the browser console so failures can include it
+
+        Merges into any logging prefs already set, e.g. the network policy's performance log.
+        """
+        prefs = dict(options.capabilities.get("goog:loggingPrefs") or {})
+        prefs["browser"] = "ALL"
+        options.set_capability("goog:loggingPrefs", prefs)
+
+    def instrument(self, driver):
+        """Record every command `driver` sends into its own ring buffer"""
+        buffer = driver.flight_buffer = deque(maxlen=self.size)
+        execute = driver.execute
+        page = [None]
+
+        def recorded_execute(driver_command, params=None):
+            if driver_command == Command.GET:
+                page[0] = params.get("url")
+            started = time.perf_counter()
+            error = None
+            try:
+                return execute(driver_command, params)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                buffer.append((time.time(), current_test(), driver_command, params,
+                               time.perf_counter() - started, page[0], error))
+
+        driver.execute = recorded_execute
+        return driver
+
+    def commands(self, driver, entries=None):
+        """The buffered commands of `driver` (or `entries`), oldest first, as JSON-ready dicts"""
+        return [
+            {"time": datetime.fromtimestamp(at).isoformat(timespec="milliseconds"), "test": test,
+             "command": command, "params": _describe_params(command, params),
+             "duration_ms": round(duration * 1000, 1), "url": url,
+             "error": f"{type(error).__name__}: {str(error).splitlines()[0] if str(error) else ''}" if error else None}
+            for at, test, command, params, duration, url, error in
+            (entries if entries is not None else list(getattr(driver, "flight_buffer", ())))
+        ]
+
+    def dump(self, driver, name, error=None):
+        """Write DOM, screenshot, console log and command buffer for a failure; returns the directory"""
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")[:-3]
+        path = os.path.join(self.directory, f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}-{stamp}")
+        os.makedirs(path, exist_ok=True)
+        buffered = list(getattr(driver, "flight_buffer", ()))  # before the dump adds its own commands
+        test_started = min((entry[0] for entry in buffered if entry[1] == current_test()), default=0)
+
+        def artifact(filename, produce, mode="w"):
+            try:
+                data = produce()
+            except Exception as e:  # a crashed or static driver still leaves the rest
+                data, filename, mode = f"{type(e).__name__}: {e}\n", filename + ".unavailable", "w"
+            with open(os.path.join(path, filename), mode, encoding=None if "b" in mode else "utf-8") as f:
+                f.write(data)
+
+        if error is not None:
+            artifact("error.txt", lambda: error if isinstance(error, str) else "".join(
+                traceback.format_exception(type(error), error, error.__traceback__)))
+        artifact("url.txt", lambda: driver.current_url + "\n")
+        artifact("dom.html", lambda: driver.page_source)
+        artifact("screenshot.png", driver.get_screenshot_as_png, mode="wb")
+        artifact("console.json", lambda: json.dumps(
+            [entry for entry in driver.get_log("browser") if entry.get("timestamp", 0) >= test_started * 1000],
+            indent=2))
+        artifact("commands.json", lambda: json.dumps(self.commands(driver, buffered), indent=2))
+        self.dumps.append(path)
+        print(f"🛩️  Flight recorder: {name} failed, artifacts in {path}")
+        return path
+
+    def report(self):
+        """Print where this run's failure artifacts went"""
+        if not self.dumps:
+            return
+        print(f"\n🛩️  Failure artifacts ({len(self.dumps)})")
+        for path in self.dumps:
+            print(f"   {path}")
+
+
+default_recorder = FlightRecorder()
+
+
+def dump_on_failure(cls):
+    """Class decorator: when a test method raises, dump the flight recorder of `self.driver`
+
+    Runs before tearDown, so the browser is still on the failing page.
+    """
+    def wrap(test):
+        @functools.wraps(test)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return test(self, *args, **kwargs)
+            except unittest.SkipTest:
+                raise
+            except Exception as e:
+                driver = getattr(self, "driver", None)
+                if driver is not None:
+                    try:
+                        default_recorder.dump(driver, test.__name__, e)
+                    except OSError as dump_error:
+                        print(f"⚠️  Flight recorder dump failed: {dump_error}")
+                raise
+        return wrapper
+
+    for name, member in list(vars(cls).items()):
+        if name.startswith("test") and callable(member):
+            setattr(cls, name, wrap(member))
+    return cls
+
+
+instrument = default_recorder.instrument
+dump = default_recorder.dump
+report = default_recorder.report
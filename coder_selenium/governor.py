@@ -0,0 +1,358 @@
+"""
+Browser resource governor
+Samples memory and CPU of every browser's process tree from /proc, holds back new sessions
+above a memory watermark and flags browsers that outgrow their cap for recycling
+"""
+
+import collections
+import json
+import os
+import threading
+import time
+
+WATERMARK = float(os.environ.get("SELENIUM_MEMORY_WATERMARK", "0.85"))
+BROWSER_CAP_MB = float(os.environ.get("SELENIUM_BROWSER_MEMORY_CAP_MB", "1500"))
+SAMPLE_INTERVAL = float(os.environ.get("SELENIUM_GOVERNOR_INTERVAL", "1.0"))
+ADMISSION_TIMEOUT = float(os.environ.get("SELENIUM_ADMISSION_TIMEOUT", "300"))
+RESOURCES_PATH = "/home/coder/test_resources.json"
+
+CGROUP_V2 = "/sys/fs/cgroup"
+CGROUP_V1 = "/sys/fs/cgroup/memory"
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+MB = 1024 * 1024
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _field(text, key):
+    """Integer value of a `key value [unit]` line, as in memory.stat and smaps_rollup"""
+    for line in (text or "").splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0] == key:
+            return int(parts[1])
+    return 0
+
+
+def pod_memory():
+    """(working set, limit) in bytes for this container, as the OOM killer sees it
+
+    Working set is cgroup usage minus inactive page cache (what kubelet reports);
+    without a cgroup limit the host's MemTotal is the limit.
+    """
+    current = _read(f"{CGROUP_V2}/memory.current")
+    if current is not None:
+        limit = (_read(f"{CGROUP_V2}/memory.max") or "max").strip()
+        usage = int(current) - _field(_read(f"{CGROUP_V2}/memory.stat"), "inactive_file")
+        limit = None if limit == "max" else int(limit)
+    else:
+        current = _read(f"{CGROUP_V1}/memory.usage_in_bytes")
+        usage = limit = None
+        if current is not None:
+            usage = int(current) - _field(_read(f"{CGROUP_V1}/memory.stat"), "total_inactive_file")
+            limit = int(_read(f"{CGROUP_V1}/memory.limit_in_bytes") or 0) or None
+            if limit and limit >= 1 << 60:
+                limit = None  # v1 reports "unlimited" as a huge number
+    meminfo = {}
+    for line in (_read("/proc/meminfo") or "").splitlines():
+        name, _, value = line.partition(":")
+        meminfo[name] = int(value.split()[0]) * 1024 if value.split() else 0
+    if usage is None:
+        usage = meminfo.get("MemTotal", 0) - meminfo.get("MemAvailable", 0)
+    return max(0, usage), limit or meminfo.get("MemTotal") or None
+
+
+def process_table():
+    """{pid: (ppid, name, argv)} for every visible process"""
+    table = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        stat = _read(f"/proc/{entry}/stat")
+        cmdline = _read(f"/proc/{entry}/cmdline")
+        if stat is None or cmdline is None:
+            continue  # exited while we looked
+        name = stat[stat.find("(") + 1:stat.rfind(")")]
+        ppid = int(stat[stat.rfind(")") + 2:].split()[1])
+        table[int(entry)] = (ppid, name, cmdline.split("\0"))
+    return table
+
+
+def process_usage(pid):
+    """(memory bytes, cpu ticks) of one process; memory is PSS when the kernel offers it"""
+    stat = _read(f"/proc/{pid}/stat")
+    if stat is None:
+        return None
+    fields = stat[stat.rfind(")") + 2:].split()
+    ticks = int(fields[11]) + int(fields[12])  # utime + stime
+    # PSS splits pages shared between Chrome's processes instead of counting them N times
+    rollup = _read(f"/proc/{pid}/smaps_rollup")
+    if rollup is not None:
+        memory = _field(rollup, "Pss:") * 1024
+    else:
+        memory = int((_read(f"/proc/{pid}/statm") or "0 0").split()[1]) * PAGE_SIZE
+    return memory, ticks
+
+
+class BrowserSession:
+    """A registered driver and the process tree found for it"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.label = f"{getattr(driver, 'backend', 'browser')}:{(driver.session_id or '')[:8]}"
+        chrome = (getattr(driver, "capabilities", None) or {}).get("chrome", {})
+        self.user_data_dir = chrome.get("userDataDir")
+        self.root = None  # the browser process started with --user-data-dir
+        self.memory = 0
+        self.cpu = 0.0
+        self.processes = 0
+
+
+class ResourceGovernor:
+    """Watches the pod's memory and each browser's process tree on a background thread"""
+
+    def __init__(self, watermark=WATERMARK, browser_cap_mb=BROWSER_CAP_MB,
+                 interval=SAMPLE_INTERVAL, admission_timeout=ADMISSION_TIMEOUT, history=86400):
+        self.watermark = watermark
+        self.browser_cap = browser_cap_mb * MB
+        self.interval = interval
+        self.admission_timeout = admission_timeout
+        self.enabled = os.path.isdir("/proc/self")
+        self.sessions = {}  # id(driver) -> BrowserSession
+        self.timeline = collections.deque(maxlen=history)
+        self.admissions = []  # seconds each new session waited
+        self.reserved = 0  # admitted browsers not registered yet, each held at the per-browser cap
+        self.recycled = []  # (label, MB) of browsers retired over their cap
+        self.started = time.monotonic()
+        self._ticks = {}  # pid -> cpu ticks at the previous sample
+        self._last_sample = None
+        self._pod = (0, None)
+        self._lock = threading.Condition()
+        self._thread = None
+
+    def clear(self):
+        with self._lock:
+            self.timeline.clear()
+            self.admissions = []
+            self.recycled = []
+            self.started = time.monotonic()
+
+    # Registration
+
+    def register(self, driver):
+        """Track `driver`'s browser until it quits; takes over its admission's reservation"""
+        if not self.enabled:
+            return driver
+        session = BrowserSession(driver)
+        with self._lock:
+            self.sessions[id(driver)] = session
+            self.reserved = max(0, self.reserved - 1)
+        quit = driver.quit
+
+        def governed_quit():
+            try:
+                quit()
+            finally:
+                with self._lock:
+                    self.sessions.pop(id(driver), None)
+                    self._lock.notify_all()  # memory is about to free up
+
+        driver.quit = governed_quit
+        self._ensure_sampler()
+        return driver
+
+    def _ensure_sampler(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="resource-governor", daemon=True)
+                self._thread.start()
+
+    # Sampling
+
+    def _run(self):
+        while True:
+            try:
+                self.sample()
+            except Exception as e:  # never let sampling take a run down
+                print(f"⚠️  Resource sampling failed: {e}")
+            time.sleep(self.interval)
+
+    def sample(self):
+        """Measure the pod and every registered browser once; returns the timeline entry"""
+        now = time.monotonic()
+        with self._lock:
+            sessions = list(self.sessions.values())
+        table = process_table() if sessions else {}
+        children = collections.defaultdict(list)
+        for pid, (ppid, _, _) in table.items():
+            children[ppid].append(pid)
+        elapsed = now - self._last_sample if self._last_sample else None
+        ticks = {}
+        entry = {"t": round(now - self.started, 2), "sessions": {}}
+        for session in sessions:
+            if session.root not in table and session.user_data_dir:
+                flag = f"--user-data-dir={session.user_data_dir}"
+                session.root = next((pid for pid, (ppid, name, argv) in table.items()
+                                     if flag in argv and table.get(ppid, (0, ""))[1] != name), None)
+            if session.root not in table:
+                continue
+            # The browser, its renderers/GPU/utility children and its chromedriver
+            tree, stack = [], [session.root]
+            while stack:
+                pid = stack.pop()
+                tree.append(pid)
+                stack.extend(children.get(pid, ()))
+            parent = table[session.root][0]
+            if "chromedriver" in table.get(parent, (0, ""))[1]:
+                tree.append(parent)
+            memory, cpu_ticks = 0, 0
+            for pid in tree:
+                usage = process_usage(pid)
+                if usage is None:
+                    continue
+                memory += usage[0]
+                ticks[pid] = usage[1]
+                if pid in self._ticks:
+                    cpu_ticks += usage[1] - self._ticks[pid]
+            session.memory, session.processes = memory, len(tree)
+            session.cpu = cpu_ticks / CLOCK_TICKS / elapsed * 100 if elapsed else 0.0
+            entry["sessions"][session.label] = {
+                "memory_mb": round(memory / MB, 1), "cpu_pct": round(session.cpu, 1), "processes": len(tree)
+            }
+        self._ticks, self._last_sample = ticks, now
+        used, limit = self._pod = pod_memory()
+        entry["pod_mb"] = round(used / MB, 1)
+        entry["limit_mb"] = round(limit / MB, 1) if limit else None
+        with self._lock:
+            self.timeline.append(entry)
+            self._lock.notify_all()
+        return entry
+
+    # Decisions
+
+    def _projected_ok(self):
+        used, limit = self._pod
+        if not limit:
+            return True
+        with self._lock:
+            measured = [s.memory for s in self.sessions.values() if s.memory]
+            reserved = self.reserved * self.browser_cap
+        # A new browser will grow to about what the current ones use; browsers still
+        # launching don't show up in the pod's usage yet, so they count at the cap
+        expected = sum(measured) / len(measured) if measured else 0
+        return used + reserved + expected <= self.watermark * limit
+
+    def has_capacity(self):
+        """Whether one more browser fits under the memory watermark right now"""
+        if not self.enabled:
+            return True
+        self._pod = pod_memory()
+        return self._projected_ok()
+
+    def _reserve(self):
+        """Admit one browser if it fits, holding its memory until register() or release()"""
+        self._pod = pod_memory()
+        with self._lock:  # check and reserve together, so a burst of launches can't all pass
+            if not self._projected_ok():
+                return False
+            self.reserved += 1
+            return True
+
+    def release(self):
+        """Drop the reservation of an admitted browser that failed to start"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.reserved = max(0, self.reserved - 1)
+            self._lock.notify_all()
+
+    def admit(self):
+        """Block until a new browser fits under the watermark (or the admission timeout passes)
+
+        Every admission must be followed by register() of its driver or by release().
+        """
+        if not self.enabled or self._reserve():
+            return 0.0
+        started = time.monotonic()
+        used, limit = self._pod
+        print(f"🚧 Memory at {used / MB:.0f}/{limit / MB:.0f} MB; new browser queued below "
+              f"{self.watermark:.0%}")
+        while not self._reserve():
+            if time.monotonic() - started >= self.admission_timeout:
+                raise RuntimeError(f"Memory stayed above {self.watermark:.0%} of the pod limit "
+                                   f"for {self.admission_timeout:.0f}s; not starting another browser")
+            with self._lock:
+                self._lock.wait(self.interval)  # woken early by samples and quitting browsers
+        waited = time.monotonic() - started
+        with self._lock:
+            self.admissions.append(waited)
+        print(f"✅ Browser admitted after {waited:.1f}s")
+        return waited
+
+    def over_cap(self, driver):
+        """True (and counted) when `driver`'s browser has outgrown the per-browser cap"""
+        with self._lock:
+            session = self.sessions.get(id(driver))
+        if session is None or session.memory <= self.browser_cap:
+            return False
+        self.recycled.append((session.label, round(session.memory / MB)))
+        print(f"♻️  Recycling {session.label}: {session.memory / MB:.0f} MB over the "
+              f"{self.browser_cap / MB:.0f} MB cap")
+        return True
+
+    # Reporting
+
+    def report(self):
+        """Print pod and per-browser peaks, admission waits and recycles"""
+        with self._lock:
+            timeline = list(self.timeline)
+        if not timeline:
+            return
+        peak_pod = max(entry["pod_mb"] for entry in timeline)
+        limit = timeline[-1]["limit_mb"]
+        print("\n🧮 Browser resources")
+        print(f"   Pod working set peak: {peak_pod:.0f} MB" + (f" of {limit:.0f} MB" if limit else ""))
+        peaks = {}
+        for entry in timeline:
+            for label, usage in entry["sessions"].items():
+                peak = peaks.setdefault(label, {"memory_mb": 0, "cpu_pct": 0})
+                peak["memory_mb"] = max(peak["memory_mb"], usage["memory_mb"])
+                peak["cpu_pct"] = max(peak["cpu_pct"], usage["cpu_pct"])
+        for label, peak in peaks.items():
+            print(f"   {label:<24} peak {peak['memory_mb']:>7.0f} MB {peak['cpu_pct']:>6.0f}% CPU")
+        if self.admissions:
+            print(f"   🚧 {len(self.admissions)} sessions queued for memory, "
+                  f"{sum(self.admissions):.1f}s total wait")
+        if self.recycled:
+            print(f"   ♻️  {len(self.recycled)} browsers recycled over the {self.browser_cap / MB:.0f} MB cap")
+
+    def write_json(self, path=RESOURCES_PATH):
+        """Utilization timeline, written next to the other run results"""
+        with self._lock:
+            data = {
+                "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "interval_s": self.interval,
+                "watermark": self.watermark,
+                "browser_cap_mb": self.browser_cap / MB,
+                "admission_waits_s": list(self.admissions),
+                "recycled": [{"session": label, "memory_mb": mb} for label, mb in self.recycled],
+                "timeline": list(self.timeline),
+            }
+        if not data["timeline"]:
+            return None
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        print(f"\n📄 Resource timeline written: {path}")
+        return path
+
+
+governor = ResourceGovernor()
+
+report = governor.report
+write_json = governor.write_json
@@ -0,0 +1,196 @@
+"""
+SQLite-backed run history
+Persists every test outcome and orders the next run by recent failures and duration
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import unittest
+
+HISTORY_PATH = os.environ.get("SELENIUM_HISTORY_DB", "/home/coder/selenium-history.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    suite TEXT NOT NULL,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    suite TEXT NOT NULL,
+    test TEXT NOT NULL,
+    outcome TEXT NOT NULL,          -- pass, fail, error or skip
+    duration REAL NOT NULL,
+    backend TEXT,
+    error_signature TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (suite, test, recorded_at);
+"""
+
+
+def error_signature(error):
+    """Stable fingerprint of an error: type plus first line, with volatile numbers masked"""
+    if not error:
+        return None
+    text = error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+    first_line = text.strip().splitlines()[0] if text.strip() else ""
+    return re.sub(r"0x[0-9a-f]+|\d+", "N", first_line)[:200]
+
+
+class RunHistory:
+    """Test outcomes across runs, with flakiness and duration queries"""
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+        self.run_id = None
+
+    def start_run(self, suite):
+        with self._lock, self._db:
+            self.run_id = self._db.execute(
+                "INSERT INTO runs (suite, started_at) VALUES (?, ?)", (suite, time.time())
+            ).lastrowid
+        return self.run_id
+
+    def record(self, suite, test, outcome, duration, backend=None, error=None):
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.run_id, suite, test, outcome, duration, backend, error_signature(error), time.time())
+            )
+
+    def _recent(self, suite, test, window):
+        with self._lock:
+            return self._db.execute(
+                "SELECT outcome, duration FROM results WHERE suite = ? AND test = ? AND outcome != 'skip'"
+                " ORDER BY recorded_at DESC LIMIT ?", (suite, test, window)
+            ).fetchall()
+
+    def duration_trend(self, suite, test, limit=20):
+        """(recorded_at, duration) pairs, oldest first"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT recorded_at, duration FROM results WHERE suite = ? AND test = ?"
+                " ORDER BY recorded_at DESC LIMIT ?", (suite, test, limit)
+            ).fetchall()
+        return rows[::-1]
+
+    def flakiness(self, suite, test, window=20):
+        """Share of consecutive runs whose pass/fail state flipped (0 = stable, 1 = alternating)"""
+        passed = [outcome == "pass" for outcome, _ in self._recent(suite, test, window)]
+        if len(passed) < 2:
+            return 0.0
+        flips = sum(1 for a, b in zip(passed, passed[1:]) if a != b)
+        return flips / (len(passed) - 1)
+
+    def flaky_tests(self, suite, threshold=0.0, window=20):
+        """[(test, score)] above threshold, flakiest first"""
+        with self._lock:
+            tests = [row[0] for row in self._db.execute(
+                "SELECT DISTINCT test FROM results WHERE suite = ?", (suite,)
+            )]
+        scores = [(test, self.flakiness(suite, test, window)) for test in tests]
+        return sorted([s for s in scores if s[1] > threshold], key=lambda s: -s[1])
+
+    def order(self, suite, names, members=None, window=10):
+        """Recent failures first, then longest first; unknown tests keep their place at the front
+
+        `members` maps a name to the tests it stands for, for groups that must run together.
+        """
+        members = members or {}
+
+        def key(item):
+            position, name = item
+            failures, durations = 0, []
+            for test in members.get(name, [name]):
+                recent = self._recent(suite, test, window)
+                failures += sum(1 for outcome, _ in recent if outcome != "pass")
+                if recent:
+                    durations.append(sum(d for _, d in recent) / len(recent))
+            if not durations:
+                return (0, float("-inf"), position)  # never run: run early to learn its cost
+            return (-failures, -sum(durations), position)
+
+        return [name for _, name in sorted(enumerate(names), key=key)]
+
+    def report(self, suite):
+        """Print tests whose outcome has been flipping"""
+        flaky = self.flaky_tests(suite)
+        if not flaky:
+            return
+        print(f"\n🎲 Flaky tests in {suite} (pass/fail flip rate)")
+        for test, score in flaky:
+            print(f"   {test:<50} {score:.0%}")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def _backend(test):
+    return getattr(getattr(test, "driver", None), "backend", None)
+
+
+def _test_name(test):
+    """Method name of a test case; str() for class and module fixture errors (unittest's _ErrorHolder)"""
+    return getattr(test, "_testMethodName", None) or str(test)
+
+
+def _describe(err):
+    return f"{err[0].__name__}: {err[1]}" if err else None
+
+
+def record_result(history, suite, test, result, duration):
+    """Record a TestResult that holds exactly one test"""
+    if result.errors:
+        outcome, error = "error", result.errors[0][1].strip().splitlines()[-1]
+    elif result.failures:
+        outcome, error = "fail", result.failures[0][1].strip().splitlines()[-1]
+    elif result.skipped:
+        outcome, error = "skip", None
+    else:
+        outcome, error = "pass", None
+    history.record(suite, _test_name(test), outcome, duration, _backend(test), error)
+
+
+def history_result_class(history, suite):
+    """TextTestResult subclass that also writes every outcome to `history`"""
+
+    class HistoryTestResult(unittest.TextTestResult):
+        def startTest(self, test):
+            self._started = time.perf_counter()
+            super().startTest(test)
+
+        def stopTest(self, test):
+            super().stopTest(test)
+            self._started = None
+
+        def _store(self, test, outcome, err=None):
+            # Fixture errors (setUpClass, tearDownModule...) arrive outside startTest/stopTest
+            started = getattr(self, "_started", None)
+            duration = time.perf_counter() - started if started is not None else 0.0
+            history.record(suite, _test_name(test), outcome, duration, _backend(test), _describe(err))
+
+        def addSuccess(self, test):
+            super().addSuccess(test)
+            self._store(test, "pass")
+
+        def addFailure(self, test, err):
+            super().addFailure(test, err)
+            self._store(test, "fail", err)
+
+        def addError(self, test, err):
+            super().addError(test, err)
+            self._store(test, "error", err)
+
+        def addSkip(self, test, reason):
+            super().addSkip(test, reason)
+            self._store(test, "skip")
+
+    return HistoryTestResult
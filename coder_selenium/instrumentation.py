@@ -0,0 +1,123 @@
+"""
+Per-command WebDriver latency instrumentation
+Every command a driver sends goes through driver.execute, so that is where we time it
+"""
+
+import json
+import math
+import os
+import threading
+import time
+
+from coder_selenium.context import current_test
+
+TIMINGS_PATH = "/home/coder/test_timings.json"
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    # Multiply before dividing so pct * n / 100 stays exact for whole-number ranks
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct * len(ordered) / 100) - 1))
+    return ordered[rank]
+
+
+def summarize(durations):
+    return {
+        "count": len(durations),
+        "p50_ms": percentile(durations, 50) * 1000,
+        "p95_ms": percentile(durations, 95) * 1000,
+        "max_ms": max(durations) * 1000,
+        "total_ms": sum(durations) * 1000,
+    }
+
+
+class CommandTimings:
+    """Records name, duration and backend of every WebDriver command"""
+
+    def __init__(self):
+        self.samples = []  # (test, command, backend, seconds)
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self.samples = []
+
+    def record(self, command, seconds, backend):
+        with self._lock:
+            self.samples.append((current_test(), command, backend, seconds))
+
+    def instrument(self, driver):
+        """Time every command and the session quit of `driver`"""
+        backend = getattr(driver, "backend", "unknown")
+        execute = driver.execute
+        quit = driver.quit
+
+        def timed_execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record(driver_command, time.perf_counter() - started, backend)
+
+        def timed_quit():
+            started = time.perf_counter()
+            try:
+                quit()
+            finally:
+                self.record("session.quit", time.perf_counter() - started, backend)
+
+        # WebElement commands also go through their parent's execute
+        driver.execute = timed_execute
+        driver.quit = timed_quit
+        return driver
+
+    def _grouped(self, key):
+        groups = {}
+        with self._lock:
+            for sample in self.samples:
+                groups.setdefault(key(sample), []).append(sample[3])
+        return groups
+
+    def by_command(self):
+        groups = self._grouped(lambda s: f"{s[1]} [{s[2]}]")
+        return {name: summarize(durations) for name, durations in sorted(groups.items())}
+
+    def by_test(self):
+        groups = self._grouped(lambda s: s[0])
+        return {name: summarize(durations) for name, durations in groups.items()}
+
+    def report(self):
+        """Print p50/p95/max per command type and per test"""
+        if not self.samples:
+            return
+        for title, table in (("command [backend]", self.by_command()), ("test", self.by_test())):
+            print(f"\n⏱️  WebDriver latency by {title}")
+            print(f"   {'':<44} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+            for name, stats in table.items():
+                print(f"   {name[-44:]:<44} {stats['count']:>6} {stats['p50_ms']:>8.1f} "
+                      f"{stats['p95_ms']:>8.1f} {stats['max_ms']:>8.1f}")
+
+    def write_json(self, path=TIMINGS_PATH):
+        """Machine-readable timings, written next to the HTML report"""
+        with self._lock:
+            samples = [
+                {"test": test, "command": command, "backend": backend, "ms": seconds * 1000}
+                for test, command, backend, seconds in self.samples
+            ]
+        data = {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "by_command": self.by_command(),
+            "by_test": self.by_test(),
+            "samples": samples,
+        }
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        print(f"\n📄 Timing data written: {path}")
+        return path
+
+
+timings = CommandTimings()
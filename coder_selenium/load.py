@@ -0,0 +1,203 @@
+"""
+Browser-level load generation
+Runs a journey as N concurrent virtual users and reports throughput, step latency and errors
+"""
+
+import json
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+from coder_selenium.context import begin_test
+from coder_selenium.history import error_signature
+from coder_selenium.instrumentation import percentile
+
+LOAD_RESULTS_PATH = "/home/coder/load_results.json"
+
+
+class LoadStats:
+    """Thread-safe step latencies and journey outcomes"""
+
+    def __init__(self, steps=()):
+        self.steps = {step: [] for step in steps}
+        self.passed = 0
+        self.failed = 0
+        self.errors = Counter()          # (step, error signature) -> count
+        self.finished = deque()          # completion times, for the rolling rate
+        self.started = time.monotonic()
+        self.ended = None
+        self._lock = threading.Lock()
+
+    def record_step(self, step, seconds):
+        with self._lock:
+            self.steps.setdefault(step, []).append(seconds)
+
+    def record_journey(self, passed, step=None, error=None):
+        with self._lock:
+            self.finished.append(time.monotonic())
+            if passed:
+                self.passed += 1
+            else:
+                self.failed += 1
+                self.errors[(step or "setup", error_signature(error) or "unknown")] += 1
+
+    def rate(self, window=60):
+        """Journeys per minute over the last `window` seconds (or since start)"""
+        now = time.monotonic()
+        with self._lock:
+            while self.finished and self.finished[0] < now - window:
+                self.finished.popleft()
+            count = len(self.finished)
+        span = min(window, now - self.started)
+        return count * 60 / span if span > 0 else 0.0
+
+    def summary(self):
+        with self._lock:
+            total = self.passed + self.failed
+            elapsed = (self.ended or time.monotonic()) - self.started
+            return {
+                "elapsed_s": elapsed,
+                "journeys": total,
+                "passed": self.passed,
+                "failed": self.failed,
+                "error_rate": self.failed / total if total else 0.0,
+                "journeys_per_minute": self.passed * 60 / elapsed if elapsed else 0.0,
+                "steps": {
+                    step: {
+                        "count": len(samples),
+                        "p50_ms": percentile(samples, 50) * 1000,
+                        "p90_ms": percentile(samples, 90) * 1000,
+                        "p99_ms": percentile(samples, 99) * 1000,
+                        "max_ms": max(samples, default=0) * 1000,
+                    }
+                    for step, samples in self.steps.items()
+                },
+                "errors": [
+                    {"step": step, "error": error, "count": count}
+                    for (step, error), count in self.errors.most_common()
+                ],
+            }
+
+
+class Iteration:
+    """One pass of a journey; remembers which step failed"""
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.current = None
+
+    @contextmanager
+    def step(self, name):
+        self.current = name
+        begin_test(f"load: {name}")
+        started = time.perf_counter()
+        yield
+        self.stats.record_step(name, time.perf_counter() - started)
+
+
+class LoadTest:
+    """Run `journey(driver, step)` as concurrent virtual users leasing browsers from `pool`
+
+    `step(name)` is a context manager timing one step; only successful steps are timed.
+    Users start evenly spread over `ramp_up` seconds and loop until `duration` has passed.
+    """
+
+    def __init__(self, pool, journey, users=5, ramp_up=30, duration=120, interval=10,
+                 think_time=0, steps=()):
+        self.pool = pool
+        self.journey = journey
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.interval = interval
+        self.think_time = think_time
+        self.stats = LoadStats(steps)
+        self.active = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _user(self, number, start_at, end_at):
+        if self._stop.wait(max(0, start_at - time.monotonic())):
+            return
+        with self._lock:
+            self.active += 1
+        try:
+            while time.monotonic() < end_at and not self._stop.is_set():
+                iteration = Iteration(self.stats)
+                try:
+                    with self.pool.session() as driver:
+                        self.journey(driver, iteration.step)
+                except Exception as e:
+                    self.stats.record_journey(False, iteration.current, e)
+                else:
+                    self.stats.record_journey(True)
+                if self.think_time:
+                    self._stop.wait(self.think_time)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def live_line(self):
+        s = self.stats.summary()
+        steps = "  ".join(
+            f"{step} {v['p50_ms']:.0f}/{v['p90_ms']:.0f}ms" for step, v in s["steps"].items() if v["count"]
+        )
+        return (f"⏱️  {s['elapsed_s']:5.0f}s  users {self.active}/{self.users}  "
+                f"journeys {s['journeys']} ({self.stats.rate():.1f}/min)  "
+                f"errors {s['error_rate']:.1%}  {steps}")
+
+    def run(self):
+        """Run the load test; return the summary"""
+        self.stats.started = started = time.monotonic()
+        end_at = started + self.duration
+        spacing = self.ramp_up / self.users if self.users else 0
+        threads = [
+            threading.Thread(target=self._user, args=(n, started + n * spacing, end_at),
+                             name=f"vu-{n}", daemon=True)
+            for n in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+
+        print(f"🚦 {self.users} virtual users, ramp-up {self.ramp_up}s, duration {self.duration}s")
+        print("   (step latency shown as p50/p90)")
+        next_line = started + self.interval
+        try:
+            while any(thread.is_alive() for thread in threads):
+                if time.monotonic() >= next_line:
+                    print(self.live_line(), flush=True)
+                    next_line += self.interval
+                time.sleep(min(0.5, max(0.01, next_line - time.monotonic())))
+        except KeyboardInterrupt:
+            print("\n⏹️  Stopping virtual users after their current journey...")
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+        self.stats.ended = time.monotonic()
+        return self.stats.summary()
+
+    def report(self):
+        s = self.stats.summary()
+        print("\n" + "=" * 60)
+        print("🚦 LOAD TEST SUMMARY")
+        print("=" * 60)
+        print(f"Users: {self.users}  Duration: {s['elapsed_s']:.0f}s")
+        print(f"Journeys: {s['journeys']} ({s['passed']} passed, {s['failed']} failed)")
+        print(f"Throughput: {s['journeys_per_minute']:.1f} journeys/min")
+        print(f"Error rate: {s['error_rate']:.1%}")
+        print(f"\n{'Step':<24}{'count':>7}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+        for step, v in s["steps"].items():
+            print(f"{step:<24}{v['count']:>7}{v['p50_ms']:>9.0f}{v['p90_ms']:>9.0f}"
+                  f"{v['p99_ms']:>9.0f}{v['max_ms']:>9.0f}")
+        if s["errors"]:
+            print("\nErrors:")
+            for error in s["errors"]:
+                print(f"   {error['count']:>4} × {error['step']}: {error['error']}")
+
+    def write_json(self, path=LOAD_RESULTS_PATH):
+        summary = self.stats.summary()
+        summary.update(users=self.users, ramp_up_s=self.ramp_up, duration_s=self.duration)
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
+        return path
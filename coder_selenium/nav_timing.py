@@ -0,0 +1,160 @@
+"""
+Navigation timing collector
+Reads Navigation Timing Level 2, Resource Timing and LCP/CLS after every driver.get
+"""
+
+import json
+import os
+import threading
+from urllib.parse import urlsplit
+
+from coder_selenium.cdp import try_cdp
+from coder_selenium.context import current_test
+
+# Buffered observers pick up LCP and layout shifts that happened before they were created
+OBSERVER_JS = """
+(function () {
+  if (window.__coderVitals || !window.PerformanceObserver) return;
+  const vitals = window.__coderVitals = {lcp: null, cls: 0};
+  try {
+    new PerformanceObserver(function (list) {
+      const entries = list.getEntries();
+      vitals.lcp = entries[entries.length - 1].startTime;
+    }).observe({type: 'largest-contentful-paint', buffered: true});
+    new PerformanceObserver(function (list) {
+      list.getEntries().forEach(function (entry) {
+        if (!entry.hadRecentInput) vitals.cls += entry.value;
+      });
+    }).observe({type: 'layout-shift', buffered: true});
+  } catch (e) {}
+})();
+"""
+
+COLLECT_JS = OBSERVER_JS + """
+const done = arguments[arguments.length - 1];
+setTimeout(function () {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const resources = {};
+  let resourceTransfer = 0;
+  performance.getEntriesByType('resource').forEach(function (entry) {
+    const group = resources[entry.initiatorType] = resources[entry.initiatorType] || {count: 0, transfer_bytes: 0};
+    group.count += 1;
+    group.transfer_bytes += entry.transferSize || 0;
+    resourceTransfer += entry.transferSize || 0;
+  });
+  const vitals = window.__coderVitals || {};
+  done({
+    url: location.href,
+    ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+    dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+    load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+    document_transfer_bytes: nav ? nav.transferSize : null,
+    resource_transfer_bytes: resourceTransfer,
+    resources: resources,
+    lcp_ms: vitals.lcp,
+    cls: vitals.cls
+  });
+}, 0);
+"""
+
+# Per-page regression thresholds: "" is the default, URL keys match as prefixes (longest
+# wins) and "/path" keys match exactly that path on any host, overriding both
+DEFAULT_BUDGETS = {
+    "": {"ttfb_ms": 3000, "load_ms": 15000, "lcp_ms": 8000, "cls": 0.25},
+    "https://www.google.com": {"ttfb_ms": 1500, "load_ms": 6000},
+    "https://example.com": {"ttfb_ms": 1500, "load_ms": 3000, "cls": 0.1},
+    "http://127.0.0.1": {"ttfb_ms": 200, "load_ms": 1000, "cls": 0.1},
+}
+
+
+def _prefix_matches(url, prefix):
+    """`prefix` covers `url` up to a boundary, so https://example.com skips https://example.community"""
+    if not url.startswith(prefix):
+        return False
+    return len(url) == len(prefix) or prefix[-1] in "/?#" or url[len(prefix)] in "/?#:"
+
+
+def load_budgets(path=None):
+    """Default budgets, overridden by a JSON file from NAV_BUDGETS if set"""
+    budgets = dict(DEFAULT_BUDGETS)
+    path = path or os.environ.get("NAV_BUDGETS")
+    if path:
+        with open(path) as f:
+            budgets.update(json.load(f))
+    return budgets
+
+
+class NavigationCollector:
+    """Collects timing for every page a driver loads and checks budgets"""
+
+    def __init__(self, budgets=None):
+        self.budgets = budgets if budgets is not None else load_budgets()
+        self.pages = []
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self.pages = []
+
+    def budget_for(self, url):
+        """Default budget overlaid with the longest matching URL prefix, then the exact path's budget"""
+        prefix = max((key for key in self.budgets
+                      if key and not key.startswith("/") and _prefix_matches(url, key)), key=len, default="")
+        path = urlsplit(url).path or "/"
+        return {**self.budgets.get("", {}), **self.budgets.get(prefix, {}), **self.budgets.get(path, {})}
+
+    def attach(self, driver):
+        """Install the observers and collect after every driver.get"""
+        try_cdp(driver, "Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_JS})
+        get = driver.get
+
+        def get_and_collect(url):
+            get(url)
+            if url.startswith(("http://", "https://")):
+                self.collect(driver)
+
+        driver.get = get_and_collect
+        return driver
+
+    def collect(self, driver):
+        """Read timing for the current page and record any budget violations"""
+        try:
+            page = driver.execute_async_script(COLLECT_JS)
+        except Exception as e:
+            print(f"⚠️  Navigation timing unavailable: {e}")
+            return None
+        
+        page["test"] = current_test()
+        page["violations"] = [
+            f"{metric} {page[metric]:.2f} > {limit}"
+            for metric, limit in self.budget_for(page["url"]).items()
+            if page.get(metric) is not None and page[metric] > limit
+        ]
+        with self._lock:
+            self.pages.append(page)
+        return page
+
+    def last(self):
+        with self._lock:
+            return self.pages[-1] if self.pages else None
+
+    def violations(self, test=None):
+        """(url, violation) pairs, optionally only for one test"""
+        with self._lock:
+            return [
+                (page["url"], violation)
+                for page in self.pages
+                if test is None or page["test"] == test
+                for violation in page["violations"]
+            ]
+
+    def write_json(self, path):
+        with self._lock:
+            pages = list(self.pages)
+        with open(path, "w") as f:
+            json.dump({"budgets": self.budgets, "pages": pages}, f, indent=2)
+        print(f"📄 Navigation timing written: {path}")
+        return path
+
+
+navigation = NavigationCollector()
@@ -0,0 +1,187 @@
+"""
+Network policies applied through the Chrome DevTools Protocol
+Blocks heavy third-party assets for functional runs and reports what was avoided
+"""
+
+import json
+import os
+import threading
+
+from coder_selenium.cdp import try_cdp
+from coder_selenium.context import current_test
+
+SIZES_PATH = os.environ.get("SELENIUM_RESOURCE_SIZES", "/home/coder/.selenium-resource-sizes.json")
+
+# setBlockedURLs only matches URL patterns, so resource types map to extensions
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.avif*"],
+    "font": ["*.woff*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.mp3*", "*.ogg*", "*.m3u8*"],
+    "stylesheet": ["*.css*"],
+}
+
+TRACKERS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*adservice.google.*", "*facebook.net*",
+    "*hotjar.com*", "*segment.io*", "*cdn.segment.com*", "*clarity.ms*",
+    "*hubspot.com*", "*hs-analytics.net*", "*intercom.io*", "*sentry.io*",
+]
+
+RESOURCE_SIZES_JS = """
+return performance.getEntriesByType('resource')
+  .filter(function (e) { return e.transferSize > 0; })
+  .map(function (e) { return [e.name, e.transferSize]; });
+"""
+
+
+class NetworkPolicy:
+    """Allow/deny URL patterns plus per-resource-type blocking for a session"""
+
+    def __init__(self, name, block=(), allow=(), block_types=()):
+        self.name = name
+        self.block = list(block)
+        self.allow = list(allow)
+        self.block_types = list(block_types)
+        self.pages = []
+        self._lock = threading.Lock()
+        try:
+            with open(SIZES_PATH) as f:
+                self._sizes = json.load(f)
+        except (OSError, ValueError):
+            self._sizes = {}  # url -> bytes, learned from unblocked runs
+
+    def with_rules(self, block=(), allow=()):
+        """Copy of this policy with extra suite-specific patterns"""
+        return NetworkPolicy(self.name, self.block + list(block), self.allow + list(allow), self.block_types)
+
+    @property
+    def deny_patterns(self):
+        patterns = list(self.block)
+        for resource_type in self.block_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+        return patterns
+
+    @property
+    def blocks_anything(self):
+        return bool(self.deny_patterns)
+
+    def configure(self, options):
+        """Enable the performance log so blocked requests can be counted"""
+        if self.blocks_anything:
+            prefs = dict(options.capabilities.get("goog:loggingPrefs") or {})
+            prefs["performance"] = "ALL"
+            options.set_capability("goog:loggingPrefs", prefs)
+        return options
+
+    def apply(self, driver):
+        """Install the policy on the session's current tab"""
+        try_cdp(driver, "Network.enable")
+        patterns = self.deny_patterns
+        
+        # Newer Chrome takes ordered allow/deny rules; older Chrome only a deny list
+        rules = [{"urlPattern": p, "block": False} for p in self.allow] + \
+                [{"urlPattern": p, "block": True} for p in patterns]
+        if try_cdp(driver, "Network.setBlockedURLs", {"urlPatterns": rules}) is not None:
+            return True
+        if self.allow and patterns:
+            print(f"⚠️  Chrome ignores allow rules for network policy '{self.name}'")
+        return try_cdp(driver, "Network.setBlockedURLs", {"urls": patterns}) is not None
+
+    def attach(self, driver):
+        """Apply at session start and account for every driver.get"""
+        if not self.apply(driver):
+            print(f"⚠️  Network policy '{self.name}' needs CDP; loading everything")
+            return driver
+        get = driver.get
+
+        def get_and_account(url):
+            get(url)
+            if url.startswith(("http://", "https://")):
+                self.account(driver, url)
+
+        driver.get = get_and_account
+        return driver
+
+    def _blocked_requests(self, driver):
+        """URLs Chrome refused to load since the last call, from the performance log"""
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return []
+        urls, blocked = {}, []
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message["method"] == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif message["method"] == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked.append(urls.get(params["requestId"], "(unknown)"))
+        return blocked
+
+    def account(self, driver, url):
+        """Record what the policy avoided on this page, or learn asset sizes"""
+        if not self.blocks_anything:
+            try:
+                sizes = driver.execute_script(RESOURCE_SIZES_JS)
+            except Exception:
+                return
+            with self._lock:
+                self._sizes.update(dict(sizes))
+            return
+        
+        blocked = self._blocked_requests(driver)
+        known = [self._sizes[u] for u in blocked if u in self._sizes]
+        with self._lock:
+            self.pages.append({
+                "test": current_test(),
+                "url": url,
+                "blocked_requests": len(blocked),
+                "bytes_avoided": sum(known),
+                "unknown_sizes": len(blocked) - len(known),
+            })
+
+    def save_sizes(self):
+        """Persist asset sizes learned from unblocked runs"""
+        with self._lock:
+            sizes = dict(self._sizes)
+        if not sizes:
+            return
+        tmp_path = f"{SIZES_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(sizes, f)
+        os.replace(tmp_path, SIZES_PATH)
+
+    def report(self):
+        """Print requests and bytes avoided per page"""
+        self.save_sizes()
+        if not self.pages:
+            return
+        print(f"\n🚫 Network policy '{self.name}'")
+        for page in self.pages:
+            unknown = f" (+{page['unknown_sizes']} of unknown size)" if page["unknown_sizes"] else ""
+            print(f"   {page['url'][:50]:<50} {page['blocked_requests']:>4} requests, "
+                  f"{page['bytes_avoided'] / 1024:>8.1f} KiB avoided{unknown}")
+
+
+PROFILES = {
+    # Everything loads; used for performance measurements and to learn asset sizes
+    "full": NetworkPolicy("full"),
+    # Functional runs: no trackers, images, fonts or media
+    "lean": NetworkPolicy("lean", block=TRACKERS, block_types=("image", "font", "media")),
+}
+
+
+def _patterns(variable):
+    return [p.strip() for p in os.environ.get(variable, "").split(",") if p.strip()]
+
+
+def policy_from_env(default="full", block=(), allow=()):
+    """The profile named by SELENIUM_NETWORK_PROFILE plus suite and env patterns
+
+    SELENIUM_NETWORK_BLOCK / SELENIUM_NETWORK_ALLOW take comma-separated patterns.
+    """
+    profile = PROFILES[os.environ.get("SELENIUM_NETWORK_PROFILE", default)]
+    return profile.with_rules(
+        block=list(block) + _patterns("SELENIUM_NETWORK_BLOCK"),
+        allow=list(allow) + _patterns("SELENIUM_NETWORK_ALLOW"),
+    )
@@ -0,0 +1,126 @@
+"""
+Parallel unittest runner
+Spreads test methods over a thread pool and merges the outcomes
+"""
+
+import sys
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def iter_tests(suite):
+    """Flatten a (possibly nested) TestSuite into test cases"""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
+
+
+def _run_one(test):
+    """Run a single test case into its own result object"""
+    result = unittest.TestResult()
+    started = time.perf_counter()
+    test.run(result)
+    return result, time.perf_counter() - started
+
+
+def _outcome(result):
+    """Short verdict for a single-test result"""
+    if result.errors:
+        return "ERROR"
+    if result.failures:
+        return "FAIL"
+    if result.skipped:
+        return "skipped"
+    if result.unexpectedSuccesses:
+        return "unexpected success"
+    if result.expectedFailures:
+        return "expected failure"
+    return "ok"
+
+
+def _run_fixture(cls, name, on_result):
+    """Run a class fixture; a failure comes back as a one-error result, like unittest's suite reports it"""
+    result = unittest.TestResult()
+    try:
+        getattr(cls, name)()
+    except Exception as e:
+        holder = unittest.suite._ErrorHolder(f"{name} ({unittest.util.strclass(cls)})")
+        if isinstance(e, unittest.SkipTest):
+            result.addSkip(holder, str(e))
+        else:
+            result.addError(holder, sys.exc_info())
+        if on_result is not None:
+            on_result(holder, result, 0.0)
+        return result
+    return None
+
+
+def merge_results(results, merged):
+    """Fold per-test results into one unittest-compatible result"""
+    for result in results:
+        merged.testsRun += result.testsRun
+        merged.failures.extend(result.failures)
+        merged.errors.extend(result.errors)
+        merged.skipped.extend(result.skipped)
+        merged.expectedFailures.extend(result.expectedFailures)
+        merged.unexpectedSuccesses.extend(result.unexpectedSuccesses)
+    return merged
+
+
+def run_parallel(suite, workers, verbosity=2, stream=None, on_result=None):
+    """Run every test in suite on `workers` threads, one browser each
+
+    Tests are submitted in suite order; on_result(test, result, duration) is
+    called on the main thread as each one finishes.
+    """
+    stream = unittest.runner._WritelnDecorator(stream or sys.stderr)
+    tests = list(iter_tests(suite))
+    classes = []
+    for test in tests:
+        if type(test) not in classes:
+            classes.append(type(test))
+    
+    # Class fixtures run once here; workers only run setUp/test/tearDown
+    results = []
+    for cls in list(classes):
+        failed = _run_fixture(cls, "setUpClass", on_result)
+        if failed is not None:
+            # Like unittest: the class's tests don't run and its tearDownClass isn't called
+            results.append(failed)
+            classes.remove(cls)
+            tests = [test for test in tests if type(test) is not cls]
+            if verbosity > 1:
+                stream.writeln(f"setUpClass ({unittest.util.strclass(cls)}) ... {_outcome(failed)}")
+    
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_run_one, test): test for test in tests}
+            for future in as_completed(futures):
+                result, duration = future.result()
+                results.append(result)
+                if on_result is not None:
+                    on_result(futures[future], result, duration)
+                if verbosity > 1:
+                    stream.writeln(f"{futures[future]} ... {_outcome(result)} ({duration:.1f}s)")
+    finally:
+        for cls in classes:
+            failed = _run_fixture(cls, "tearDownClass", on_result)
+            if failed is not None:
+                results.append(failed)
+    elapsed = time.perf_counter() - started
+    
+    merged = merge_results(results, unittest.TextTestResult(stream, True, verbosity))
+    merged.printErrors()
+    stream.writeln(unittest.TextTestResult.separator2)
+    stream.writeln(f"Ran {merged.testsRun} tests in {elapsed:.3f}s on {workers} workers")
+    stream.writeln()
+    
+    if merged.wasSuccessful():
+        stream.writeln("OK")
+    else:
+        stream.writeln(f"FAILED (failures={len(merged.failures)}, errors={len(merged.errors)})")
+    return merged
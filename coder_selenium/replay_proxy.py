@@ -0,0 +1,296 @@
+"""
+Record/replay HTTP(S) proxy
+Record mode saves every response to a compact archive; replay mode serves them with no network
+"""
+
+import bisect
+import hashlib
+import http.client
+import json
+import mmap
+import os
+import shutil
+import ssl
+import struct
+import subprocess
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+ARCHIVE_DIR = os.environ.get("SELENIUM_ARCHIVE_DIR", "/home/coder/selenium-archive")
+MODES = ("passthrough", "record", "replay")
+
+# Headers that describe a single hop and must not be replayed
+HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "proxy-connection", "te", "trailers", "transfer-encoding", "upgrade", "content-length",
+}
+
+RECORD_HEADER = struct.Struct(">16sI")  # request key, compressed payload length
+INDEX_ENTRY = struct.Struct(">16sQI")   # request key, data offset, record length
+
+
+def request_key(method, url, body):
+    """16-byte key for method + URL + body hash"""
+    body_hash = hashlib.sha256(body or b"").hexdigest()
+    return hashlib.sha256(f"{method} {url} {body_hash}".encode()).digest()[:16]
+
+
+class Archive:
+    """Append-only response archive with a sorted, memory-mapped index"""
+
+    def __init__(self, path):
+        self.path = path
+        self.data_path = f"{path}.data"
+        self.index_path = f"{path}.index"
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._data = None
+        self._index = None
+
+    # Recording
+
+    def open_for_record(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._writer = open(self.data_path, "wb")
+        return self
+
+    def add(self, key, status, reason, headers, body):
+        meta = json.dumps({"status": status, "reason": reason, "headers": headers}).encode()
+        payload = zlib.compress(meta + b"\n" + body)
+        with self._lock:
+            offset = self._writer.tell()
+            self._writer.write(RECORD_HEADER.pack(key, len(payload)) + payload)
+            self._pending[key] = (offset, RECORD_HEADER.size + len(payload))
+
+    def close_record(self):
+        with self._lock:
+            self._writer.close()
+            self._write_index(self._pending)
+
+    def _write_index(self, entries):
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            for key in sorted(entries):
+                f.write(INDEX_ENTRY.pack(key, *entries[key]))
+        os.replace(tmp_path, self.index_path)
+
+    def rebuild_index(self):
+        """Recreate the index by scanning the data file (e.g. after a crash)"""
+        entries = {}
+        with open(self.data_path, "rb") as f:
+            while True:
+                offset = f.tell()
+                header = f.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    break
+                key, length = RECORD_HEADER.unpack(header)
+                if len(f.read(length)) < length:
+                    break  # truncated last record
+                entries[key] = (offset, RECORD_HEADER.size + length)
+        self._write_index(entries)
+
+    # Replay
+
+    def open_for_replay(self):
+        if not os.path.exists(self.index_path) or \
+                os.path.getmtime(self.index_path) < os.path.getmtime(self.data_path):
+            self.rebuild_index()
+        with open(self.data_path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(self.data_path) else b""
+        with open(self.index_path, "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(self.index_path) else b""
+        self._count = len(self._index) // INDEX_ENTRY.size
+        return self
+
+    def _key_at(self, i):
+        start = i * INDEX_ENTRY.size
+        return self._index[start:start + 16]
+
+    def lookup(self, key):
+        """Binary-search the mapped index; returns (status, reason, headers, body) or None"""
+        keys = _IndexKeys(self)
+        i = bisect.bisect_left(keys, key)
+        if i == self._count or self._key_at(i) != key:
+            return None
+        _, offset, length = INDEX_ENTRY.unpack_from(self._index, i * INDEX_ENTRY.size)
+        payload = zlib.decompress(self._data[offset + RECORD_HEADER.size:offset + length])
+        meta, body = payload.split(b"\n", 1)
+        meta = json.loads(meta)
+        return meta["status"], meta["reason"], meta["headers"], body
+
+    def close_replay(self):
+        for mapped in (self._data, self._index):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+
+class _IndexKeys:
+    """Sequence view over the index keys so bisect can search the mmap directly"""
+
+    def __init__(self, archive):
+        self.archive = archive
+
+    def __len__(self):
+        return self.archive._count
+
+    def __getitem__(self, i):
+        return self.archive._key_at(i)
+
+
+def ensure_certificate(directory):
+    """Self-signed certificate for intercepting HTTPS (Chrome runs with --ignore-certificate-errors)"""
+    cert_path = os.path.join(directory, "proxy-cert.pem")
+    key_path = os.path.join(directory, "proxy-key.pem")
+    if not os.path.exists(cert_path):
+        if shutil.which("openssl") is None:
+            raise RuntimeError("openssl is required to record or replay HTTPS traffic")
+        os.makedirs(directory, exist_ok=True)
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "3650",
+             "-subj", "/CN=coder-selenium-proxy", "-keyout", key_path, "-out", cert_path],
+            check=True, capture_output=True
+        )
+    return cert_path, key_path
+
+
+class ProxyHandler(BaseHTTPRequestHandler):
+    """Forwards-and-records or replays each request, including inside CONNECT tunnels"""
+
+    protocol_version = "HTTP/1.1"
+    tunnel_host = None
+
+    def log_message(self, format, *args):
+        pass  # keep test output clean
+
+    def do_CONNECT(self):
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        self.tunnel_host = self.path
+        # Keep serving requests, now decrypted, on the same connection
+        try:
+            self.connection = self.server.tls_context.wrap_socket(self.connection, server_side=True)
+        except (ssl.SSLError, OSError):
+            self.close_connection = True
+            return
+        self.rfile = self.connection.makefile("rb", self.rbufsize)
+        self.wfile = self.connection.makefile("wb", 0)
+        self.close_connection = False
+
+    def _target(self):
+        if self.tunnel_host:
+            host = self.tunnel_host[:-4] if self.tunnel_host.endswith(":443") else self.tunnel_host
+            return f"https://{host}{self.path}"
+        return self.path
+
+    def _handle(self):
+        url = self._target()
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        key = request_key(self.command, url, body)
+        
+        if self.server.mode == "replay":
+            response = self.server.archive.lookup(key)
+            if response is None:
+                self.server.misses.append(f"{self.command} {url}")
+                response = (404, "Not In Archive", [["Content-Type", "text/plain"]], b"not recorded")
+        else:
+            try:
+                response = self._forward(url, body)
+                self.server.archive.add(key, *response)
+            except (OSError, http.client.HTTPException) as e:
+                # Upstream failures are not recorded, so a later recording can fill the gap
+                response = (502, "Bad Gateway", [["Content-Type", "text/plain"]], str(e).encode())
+        
+        status, reason, headers, payload = response
+        self.send_response(status, reason)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    def _forward(self, url, body):
+        parts = urlsplit(url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        connection = connection_class(parts.netloc, timeout=30)
+        headers = {k: v for k, v in self.headers.items() if k.lower() not in HOP_HEADERS}
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        try:
+            connection.request(self.command, path, body=body or None, headers=headers)
+            upstream = connection.getresponse()
+            payload = upstream.read()
+        finally:
+            connection.close()
+        kept = [[k, v] for k, v in upstream.getheaders() if k.lower() not in HOP_HEADERS]
+        return upstream.status, upstream.reason, kept, payload
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _handle
+
+
+class ReplayProxy:
+    """Local proxy Chrome can be routed through in record or replay mode"""
+
+    def __init__(self, mode, name, archive_dir=ARCHIVE_DIR):
+        if mode not in MODES:
+            raise ValueError(f"Unknown network mode '{mode}', expected one of {', '.join(MODES)}")
+        self.mode = mode
+        self.archive_dir = archive_dir
+        self.archive = Archive(os.path.join(archive_dir, name))
+        self.httpd = None
+
+    @property
+    def active(self):
+        return self.mode != "passthrough"
+
+    def start(self):
+        if not self.active:
+            return self
+        if self.mode == "replay":
+            if not os.path.exists(self.archive.data_path):
+                raise RuntimeError(f"No recording at {self.archive.data_path}; run once with record mode")
+            self.archive.open_for_replay()
+        else:
+            self.archive.open_for_record()
+        
+        cert_path, key_path = ensure_certificate(self.archive_dir)
+        tls_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        tls_context.load_cert_chain(cert_path, key_path)
+        
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), ProxyHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.mode = self.mode
+        self.httpd.archive = self.archive
+        self.httpd.tls_context = tls_context
+        self.httpd.misses = []
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        print(f"🎞️  {self.mode.capitalize()} proxy on 127.0.0.1:{self.port} ({self.archive.path})")
+        return self
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    def configure(self, options):
+        """Route a Chrome session through the proxy"""
+        if self.active:
+            options.add_argument(f"--proxy-server=http://127.0.0.1:{self.port}")
+            options.add_argument("--ignore-certificate-errors")
+        return options
+
+    def stop(self):
+        if self.httpd is None:
+            return
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.mode == "record":
+            self.archive.close_record()
+        else:
+            self.archive.close_replay()
+            if self.httpd.misses:
+                print(f"⚠️  {len(self.httpd.misses)} requests were not in the archive, e.g. {self.httpd.misses[0]}")
+        self.httpd = None
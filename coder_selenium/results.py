@@ -0,0 +1,284 @@
+"""
+Streaming results sink
+Appends every outcome to JSONL and JUnit XML as it happens and renders paginated HTML from the stream
+"""
+
+import html
+import json
+import os
+import socket
+import threading
+import time
+import traceback
+import unittest
+from datetime import datetime
+from xml.sax.saxutils import escape, quoteattr
+
+JUNIT_FOOTER = "</testsuite>\n</testsuites>\n"
+
+
+def _identify(test):
+    """(name, classname) of a test case; fixture errors (unittest's _ErrorHolder) go under the suite"""
+    if isinstance(test, unittest.TestCase):
+        return test._testMethodName, type(test).__name__
+    return str(test), None
+
+
+class ResultSink:
+    """Crash-survivable result stream: JSONL for tooling and live tailing, JUnit XML for CI
+
+    Every record is flushed and fsync'd (at most every `sync_interval` seconds), so a
+    killed run keeps everything it reported. A JUnit file from a run that died is missing
+    only its closing tags; repair_junit() adds them.
+    """
+
+    def __init__(self, jsonl_path, junit_path, suite, sync_interval=0.0):
+        self.jsonl_path = jsonl_path
+        self.junit_path = junit_path
+        self.suite = suite
+        self.sync_interval = sync_interval
+        self.counts = {"pass": 0, "fail": 0, "error": 0, "skip": 0}
+        self._lock = threading.Lock()
+        self._last_sync = 0.0
+        self._jsonl = open(jsonl_path, "w", encoding="utf-8")
+        self._junit = open(junit_path, "w", encoding="utf-8")
+        started = datetime.now().isoformat(timespec="seconds")
+        self._write_jsonl({"type": "start", "suite": suite, "started": started})
+        self._junit.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n'
+                          f'<testsuite name={quoteattr(suite)} timestamp={quoteattr(started)} '
+                          f'hostname={quoteattr(socket.gethostname())}>\n')
+        self._sync(force=True)
+
+    def _write_jsonl(self, record):
+        self._jsonl.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _sync(self, force=False):
+        self._jsonl.flush()
+        self._junit.flush()
+        now = time.monotonic()
+        if force or now - self._last_sync >= self.sync_interval:
+            os.fsync(self._jsonl.fileno())
+            os.fsync(self._junit.fileno())
+            self._last_sync = now
+
+    def record(self, test, status, details="", duration=None, classname=None, backend=None, output=None):
+        """Append one outcome; status is pass, fail, error or skip"""
+        record = {
+            "type": "result",
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "test": test,
+            "status": status,
+            "details": details or "",
+            "duration_s": duration,
+            "backend": backend,
+        }
+        testcase = (f'  <testcase classname={quoteattr(classname or self.suite)} name={quoteattr(test)} '
+                    f'time="{duration or 0:.3f}"')
+        body = {
+            "fail": f'<failure message={quoteattr(details or "")}>{escape(output or details or "")}</failure>',
+            "error": f'<error message={quoteattr(details or "")}>{escape(output or details or "")}</error>',
+            "skip": f'<skipped message={quoteattr(details or "")}/>',
+            "pass": f"<system-out>{escape(details)}</system-out>" if details else "",
+        }[status]
+        with self._lock:
+            self.counts[status] += 1
+            self._write_jsonl(record)
+            self._junit.write(f"{testcase}>{body}</testcase>\n" if body else f"{testcase}/>\n")
+            self._sync()
+
+    def record_unittest(self, test, status, err=None, duration=None, backend=None, reason=None):
+        output = "".join(traceback.format_exception(*err)) if err else None
+        details = reason or (f"{err[0].__name__}: {err[1]}" if err else "")
+        name, classname = _identify(test)
+        self.record(name, status, details, duration, classname=classname, backend=backend, output=output)
+
+    def record_result(self, test, result, duration):
+        """Record a TestResult that holds exactly one test (parallel runner callback)"""
+        backend = getattr(getattr(test, "driver", None), "backend", None)
+        name, classname = _identify(test)
+        for status, entries in (("error", result.errors), ("fail", result.failures)):
+            if entries:
+                details = entries[0][1].strip().splitlines()[-1]
+                self.record(name, status, details, duration,
+                            classname=classname, backend=backend, output=entries[0][1])
+                return
+        if result.skipped:
+            self.record(name, "skip", result.skipped[0][1], duration, classname=classname, backend=backend)
+        else:
+            self.record(name, "pass", "", duration, classname=classname, backend=backend)
+
+    def result_class(self, base=unittest.TextTestResult):
+        """Subclass of `base` (a TestResult class) that also streams every outcome"""
+        sink = self
+
+        class SinkTestResult(base):
+            def startTest(self, test):
+                self._sink_started = time.perf_counter()
+                super().startTest(test)
+
+            def stopTest(self, test):
+                super().stopTest(test)
+                self._sink_started = None
+
+            def _sink(self, test, status, err=None, reason=None):
+                # Fixture errors (setUpClass, tearDownModule...) arrive outside startTest/stopTest
+                started = getattr(self, "_sink_started", None)
+                duration = time.perf_counter() - started if started is not None else 0.0
+                backend = getattr(getattr(test, "driver", None), "backend", None)
+                sink.record_unittest(test, status, err, duration, backend, reason)
+
+            def addSuccess(self, test):
+                super().addSuccess(test)
+                self._sink(test, "pass")
+
+            def addFailure(self, test, err):
+                super().addFailure(test, err)
+                self._sink(test, "fail", err)
+
+            def addError(self, test, err):
+                super().addError(test, err)
+                self._sink(test, "error", err)
+
+            def addSkip(self, test, reason):
+                super().addSkip(test, reason)
+                self._sink(test, "skip", reason=reason)
+
+        return SinkTestResult
+
+    def close(self):
+        with self._lock:
+            if self._jsonl.closed:
+                return
+            self._write_jsonl({"type": "end", "finished": datetime.now().isoformat(timespec="seconds"),
+                               "counts": self.counts})
+            self._junit.write(JUNIT_FOOTER)
+            self._sync(force=True)
+            self._jsonl.close()
+            self._junit.close()
+
+
+def repair_junit(path):
+    """Close the XML of a JUnit file whose run died before ResultSink.close()"""
+    with open(path, "rb+") as f:
+        f.seek(max(0, os.path.getsize(path) - len(JUNIT_FOOTER)))
+        if f.read().decode("utf-8", errors="ignore").endswith(JUNIT_FOOTER):
+            return False
+        f.seek(0, os.SEEK_END)
+        f.write(JUNIT_FOOTER.encode())
+    return True
+
+
+def iter_results(jsonl_path):
+    """Result records from a JSONL stream, one at a time; a torn last line is skipped"""
+    with open(jsonl_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("type") == "result":
+                yield record
+
+
+REPORT_STYLE = """
+body { font-family: Arial, sans-serif; margin: 20px; }
+h1 { color: #333; }
+.summary { background: #f0f0f0; padding: 15px; border-radius: 5px; margin: 20px 0; }
+.pass { color: green; }
+.fail, .error { color: red; }
+.skip { color: #999; }
+table { border-collapse: collapse; width: 100%; margin-top: 20px; }
+th, td { border: 1px solid #ddd; padding: 12px; text-align: left; }
+th { background-color: #4CAF50; color: white; }
+tr:nth-child(even) { background-color: #f2f2f2; }
+.pages a { margin-right: 8px; }
+.screenshot { margin: 10px 0; }
+img { max-width: 400px; border: 1px solid #ddd; }
+"""
+
+STATUS_LABELS = {"pass": "✅ PASS", "fail": "❌ FAIL", "error": "💥 ERROR", "skip": "⏭️ SKIP"}
+TABLE_HEAD = "<table>\n<tr><th>#</th><th>Test Name</th><th>Status</th><th>Details</th></tr>\n"
+
+
+def _page_path(report_path, page):
+    return report_path if page == 1 else f"{os.path.splitext(report_path)[0]}-{page:04d}.html"
+
+
+def _row(number, record):
+    status = record["status"]
+    return (f'<tr><td>{number}</td><td>{html.escape(record["test"])}</td>'
+            f'<td class="{status}">{STATUS_LABELS.get(status, status)}</td>'
+            f'<td>{html.escape(record["details"] or "")}</td></tr>\n')
+
+
+def _nav(report_path, page, pages):
+    links = [f'<a href="{os.path.basename(_page_path(report_path, n))}">{n}</a>' if n != page else f"<b>{n}</b>"
+             for n in range(1, pages + 1)]
+    return f'<p class="pages">Pages: {" ".join(links)}</p>\n' if pages > 1 else ""
+
+
+def render_html(jsonl_path, report_path, title, page_size=500, max_failures=100, extra_html=""):
+    """Paginated HTML report streamed from a results JSONL file
+
+    Memory use is bounded by `page_size` and `max_failures`, not by the number of results.
+    The first page lives in `report_path` with the summary; later pages are numbered siblings.
+    """
+    head = (f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>{html.escape(title)}</title>\n"
+            f"<style>{REPORT_STYLE}</style>\n</head>\n<body>\n<h1>{html.escape(title)}</h1>\n")
+    counts = {"pass": 0, "fail": 0, "error": 0, "skip": 0}
+    failures, first_page, page, rows_on_page = [], [], 1, 0
+    page_files = []  # later pages are written before we know the page count; links are patched in
+
+    current = None
+    for number, record in enumerate(iter_results(jsonl_path), 1):
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+        if record["status"] in ("fail", "error") and len(failures) < max_failures:
+            failures.append((number, page, record))
+        if rows_on_page == page_size:
+            if current is not None:
+                current.write("</table>\n<!--NAV-->\n</body>\n</html>\n")
+                current.close()
+            page, rows_on_page = page + 1, 0
+            path = _page_path(report_path, page)
+            page_files.append((page, path))
+            current = open(path, "w", encoding="utf-8")
+            current.write(head + f"<!--NAV-->\n<h2>Results from #{number}</h2>\n" + TABLE_HEAD)
+        row = _row(number, record)
+        if page == 1:
+            first_page.append(row)
+        else:
+            current.write(row)
+        rows_on_page += 1
+    if current is not None:
+        current.write("</table>\n<!--NAV-->\n</body>\n</html>\n")
+        current.close()
+
+    pages = page
+    # Page files are small (page_size rows), so patching their navigation in place is cheap
+    for number, path in page_files:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content.replace("<!--NAV-->", _nav(report_path, number, pages)))
+
+    total = sum(counts.values())
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write(head)
+        f.write('<p>Generated from Coder Workspace Selenium Tests</p>\n<div class="summary">\n<h2>Test Summary</h2>\n'
+                f"<p>Total Tests: {total}</p>\n"
+                f'<p class="pass">✅ Passed: {counts["pass"]}</p>\n'
+                f'<p class="fail">❌ Failed: {counts["fail"] + counts["error"]}</p>\n')
+        if counts["skip"]:
+            f.write(f'<p class="skip">⏭️ Skipped: {counts["skip"]}</p>\n')
+        f.write(f'<p>Live stream: {html.escape(jsonl_path)}</p>\n</div>\n')
+        if failures and pages > 1:
+            f.write("<h2>Failures</h2>\n<ul>\n")
+            for number, on_page, record in failures:
+                link = os.path.basename(_page_path(report_path, on_page))
+                f.write(f'<li><a href="{link}">#{number}</a> {html.escape(record["test"])}: '
+                        f'{html.escape(record["details"] or "")}</li>\n')
+            f.write("</ul>\n")
+        f.write("<h2>Test Results</h2>\n" + _nav(report_path, 1, pages) + TABLE_HEAD)
+        f.writelines(first_page)
+        f.write("</table>\n" + _nav(report_path, 1, pages) + extra_html + "\n</body>\n</html>\n")
+    return report_path
@@ -0,0 +1,184 @@
+"""
+Content-addressed screenshot store with perceptual diffing
+Identical captures are stored once; images are only kept when they differ from the baseline
+
+Changed captures wait in pending.json until accepted as the new baseline:
+    python -m coder_selenium.screenshot_store                 # list pending changes
+    python -m coder_selenium.screenshot_store accept [NAME...] # accept some or all of them
+or run the tests with SCREENSHOT_ACCEPT=1 to accept every change as it is captured.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # without NumPy/Pillow only byte-identical captures count as unchanged
+    np = None
+    Image = None
+
+STORE_DIR = os.environ.get("SCREENSHOT_STORE", "/home/coder/screenshots")
+
+
+class StoredScreenshot:
+    """Where a capture ended up and how it compares to its baseline"""
+
+    def __init__(self, name, digest, path, status, score):
+        self.name = name
+        self.digest = digest
+        self.path = path
+        self.status = status  # "new", "unchanged", "changed" or "accepted"
+        self.score = score
+
+    def __repr__(self):
+        return f"StoredScreenshot({self.name!r}, {self.status}, score={self.score:.4f})"
+
+
+def perceptual_diff(png_a, png_b, grid=32, tolerance=8):
+    """Fraction of grid cells whose mean luminance differs by more than `tolerance`"""
+    a = np.asarray(Image.open(io.BytesIO(png_a)).convert("L"), dtype=np.float32)
+    b = np.asarray(Image.open(io.BytesIO(png_b)).convert("L"), dtype=np.float32)
+    if a.shape != b.shape or min(a.shape) < grid:
+        return 1.0
+    
+    # Average each image down to a grid x grid thumbnail before comparing
+    bh, bw = a.shape[0] // grid, a.shape[1] // grid
+    def thumbnail(pixels):
+        return pixels[:bh * grid, :bw * grid].reshape(grid, bh, grid, bw).mean(axis=(1, 3))
+    
+    return float((np.abs(thumbnail(a) - thumbnail(b)) > tolerance).mean())
+
+
+class ScreenshotStore:
+    """Screenshots stored under their SHA-256, with a baseline per name"""
+
+    def __init__(self, root=STORE_DIR, threshold=0.01, accept_changes=None):
+        self.root = root
+        self.threshold = threshold
+        if accept_changes is None:
+            accept_changes = os.environ.get("SCREENSHOT_ACCEPT") == "1"
+        self.accept_changes = accept_changes
+        self.objects_dir = os.path.join(root, "objects")
+        self.baselines_path = os.path.join(root, "baselines.json")
+        self.pending_path = os.path.join(root, "pending.json")  # name -> latest changed digest
+        self._lock = threading.Lock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.baselines = self._load(self.baselines_path)
+        self.pending = self._load(self.pending_path)
+
+    @staticmethod
+    def _load(path):
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _dump(path, data):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def path_for(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.png")
+
+    def put(self, png):
+        """Store bytes under their hash; identical images are written once"""
+        digest = hashlib.sha256(png).hexdigest()
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(png)
+            os.replace(tmp_path, path)
+        return digest, path
+
+    def accept(self, name, digest=None):
+        """Make `digest` (default: the pending change) the last-known-good baseline for `name`"""
+        with self._lock:
+            pending = self.pending.pop(name, None)
+            digest = digest or pending
+            if digest is None:
+                raise KeyError(f"No pending screenshot change for {name!r}")
+            self.baselines[name] = digest
+            self._dump(self.baselines_path, self.baselines)
+            if pending is not None:
+                self._dump(self.pending_path, self.pending)
+        return digest
+
+    def _set_pending(self, name, digest):
+        with self._lock:
+            if self.pending.get(name) == digest:
+                return
+            if digest is None:
+                del self.pending[name]
+            else:
+                self.pending[name] = digest
+            self._dump(self.pending_path, self.pending)
+
+    def record(self, name, png):
+        """Compare a capture to its baseline, keeping it only if it changed"""
+        digest = hashlib.sha256(png).hexdigest()
+        baseline = self.baselines.get(name)
+        
+        if baseline is None:
+            digest, path = self.put(png)
+            self.accept(name, digest)
+            return StoredScreenshot(name, digest, path, "new", 1.0)
+        
+        baseline_path = self.path_for(baseline)
+        if digest == baseline:
+            self._set_pending(name, None)  # back to the baseline
+            return StoredScreenshot(name, digest, baseline_path, "unchanged", 0.0)
+        
+        score = 1.0
+        if np is not None and os.path.exists(baseline_path):
+            with open(baseline_path, "rb") as f:
+                score = perceptual_diff(png, f.read())
+        if score <= self.threshold:
+            self._set_pending(name, None)
+            return StoredScreenshot(name, baseline, baseline_path, "unchanged", score)
+        
+        digest, path = self.put(png)
+        if self.accept_changes:
+            self.accept(name, digest)
+            return StoredScreenshot(name, digest, path, "accepted", score)
+        self._set_pending(name, digest)
+        return StoredScreenshot(name, digest, path, "changed", score)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="List or accept changed screenshots")
+    parser.add_argument("command", nargs="?", choices=["list", "accept"], default="list")
+    parser.add_argument("names", nargs="*", help="screenshots to accept (default: every pending change)")
+    parser.add_argument("--store", default=STORE_DIR)
+    args = parser.parse_args()
+
+    store = ScreenshotStore(args.store, accept_changes=False)
+    if args.command == "list":
+        if not store.pending:
+            print("✅ No pending screenshot changes")
+        for name, digest in sorted(store.pending.items()):
+            print(f"🖼️  {name}: {store.path_for(digest)} (baseline {store.path_for(store.baselines[name])})")
+        return 0
+    names = args.names or sorted(store.pending)
+    missing = [name for name in names if name not in store.pending]
+    if missing:
+        print(f"❌ No pending change for {', '.join(missing)}")
+        return 1
+    for name in names:
+        store.accept(name)
+        print(f"✅ Accepted {name} as the new baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
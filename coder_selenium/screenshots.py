@@ -0,0 +1,106 @@
+"""
+Asynchronous screenshot pipeline
+Tests hand over raw screenshot payloads; worker threads decode, shrink and write them
+"""
+
+import base64
+import io
+import os
+import queue
+import threading
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; without it images are written as captured
+    Image = None
+
+
+class ScreenshotService:
+    """Bounded queue of screenshots written by a background worker pool"""
+
+    def __init__(self, workers=2, max_queue=8, max_width=None, store=None):
+        self.max_width = max_width
+        self.store = store
+        self.written = []
+        self.stored = {}  # logical path -> StoredScreenshot when a store is used
+        self.errors = []
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"screenshot-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, path, png=None, base64_data=None):
+        """Queue raw PNG bytes or a base64 payload; blocks while the queue is full"""
+        self._queue.put((path, png, base64_data))
+
+    def capture(self, driver, path):
+        """Grab a screenshot without decoding or writing it on the test thread"""
+        self.submit(path, base64_data=driver.get_screenshot_as_base64())
+        return path
+
+    def _encode(self, png):
+        """Downscale and recompress when Pillow is available"""
+        if Image is None or not self.max_width:
+            return png
+        image = Image.open(io.BytesIO(png))
+        if image.width <= self.max_width:
+            return png
+        height = round(image.height * self.max_width / image.width)
+        output = io.BytesIO()
+        image.resize((self.max_width, height), Image.LANCZOS).save(output, format="PNG", optimize=True)
+        return output.getvalue()
+
+    def _write(self, path, png, base64_data):
+        if png is None:
+            png = base64.b64decode(base64_data)
+        data = self._encode(png)
+        if self.store is not None:
+            name = os.path.splitext(os.path.basename(path))[0]
+            stored = self.store.record(name, data)
+            with self._lock:
+                self.stored[path] = stored
+            return stored.path
+        
+        # Write then rename, so readers never see a half-written file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return path
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path = self._write(*item)
+                with self._lock:
+                    self.written.append(path)
+            except Exception as e:
+                with self._lock:
+                    self.errors.append((item[0], e))
+                print(f"⚠️  Screenshot {item[0]} failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def changed(self):
+        """Stored screenshots that are new or differ from their baseline"""
+        with self._lock:
+            return [s for s in self.stored.values() if s.status != "unchanged"]
+
+    def flush(self):
+        """Block until every queued screenshot is on disk"""
+        self._queue.join()
+
+    def close(self):
+        """Flush and stop the workers"""
+        self.flush()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
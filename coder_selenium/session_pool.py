@@ -0,0 +1,227 @@
+"""
+Warm browser session pool
+Keeps pre-launched browsers around so tests don't pay Chrome cold start
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+from coder_selenium.cdp import try_cdp
+from coder_selenium.governor import governor
+
+
+class PooledSession:
+    """A pooled driver plus its bookkeeping"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class SessionPool:
+    """Pool of N warm, health-checked browser sessions"""
+
+    def __init__(self, factory, size=1, max_uses=20, window_size=(1920, 1080), lease_timeout=300):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.window_size = window_size
+        self.lease_timeout = lease_timeout
+        self._idle = queue.Queue()
+        self._leased = {}
+        self._lock = threading.Lock()
+        self._total = 0
+        self._closed = False
+
+    def start(self):
+        """Pre-launch browsers until the pool is full"""
+        threads = [threading.Thread(target=self._launch) for _ in range(self.size - self._total)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self
+
+    def _launch(self):
+        """Start one browser and park it in the idle queue"""
+        with self._lock:
+            if self._closed or self._total >= self.size:
+                return False
+            self._total += 1
+        try:
+            session = PooledSession(self.factory())
+        except Exception as e:
+            with self._lock:
+                self._total -= 1
+            print(f"⚠️  Session pool failed to launch browser: {e}")
+            return False
+        return self._park(session)
+
+    def _park(self, session):
+        """Queue an idle browser, or quit it if the pool closed while it was starting or resetting"""
+        with self._lock:
+            if not self._closed:
+                self._idle.put(session)
+                return True
+        self._discard(session)
+        return False
+
+    def _refill(self):
+        """Launch a replacement browser in the background"""
+        threading.Thread(target=self._launch, daemon=True).start()
+
+    def _is_healthy(self, driver):
+        """Cheap liveness check - one round trip"""
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, session):
+        """Quit a browser and free its slot"""
+        try:
+            session.driver.quit()
+        except Exception:
+            pass
+        with self._lock:
+            self._total -= 1
+
+    def reset(self, driver):
+        """Return a browser to a clean state between leases"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.delete_all_cookies()
+        try_cdp(driver, "Network.clearBrowserCookies")  # other domains' cookies too
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            pass  # about:blank and data: URLs have no storage
+        driver.get("about:blank")
+        driver.set_window_size(*self.window_size)
+        policy = getattr(driver, "network_policy", None)
+        if policy is not None:
+            policy.apply(driver)  # per-test overrides (e.g. the demo's "full" step) don't leak
+
+    def lease(self):
+        """Borrow a warm browser, launching one if the pool has room"""
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    has_room = self._total < self.size
+                    running = self._total
+                if has_room and running and not governor.has_capacity():
+                    has_room = False  # near the memory limit: wait for a browser to come back
+                if has_room and not self._launch() and self._total == 0:
+                    raise RuntimeError("Session pool could not launch a browser")
+                try:
+                    session = self._idle.get(timeout=self.lease_timeout)
+                except queue.Empty:
+                    raise TimeoutError("No browser session became available") from None
+
+            if self._is_healthy(session.driver):
+                break
+            print("⚠️  Discarding crashed browser from pool")
+            self._discard(session)
+
+        session.uses += 1
+        with self._lock:
+            self._leased[id(session.driver)] = session
+        return session.driver
+
+    def release(self, driver):
+        """Return a browser; recycle it if worn out or crashed"""
+        with self._lock:
+            session = self._leased.pop(id(driver), None)
+        if session is None:
+            return
+
+        if self._closed:
+            self._discard(session)
+            return
+
+        if session.uses >= self.max_uses or governor.over_cap(driver) or not self._is_healthy(driver):
+            self._discard(session)
+            self._refill()
+            return
+
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            self._discard(session)
+            self._refill()
+            return
+        self._park(session)
+
+    @contextmanager
+    def session(self):
+        """Lease a browser for the duration of a with-block"""
+        driver = self.lease()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """Quit every browser owned by the pool"""
+        with self._lock:
+            self._closed = True  # from here on, _park() quits browsers instead of queueing them
+            leased = list(self._leased.values())
+            self._leased.clear()
+        for session in leased:
+            self._discard(session)
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+# Pools kept across runs by a long-lived process (the test daemon), keyed by browser config
+_warm_pools = {}
+_keep_warm = False
+
+
+def keep_warm(enabled=True):
+    """Make open_pool() reuse pools and close_pool() leave their browsers running"""
+    global _keep_warm
+    _keep_warm = enabled
+
+
+def open_pool(key, factory, **kwargs):
+    """A started pool; with keep_warm(), the same warm pool is handed out again for `key`
+
+    `key` must capture everything that makes browsers incompatible (options, network
+    policy, proxy). A key of None always gets a fresh pool.
+    """
+    if not _keep_warm or key is None:
+        return SessionPool(factory, **kwargs).start()
+    pool = _warm_pools.get(key)
+    if pool is None or pool._closed:
+        pool = _warm_pools[key] = SessionPool(factory, **kwargs)
+    else:
+        pool.factory = factory  # replacements come from the current run's code
+        pool.size = max(pool.size, kwargs.get("size", 1))
+        pool.max_uses = kwargs.get("max_uses", pool.max_uses)
+    return pool.start()
+
+
+def close_pool(pool):
+    """Close a pool from open_pool(), unless it is being kept warm"""
+    if _keep_warm and pool in _warm_pools.values():
+        return
+    pool.close()
+
+
+def close_warm_pools():
+    for pool in _warm_pools.values():
+        pool.close()
+    _warm_pools.clear()
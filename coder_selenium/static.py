@@ -0,0 +1,410 @@
+"""
+Static execution tier
+Runs DOM-only checks over HTTP + an HTML parser and hands a test to a real browser when it needs one
+"""
+
+import functools
+import os
+import re
+import ssl
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from html.parser import HTMLParser
+from http.cookiejar import CookieJar
+
+from selenium.common.exceptions import NoSuchElementException
+
+STATIC_TIER_ENABLED = os.environ.get("SELENIUM_STATIC_TIER", "1") != "0"
+
+USER_AGENT = ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/131.0.0.0 Safari/537.36")
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+             "param", "source", "track", "wbr"}
+# Start tags that implicitly close an open element of these kinds
+IMPLIED_END = {
+    "li": {"li"}, "option": {"option"}, "dt": {"dt", "dd"}, "dd": {"dt", "dd"},
+    "tr": {"tr", "td", "th"}, "td": {"td", "th"}, "th": {"td", "th"}, "p": {"p"},
+}
+BLOCK_TAGS = {"address", "article", "aside", "blockquote", "div", "dl", "fieldset", "footer", "form",
+              "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "main", "nav", "ol", "pre",
+              "section", "table", "ul"}
+# Never rendered as text once JavaScript is on
+HIDDEN_TAGS = {"head", "script", "style", "template", "noscript"}
+# Reflected properties that read as "" when the attribute is absent
+EMPTY_PROPERTIES = {"id", "title", "lang", "dir", "value"}
+
+# Scripts with no observable effect on a document that has no layout
+NO_OP_SCRIPT = re.compile(r"^\s*window\.scroll(To|By)\([^)]*\);?\s*$")
+
+
+class NeedsBrowser(Exception):
+    """The static tier can't answer this; rerun the test in a real browser"""
+
+
+class Node:
+    """Element in the parsed document"""
+
+    def __init__(self, tag, attrs, parent=None):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children = []  # Nodes and text strings
+
+    def elements(self):
+        """Descendant elements in document order"""
+        for child in self.children:
+            if isinstance(child, Node):
+                yield child
+                yield from child.elements()
+
+    def text(self):
+        parts = []
+
+        def walk(node):
+            for child in node.children:
+                if isinstance(child, str):
+                    parts.append(child)
+                elif child.tag not in HIDDEN_TAGS:
+                    walk(child)
+        walk(self)
+        return " ".join("".join(parts).split())
+
+
+class DocumentParser(HTMLParser):
+    """Builds a Node tree, forgiving the usual HTML omissions"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document", {})
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        closes = IMPLIED_END.get(tag, set()) | ({"p"} if tag in BLOCK_TAGS else set())
+        while len(self.stack) > 1 and self.stack[-1].tag in closes:
+            self.stack.pop()
+        node = Node(tag, {name: value if value is not None else "" for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+# Selector support: compound selectors (tag, #id, .class, [attr op value]) joined by
+# descendant or child combinators, comma-separated
+COMPOUND = re.compile(
+    r"(?P<tag>\*|[a-zA-Z][\w-]*)?(?P<rest>(?:#[\w-]+|\.[\w-]+|"
+    r"\[\s*[\w:-]+\s*(?:[~^$*|]?=\s*(?:\"[^\"]*\"|'[^']*'|[^\]\s]+)\s*)?\])*)"
+)
+PART = re.compile(r"#([\w-]+)|\.([\w-]+)|\[\s*([\w:-]+)\s*(?:([~^$*|]?=)\s*(\"[^\"]*\"|'[^']*'|[^\]\s]+)\s*)?\]")
+
+
+def _compound(tag=None, ids=(), classes=(), attrs=()):
+    return {"tag": tag, "ids": list(ids), "classes": list(classes), "attrs": list(attrs)}
+
+
+def parse_selector(selector):
+    """[[(combinator, compound), ...], ...] for each comma-separated selector"""
+    groups = []
+    for part in selector.split(","):
+        chain, text, combinator = [], part.strip(), " "
+        while text:
+            match = COMPOUND.match(text)
+            if not match or not match.group(0):
+                raise NeedsBrowser(f"CSS selector {selector!r} is beyond the static tier")
+            compound = _compound(tag=(match.group("tag") or "*").lower())
+            for ident, cls, name, op, value in PART.findall(match.group("rest")):
+                if ident:
+                    compound["ids"].append(ident)
+                elif cls:
+                    compound["classes"].append(cls)
+                else:
+                    compound["attrs"].append((name.lower(), op or None, value.strip("\"'") if op else None))
+            chain.append((combinator, compound))
+            text = text[match.end():]
+            stripped = text.lstrip()
+            if stripped.startswith(">"):
+                combinator, text = ">", stripped[1:].lstrip()
+            elif stripped and stripped != text:
+                combinator, text = " ", stripped
+            elif stripped:
+                raise NeedsBrowser(f"CSS selector {selector!r} is beyond the static tier")
+        if not chain:
+            raise NeedsBrowser(f"Empty CSS selector {selector!r}")
+        groups.append(chain)
+    return groups
+
+
+def _attr_matches(actual, op, expected):
+    if actual is None:
+        return False
+    if op is None:
+        return True
+    return {
+        "=": lambda: actual == expected,
+        "~=": lambda: expected in actual.split(),
+        "^=": lambda: actual.startswith(expected),
+        "$=": lambda: actual.endswith(expected),
+        "*=": lambda: expected in actual,
+        "|=": lambda: actual == expected or actual.startswith(expected + "-"),
+    }[op]()
+
+
+def _matches_compound(node, compound):
+    if compound["tag"] not in ("*", node.tag):
+        return False
+    if any(node.attrs.get("id") != ident for ident in compound["ids"]):
+        return False
+    classes = node.attrs.get("class", "").split()
+    if any(cls not in classes for cls in compound["classes"]):
+        return False
+    return all(_attr_matches(node.attrs.get(name), op, value) for name, op, value in compound["attrs"])
+
+
+def _matches_chain(node, chain):
+    """Right-to-left match of a compound chain against the whole document, like querySelectorAll"""
+    combinator, compound = chain[-1]
+    if not _matches_compound(node, compound):
+        return False
+    if len(chain) == 1:
+        return True
+    ancestor = node.parent
+    while ancestor is not None and ancestor.tag != "#document":
+        if _matches_chain(ancestor, chain[:-1]):
+            return True
+        if combinator == ">":
+            return False
+        ancestor = ancestor.parent
+    return False
+
+
+def find_nodes(scope, by, value):
+    """Elements under `scope` for a WebDriver locator strategy"""
+    if by == "id":
+        groups = [[(" ", _compound(tag="*", ids=[value]))]]
+    elif by == "name":
+        groups = [[(" ", _compound(tag="*", attrs=[("name", "=", value)]))]]
+    elif by == "tag name":
+        groups = [[(" ", _compound(tag=value.lower()))]]
+    elif by == "class name":
+        groups = [[(" ", _compound(tag="*", classes=[value]))]]
+    elif by == "css selector":
+        groups = parse_selector(value)
+    elif by in ("link text", "partial link text"):
+        return [node for node in scope.elements() if node.tag == "a" and (
+            node.text() == value if by == "link text" else value in node.text())]
+    else:
+        raise NeedsBrowser(f"Locator strategy {by!r} needs a real browser")
+    return [node for node in scope.elements() if any(_matches_chain(node, chain) for chain in groups)]
+
+
+class _NeedsBrowserFallback:
+    """Any WebDriver API the static tier doesn't implement asks for a browser"""
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        raise NeedsBrowser(f"{type(self).__name__}.{name} needs a real browser")
+
+
+class StaticElement(_NeedsBrowserFallback):
+    """Read-only subset of WebElement"""
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        return self._node.text()
+
+    def get_attribute(self, name):
+        value = self._node.attrs.get(name.lower())
+        if value is None and name.lower() in EMPTY_PROPERTIES:
+            return self._node.text() if name.lower() == "value" and self._node.tag == "textarea" else ""
+        return value
+
+    def get_dom_attribute(self, name):
+        return self._node.attrs.get(name.lower())
+
+    def find_element(self, by="id", value=None):
+        return _first(find_nodes(self._node, by, value), by, value)
+
+    def find_elements(self, by="id", value=None):
+        return [StaticElement(node) for node in find_nodes(self._node, by, value)]
+
+
+def _first(nodes, by, value):
+    if not nodes:
+        raise NoSuchElementException(f"No element found for {by}={value} in the static page")
+    return StaticElement(nodes[0])
+
+
+class StaticDriver(_NeedsBrowserFallback):
+    """WebDriver look-alike backed by urllib and html.parser
+
+    Supports get, title, current_url, page_source, find_element(s) (id, name, tag name,
+    class name, link text and simple CSS) and element tag_name/text/get_attribute.
+    Anything else raises NeedsBrowser.
+    """
+
+    backend = "static"
+
+    def __init__(self, proxy=None, timeout=10):
+        self.timeout = timeout
+        handlers = [urllib.request.HTTPCookieProcessor(CookieJar())]
+        if proxy:
+            # The record/replay proxy presents its own certificate, as Chrome is told to accept
+            handlers += [urllib.request.ProxyHandler({"http": proxy, "https": proxy}),
+                         urllib.request.HTTPSHandler(context=ssl._create_unverified_context())]
+        self._opener = urllib.request.build_opener(*handlers)
+        self._document = None
+        self.current_url = None
+        self.page_source = ""
+
+    def get(self, url):
+        request = urllib.request.Request(url, headers={
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "identity",
+        })
+        try:
+            with self._opener.open(request, timeout=self.timeout) as response:
+                content_type = response.headers.get_content_type()
+                charset = response.headers.get_content_charset() or "utf-8"
+                body = response.read()
+                self.current_url = response.geturl()
+        except (urllib.error.URLError, OSError) as e:
+            raise NeedsBrowser(f"Static fetch of {url} failed: {e}") from None
+        if content_type not in ("text/html", "application/xhtml+xml"):
+            raise NeedsBrowser(f"{url} is {content_type}, not HTML")
+        self.page_source = body.decode(charset, errors="replace")
+        parser = DocumentParser()
+        parser.feed(self.page_source)
+        parser.close()
+        self._document = parser.root
+
+    @property
+    def title(self):
+        titles = [node for node in self._document.elements() if node.tag == "title"] if self._document else []
+        return " ".join("".join(c for c in titles[0].children if isinstance(c, str)).split()) if titles else ""
+
+    def find_element(self, by="id", value=None):
+        return _first(find_nodes(self._document, by, value), by, value)
+
+    def find_elements(self, by="id", value=None):
+        return [StaticElement(node) for node in find_nodes(self._document, by, value)]
+
+    def query(self, specs, root=None):
+        """batch.query() without a round trip; specs maps key to [by, value, fields]"""
+        scope = root._node if root is not None else self._document
+        result = {}
+        for key, (by, value, fields) in specs.items():
+            matches = [StaticElement(node) for node in find_nodes(scope, by, value)]
+            result[key] = [{field: self._read(element, field) for field in fields} for element in matches]
+        return result
+
+    def _read(self, element, field):
+        if field == "element":
+            return element
+        if field == "tag":
+            return element.tag_name
+        if field == "text":
+            return element.text
+        if field == "displayed":
+            raise NeedsBrowser("Visibility needs layout")
+        return element.get_attribute(field)
+
+    def execute_script(self, script, *args):
+        if NO_OP_SCRIPT.match(script):
+            return None
+        raise NeedsBrowser("JavaScript needs a real browser")
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def quit(self):
+        self._document = None
+
+    close = quit
+
+
+class StaticTally:
+    """Which tests ran without a browser and why the others fell back"""
+
+    def __init__(self):
+        self.runs = []  # (test, tier, seconds, reason)
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self.runs = []
+
+    def record(self, test, tier, seconds, reason=None):
+        with self._lock:
+            self.runs.append((test, tier, seconds, reason))
+
+    def report(self):
+        if not self.runs:
+            return
+        static = [r for r in self.runs if r[1] == "static"]
+        print(f"\n🪶 Static tier: {len(static)} of {len(self.runs)} eligible tests ran without a browser")
+        for test, tier, seconds, reason in self.runs:
+            detail = f" ({reason})" if reason else ""
+            print(f"   {test:<40} {tier:<8} {seconds * 1000:7.0f} ms{detail}")
+
+
+tally = StaticTally()
+report = tally.report
+
+
+def is_static_eligible(test_method):
+    return STATIC_TIER_ENABLED and getattr(test_method, "static_eligible", False)
+
+
+def static_eligible(test):
+    """Mark a test that only reads the DOM; it runs on StaticDriver when its setUp provides one
+
+    If the static run needs a browser or fails, the test is rerun after `self.use_browser()`
+    swaps in a real one, so only a static pass is ever trusted.
+    """
+    @functools.wraps(test)
+    def wrapper(self, *args, **kwargs):
+        if not isinstance(self.driver, StaticDriver):
+            return test(self, *args, **kwargs)
+        started = time.perf_counter()
+        try:
+            result = test(self, *args, **kwargs)
+        except unittest.SkipTest:
+            raise
+        except Exception as e:
+            reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+            tally.record(test.__name__, "browser", time.perf_counter() - started, reason)
+            print(f"   ↪️  Static run fell back to a browser: {reason}")
+            self.use_browser()
+            return test(self, *args, **kwargs)
+        tally.record(test.__name__, "static", time.perf_counter() - started)
+        return result
+
+    wrapper.static_eligible = True
+    return wrapper
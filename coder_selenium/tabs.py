@@ -0,0 +1,166 @@
+"""
+Concurrent page loads in one browser
+Opens a tab per URL, lets every tab load at once and awaits each tab's load independently
+"""
+
+import asyncio
+import collections
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+
+from coder_selenium.cdp import try_cdp
+from coder_selenium.context import begin_test, current_test
+
+TabResult = collections.namedtuple("TabResult", "url handle title final_url loaded elapsed error")
+
+STATE_JS = "return [document.readyState, location.href, document.title];"
+NAVIGATE_JS = "location.href = arguments[0];"
+
+
+class PageGroup:
+    """Tabs sharing one WebDriver session: commands are serialized, page loads are not
+
+    Usage:
+        with PageGroup(driver) as group:
+            for tab in group.load(urls):
+                print(tab.url, tab.title, tab.elapsed)
+
+    From async code, `await group.gather(urls)` instead of `group.load(urls)`.
+    To set tabs up before their pages load, `open_blank()` them, configure each one,
+    then `load_in(handles, urls)`.
+    """
+
+    def __init__(self, driver, timeout=30, poll=0.1):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll = poll
+        self.handles = []
+        self._origin = None
+        self._test = current_test()
+        # One command thread: a session handles one command at a time anyway
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-group")
+
+    def _call(self, fn, *args):
+        def run():
+            begin_test(self._test)
+            return fn(*args)
+        return asyncio.get_running_loop().run_in_executor(self._executor, run)
+
+    def _open_tab(self, url):
+        """Open a background tab already navigating to `url`; return its window handle"""
+        driver = self.driver
+        if self._origin is None:
+            self._origin = driver.current_window_handle
+        before = set(driver.window_handles)
+
+        # CDP starts the load without waiting for it; window.open is the portable fallback
+        target = try_cdp(driver, "Target.createTarget", {"url": url, "background": True})
+        if not target:
+            driver.execute_script("window.open(arguments[0], '_blank');", url)
+        handles = driver.window_handles
+        if target and target.get("targetId") in handles:
+            return target["targetId"]
+        new = [h for h in handles if h not in before]
+        if not new:
+            raise RuntimeError(f"Could not open a tab for {url}")
+        return new[0]
+
+    def _state(self, handle):
+        self.driver.switch_to.window(handle)
+        return self.driver.execute_script(STATE_JS)
+
+    async def _await_load(self, url, handle, started):
+        deadline = started + self.timeout
+        state = None
+        while True:
+            try:
+                state, final_url, title = await self._call(self._state, handle)
+            except WebDriverException as e:
+                return TabResult(url, handle, None, None, False, time.perf_counter() - started, e.msg or str(e))
+            elapsed = time.perf_counter() - started
+            # A fresh tab reports a complete about:blank before the real navigation commits
+            if state == "complete" and final_url != "about:blank":
+                return TabResult(url, handle, title, final_url, True, elapsed, None)
+            if time.perf_counter() >= deadline:
+                error = f"not loaded after {self.timeout}s (readyState {state})"
+                return TabResult(url, handle, title, final_url, False, elapsed, error)
+            await asyncio.sleep(self.poll)
+
+    def _navigate(self, handle, url):
+        """Start loading `url` in an open tab without waiting for it"""
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(NAVIGATE_JS, url)
+
+    async def _await_all(self, urls, handles, started):
+        try:
+            return await asyncio.gather(*(
+                self._await_load(url, handle, started) for url, handle in zip(urls, handles)
+            ))
+        finally:
+            await self._call(self.driver.switch_to.window, self._origin)
+
+    async def gather(self, urls):
+        """Open a tab per URL and wait for all of them; results come back in `urls` order"""
+        urls = list(urls)
+        started = time.perf_counter()
+        handles = []
+        for url in urls:
+            handles.append(await self._call(self._open_tab, url))
+        self.handles.extend(handles)
+        return await self._await_all(urls, handles, started)
+
+    async def gather_in(self, handles, urls):
+        """Navigate already open tabs to `urls` at once and wait for all of them"""
+        handles, urls = list(handles), list(urls)
+        started = time.perf_counter()
+        for handle, url in zip(handles, urls):
+            await self._call(self._navigate, handle, url)
+        return await self._await_all(urls, handles, started)
+
+    def load(self, urls):
+        """Blocking form of gather()"""
+        return asyncio.run(self.gather(urls))
+
+    def load_in(self, handles, urls):
+        """Blocking form of gather_in()"""
+        return asyncio.run(self.gather_in(handles, urls))
+
+    def open_blank(self, count):
+        """Open `count` empty tabs owned by the group; returns their handles"""
+        handles = [self._open_tab("about:blank") for _ in range(count)]
+        self.handles.extend(handles)
+        return handles
+
+    def _close_tabs(self):
+        for handle in self.handles:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except WebDriverException:
+                pass  # already gone
+        self.handles = []
+        if self._origin is not None:
+            self.driver.switch_to.window(self._origin)
+
+    def close(self):
+        """Close the group's tabs and return to the tab that opened them"""
+        self._close_tabs()
+        self._executor.shutdown(wait=False)
+
+    async def aclose(self):
+        await self._call(self._close_tabs)
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
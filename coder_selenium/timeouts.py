@@ -0,0 +1,242 @@
+"""
+Timeout policy for element lookups
+Replaces the blanket implicit wait with per-locator budgets learned from past runs,
+zero-wait probes for optional elements and a per-test deadline
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.support.ui import WebDriverWait
+
+from coder_selenium.context import current_test
+from coder_selenium.instrumentation import percentile
+
+LATENCY_PATH = os.environ.get("SELENIUM_LOCATOR_LATENCY", "/home/coder/selenium-locator-latency.json")
+# "adaptive" (default) or "implicit" for the old blanket implicit wait
+POLICY_MODE = os.environ.get("SELENIUM_TIMEOUT_POLICY", "adaptive")
+# Shortest learned budget; a locator that is fast locally still gets this much on a slow CI host
+BUDGET_FLOOR = float(os.environ.get("SELENIUM_LOCATOR_FLOOR", "2.0"))
+
+SINGLE = (Command.FIND_ELEMENT, Command.FIND_CHILD_ELEMENT)
+PLURAL = (Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENTS)
+
+
+class TimeoutPolicy:
+    """Decides how long each element lookup may wait, and records the time that saved
+
+    Lookups retry until found or their budget runs out. A locator seen at least
+    `min_samples` times gets p99 of its observed latency × `margin` (clamped to
+    [floor, default]); others get `default`, the implicit wait this replaces. Budgets
+    never run past the current test's deadline. Inside an explicit wait() lookups are
+    single attempts, so explicit and implicit waits no longer stack.
+    """
+
+    def __init__(self, path=LATENCY_PATH, default=10.0, margin=3.0, floor=BUDGET_FLOOR,
+                 min_samples=5, window=200, poll=0.05):
+        self.path = path
+        self.default = default
+        self.margin = margin
+        self.floor = floor
+        self.min_samples = min_samples
+        self.window = window
+        self.poll = poll
+        self.savings = {}  # test -> policy -> {"count", "saved"}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(path) as f:
+                self.latencies = json.load(f)
+        except (OSError, ValueError):
+            self.latencies = {}  # "using=value" -> recent seconds-to-found
+
+    def clear(self):
+        """Forget this run's savings; learned latencies are kept"""
+        with self._lock:
+            self.savings = {}
+
+    # Budgets
+
+    def budget(self, locator):
+        """(seconds, policy) for a locator key, before any deadline cap"""
+        with self._lock:
+            samples = list(self.latencies.get(locator, ()))
+        if len(samples) < self.min_samples:
+            return self.default, "default"
+        learned = percentile(samples, 99) * self.margin
+        return max(self.floor, min(self.default, learned)), "learned"
+
+    def observe(self, locator, seconds):
+        with self._lock:
+            samples = self.latencies.setdefault(locator, [])
+            samples.append(round(seconds, 4))
+            del samples[:-self.window]
+            self._dirty = True
+
+    def _saved(self, policy, seconds):
+        test = current_test()
+        with self._lock:
+            entry = self.savings.setdefault(test, {}).setdefault(policy, {"count": 0, "saved": 0.0})
+            entry["count"] += 1
+            entry["saved"] += max(0.0, seconds)
+
+    # Deadlines
+
+    @contextmanager
+    def deadline(self, seconds):
+        """Cap every lookup and explicit wait on this thread to `seconds` from now"""
+        previous = getattr(self._local, "deadline", None)
+        self._local.deadline = time.monotonic() + seconds
+        if previous is not None:
+            self._local.deadline = min(previous, self._local.deadline)
+        try:
+            yield
+        finally:
+            self._local.deadline = previous
+
+    def remaining(self):
+        """Seconds left before this thread's deadline, or None without one"""
+        deadline = getattr(self._local, "deadline", None)
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+    def _single_shot(self):
+        return getattr(self._local, "single_shot", 0) > 0
+
+    @contextmanager
+    def _no_retry(self):
+        self._local.single_shot = getattr(self._local, "single_shot", 0) + 1
+        try:
+            yield
+        finally:
+            self._local.single_shot -= 1
+
+    # Driver integration
+
+    def instrument(self, driver):
+        """Turn off the implicit wait and apply the policy to every lookup of `driver`"""
+        driver.implicitly_wait(0)
+        execute = driver.execute
+
+        def policed_execute(driver_command, params=None):
+            if driver_command not in SINGLE + PLURAL or self._single_shot():
+                return execute(driver_command, params)
+            return self._lookup(execute, driver_command, params)
+
+        driver.execute = policed_execute
+        return driver
+
+    def _lookup(self, execute, driver_command, params):
+        locator = f"{params.get('using')}={params.get('value')}"
+        budget, policy = self.budget(locator)
+        remaining = self.remaining()
+        if remaining is not None and remaining < budget:
+            budget, policy = remaining, "deadline"
+        started = time.monotonic()
+        while True:
+            try:
+                response = execute(driver_command, params)
+                if driver_command in SINGLE or response.get("value"):
+                    self.observe(locator, time.monotonic() - started)
+                    return response
+            except NoSuchElementException:
+                if time.monotonic() - started >= budget:
+                    self._missed(policy, started, locator)
+                    raise
+            else:
+                if time.monotonic() - started >= budget:
+                    self._missed(policy, started, locator)
+                    return response
+            time.sleep(self.poll)
+
+    def _missed(self, policy, started, locator):
+        # The implicit wait would have spent the full default here
+        self._saved(policy, self.default - (time.monotonic() - started))
+        if policy == "deadline":
+            raise TimeoutException(f"Test deadline reached while looking for {locator}")
+
+    def probe(self, driver, by, value):
+        """Optional element: one lookup, no waiting; returns the element or None"""
+        started = time.monotonic()
+        with self._no_retry():
+            found = driver.find_elements(by, value)
+        if not found:
+            self._saved("probe", self.default - (time.monotonic() - started))
+            return None
+        return found[0]
+
+    def wait(self, driver, timeout, **kwargs):
+        """WebDriverWait whose conditions look up elements once per poll and stop at the deadline"""
+        return PolicyWait(self, driver, timeout, **kwargs)
+
+    # Reporting
+
+    def report(self):
+        """Print lookups cut short and seconds saved per test and policy"""
+        if not self.savings:
+            return
+        print(f"\n⌛ Timeout policy (seconds saved versus a {self.default:g}s implicit wait)")
+        print(f"   {'Test':<40} {'policy':<10} {'misses':>7} {'saved':>8}")
+        for test, policies in self.savings.items():
+            for policy, entry in policies.items():
+                print(f"   {test[-40:]:<40} {policy:<10} {entry['count']:>7} {entry['saved']:>8.2f}")
+        total = sum(e["saved"] for policies in self.savings.values() for e in policies.values())
+        print(f"   Total saved: {total:.1f}s")
+
+    def save(self):
+        """Persist the learned latencies for the next run"""
+        with self._lock:
+            if not self._dirty:
+                return
+            latencies = json.dumps(self.latencies)
+            self._dirty = False
+        # Write then rename, so a run killed mid-save leaves the previous file intact
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(latencies)
+        os.replace(tmp_path, self.path)
+
+
+class PolicyWait(WebDriverWait):
+    """Explicit wait under a TimeoutPolicy"""
+
+    def __init__(self, policy, driver, timeout, **kwargs):
+        super().__init__(driver, timeout, **kwargs)
+        self._policy = policy
+        self._requested = timeout
+
+    def _run(self, until, method, message):
+        remaining = self._policy.remaining()
+        capped = remaining is not None and remaining < self._requested
+        self._timeout = min(self._requested, remaining) if capped else self._requested
+        started = time.monotonic()
+        with self._policy._no_retry():
+            try:
+                return until(method, message)
+            except TimeoutException:
+                if capped:
+                    self._policy._saved("deadline", self._requested - (time.monotonic() - started))
+                    raise TimeoutException(f"Test deadline reached after {self._timeout:.1f}s of a "
+                                           f"{self._requested}s wait") from None
+                raise
+
+    def until(self, method, message=""):
+        return self._run(super().until, method, message)
+
+    def until_not(self, method, message=""):
+        return self._run(super().until_not, method, message)
+
+
+default_policy = TimeoutPolicy()
+enabled = POLICY_MODE != "implicit"
+
+probe = default_policy.probe
+wait = default_policy.wait
+deadline = default_policy.deadline
+report = default_policy.report
+save = default_policy.save
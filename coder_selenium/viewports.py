@@ -0,0 +1,117 @@
+"""
+Responsive-design matrix
+Renders one page at several device sizes side by side, one emulated tab per device
+"""
+
+import collections
+import os
+
+from coder_selenium import waits
+from coder_selenium.cdp import try_cdp
+from coder_selenium.tabs import PageGroup
+
+Device = collections.namedtuple("Device", "name width height scale mobile")
+
+DEVICES = {
+    "Mobile": Device("Mobile", 375, 667, 2, True),
+    "Tablet": Device("Tablet", 768, 1024, 2, True),
+    "Desktop": Device("Desktop", 1920, 1080, 1, False),
+    "iPhone SE": Device("iPhone SE", 375, 667, 2, True),
+    "iPhone 14": Device("iPhone 14", 390, 844, 3, True),
+    "iPhone 14 Pro Max": Device("iPhone 14 Pro Max", 430, 932, 3, True),
+    "Pixel 7": Device("Pixel 7", 412, 915, 2.625, True),
+    "iPad": Device("iPad", 810, 1080, 2, True),
+    "iPad Pro": Device("iPad Pro", 1024, 1366, 2, True),
+    "Laptop": Device("Laptop", 1366, 768, 1, False),
+}
+
+ViewportResult = collections.namedtuple("ViewportResult", "device passed details")
+
+
+def parse_device(spec):
+    """A preset name, or NAME=WIDTHxHEIGHT[@SCALE] for a custom desktop viewport"""
+    spec = spec.strip()
+    if spec in DEVICES:
+        return DEVICES[spec]
+    name, _, size = spec.partition("=")
+    if not size:
+        raise ValueError(f"Unknown device {spec!r}; presets: {', '.join(DEVICES)}")
+    size, _, scale = size.partition("@")
+    width, height = (int(v) for v in size.lower().split("x"))
+    return Device(name.strip(), width, height, float(scale or 1), False)
+
+
+def devices_from_env(default=("Mobile", "Tablet", "Desktop")):
+    """Devices from RESPONSIVE_DEVICES (comma-separated), else `default`"""
+    specs = os.environ.get("RESPONSIVE_DEVICES")
+    specs = specs.split(",") if specs else default
+    return [parse_device(spec) for spec in specs if spec.strip()]
+
+
+def emulate(driver, device):
+    """Apply a device's metrics to the current tab; False when CDP is unavailable"""
+    applied = try_cdp(driver, "Emulation.setDeviceMetricsOverride", {
+        "width": device.width,
+        "height": device.height,
+        "deviceScaleFactor": device.scale,
+        "mobile": device.mobile,
+    })
+    if applied is None:
+        return False
+    try_cdp(driver, "Emulation.setTouchEmulationEnabled", {"enabled": device.mobile})
+    return True
+
+
+class ViewportMatrix:
+    """Load a page once per device in parallel tabs, then check each rendering
+
+    Every tab is emulated before it navigates, so the page's first render, media
+    queries and responsive images all see the device. A device whose emulation
+    fails is reported as failed instead of being checked at the wrong size.
+    `visit(driver, device)` runs with the device's tab current and returns (passed, details).
+    Without CDP, falls back to resizing the current window and reloading, one device at a time.
+    """
+
+    def __init__(self, driver, devices=None, timeout=30):
+        self.driver = driver
+        self.devices = list(devices or devices_from_env())
+        self.timeout = timeout
+
+    def run(self, url, visit):
+        if try_cdp(self.driver, "Browser.getVersion") is None:
+            return self._run_serial(url, visit)
+
+        results = {}
+        with PageGroup(self.driver, timeout=self.timeout) as group:
+            emulated = []
+            for device, handle in zip(self.devices, group.open_blank(len(self.devices))):
+                self.driver.switch_to.window(handle)
+                if emulate(self.driver, device):
+                    emulated.append((device, handle))
+                else:
+                    results[device] = ViewportResult(device, False, "device emulation failed")
+            tabs = group.load_in([handle for _, handle in emulated], [url] * len(emulated))
+            for (device, _), tab in zip(emulated, tabs):
+                if not tab.loaded:
+                    results[device] = ViewportResult(device, False, f"page did not load: {tab.error}")
+                    continue
+                self.driver.switch_to.window(tab.handle)
+                waits.wait_for(self.driver, waits.viewport_settled(), replaces=1)
+                results[device] = self._visit(visit, device)
+        return [results[device] for device in self.devices]
+
+    def _run_serial(self, url, visit):
+        results = []
+        for device in self.devices:
+            self.driver.set_window_size(device.width, device.height)
+            waits.wait_for(self.driver, waits.viewport_settled(device.width, device.height), replaces=1)
+            self.driver.get(url)  # after the resize, so the page loads at the device's size
+            results.append(self._visit(visit, device))
+        return results
+
+    def _visit(self, visit, device):
+        try:
+            passed, details = visit(self.driver, device)
+        except Exception as e:
+            passed, details = False, str(e)
+        return ViewportResult(device, passed, details)
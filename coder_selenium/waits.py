@@ -0,0 +1,159 @@
+"""
+Condition-based waits and a wait/sleep budget report
+Replaces fixed time.sleep calls with waits that return as soon as the page is ready
+"""
+
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from coder_selenium.cdp import try_cdp
+from coder_selenium.context import current_test
+
+# Counts in-flight fetch/XHR requests and remembers when the network last changed
+NETWORK_HOOK = """
+(function () {
+  if (window.__coderNet) return;
+  const net = window.__coderNet = {inflight: 0, last: Date.now()};
+  const done = function () { net.inflight--; net.last = Date.now(); };
+  const fetch = window.fetch;
+  if (fetch) {
+    window.fetch = function () {
+      net.inflight++; net.last = Date.now();
+      return fetch.apply(this, arguments).finally(done);
+    };
+  }
+  const send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    net.inflight++; net.last = Date.now();
+    this.addEventListener('loadend', done);
+    return send.apply(this, arguments);
+  };
+})();
+"""
+
+
+def install_network_hook(driver):
+    """Instrument future documents (via CDP when available) and the current one"""
+    try_cdp(driver, "Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_HOOK})
+    driver.execute_script(NETWORK_HOOK)
+
+
+# Conditions: callables taking a driver, usable with WebDriverWait
+
+def cart_badge_equals(count, css=".shopping_cart_badge"):
+    """Cart badge shows exactly `count` items"""
+    def condition(driver):
+        text = driver.execute_script(
+            "const el = document.querySelector(arguments[0]); return el && el.textContent.trim();", css
+        )
+        return text == str(count)
+    return condition
+
+
+def viewport_settled(width=None, height=None):
+    """Window reached the requested size and stopped changing between polls"""
+    last = []
+    def condition(driver):
+        size = driver.execute_script(
+            "return [window.outerWidth, window.outerHeight, window.innerWidth, window.innerHeight];"
+        )
+        settled = size == (last[0] if last else None)
+        last[:] = [size]
+        if width is not None and size[0] != width:
+            return False
+        if height is not None and size[1] != height:
+            return False
+        return settled
+    return condition
+
+
+def navigation_committed(previous_url=None, url_contains=None):
+    """A new document has committed and finished parsing"""
+    def condition(driver):
+        url, state = driver.execute_script("return [location.href, document.readyState];")
+        if state == "loading":
+            return False
+        if previous_url is not None and url == previous_url:
+            return False
+        if url_contains is not None and url_contains not in url.lower():
+            return False
+        return True
+    return condition
+
+
+def network_idle(quiet_ms=500):
+    """No fetch/XHR in flight for `quiet_ms`, with the page fully loaded"""
+    def condition(driver):
+        state = driver.execute_script(
+            "const net = window.__coderNet;"
+            "return net ? [document.readyState, net.inflight, Date.now() - net.last] : null;"
+        )
+        if state is None:
+            driver.execute_script(NETWORK_HOOK)
+            return False
+        ready, inflight, quiet = state
+        return ready == "complete" and inflight <= 0 and quiet >= quiet_ms
+    return condition
+
+
+class WaitRecorder:
+    """Tracks time spent in condition waits versus fixed sleeps, per test"""
+
+    def __init__(self):
+        self.records = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self.records = {}
+
+    def _record(self, kind, seconds, replaces=0.0):
+        test = current_test()
+        with self._lock:
+            entry = self.records.setdefault(test, {"waited": 0.0, "slept": 0.0, "reclaimed": 0.0})
+            entry[kind] += seconds
+            if replaces:
+                entry["reclaimed"] += replaces - seconds
+
+    def wait_for(self, driver, condition, timeout=10, replaces=0.0, poll=0.1, optional=False):
+        """Wait for a condition; `replaces` is the fixed sleep it took over from
+
+        Optional waits return False on timeout instead of raising. Only a wait that
+        succeeded counts as reclaiming the sleep it replaced.
+        """
+        started = time.perf_counter()
+        met = False
+        try:
+            value = WebDriverWait(driver, timeout, poll_frequency=poll).until(condition)
+            met = True
+            return value
+        except TimeoutException:
+            if optional:
+                return False
+            raise
+        finally:
+            self._record("waited", time.perf_counter() - started, replaces if met else 0.0)
+
+    def sleep(self, seconds):
+        """A fixed sleep that is still on the critical path"""
+        time.sleep(seconds)
+        self._record("slept", seconds)
+
+    def report(self):
+        """Print waited/slept/reclaimed seconds per test"""
+        if not self.records:
+            return
+        print("\n⏳ Wait budget (seconds)")
+        print(f"   {'Test':<40} {'waited':>8} {'slept':>8} {'reclaimed':>10}")
+        for test, entry in self.records.items():
+            print(f"   {test[-40:]:<40} {entry['waited']:>8.2f} {entry['slept']:>8.2f} {entry['reclaimed']:>10.2f}")
+
+
+default_recorder = WaitRecorder()
+
+wait_for = default_recorder.wait_for
+sleep = default_recorder.sleep
+report = default_recorder.report
@@ -6,24 +6,61 @@ Demonstrates real-world testing scenario for customer demo
 
 import time
 import os
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from coder_selenium.driver_factory import create_driver, default_factory
+from coder_selenium.history import RunHistory
+from coder_selenium.fixture_app import FixtureServer
+from coder_selenium.screenshot_store import ScreenshotStore
+from coder_selenium.screenshots import ScreenshotService
+from coder_selenium.session_pool import close_pool, open_pool
+from coder_selenium.viewports import ViewportMatrix, devices_from_env
+from coder_selenium import batch, flight_recorder, governor, timeouts, waits
+from coder_selenium.auth_state import AuthStateCache
+from coder_selenium.context import begin_test, current_test
+from coder_selenium.instrumentation import timings
+from coder_selenium.load import LoadTest
+from coder_selenium.nav_timing import navigation
+from coder_selenium.network_policy import policy_from_env
+from coder_selenium.results import ResultSink, render_html
+
+SAUCEDEMO_URL = "https://www.saucedemo.com/"
+USERNAME = "standard_user"
+PASSWORD = "secret_sauce"
+HISTORY_SUITE = "ecommerce-selenium-test"
+RESULTS_JSONL = "/home/coder/test_results.jsonl"
+RESULTS_JUNIT = "/home/coder/test_results.xml"
+# Longest any one test may spend waiting on lookups and explicit waits
+TEST_DEADLINE = float(os.environ.get("SELENIUM_TEST_DEADLINE", "120"))
+
 class EcommerceTest:
     """Test an e-commerce website (using a demo site)"""
     
-    def __init__(self):
+    def __init__(self, pool=None, local=False, base_url=None, pool_size=1):
         """Initialize the test with Chrome options"""
+        # Target the bundled fixture app instead of the live site when local
+        self.fixture = FixtureServer().start() if local else None
+        self.base_url = self.fixture.base_url if local else (base_url or SAUCEDEMO_URL)
+        self.pool = pool
+        self.pool_size = pool_size
+        self.owns_pool = pool is None
+        self.screenshots = ScreenshotService(store=ScreenshotStore())
+        self.auth_cache = AuthStateCache()
+        self.devices = devices_from_env()
+        # Every result is on disk (and tail-able) the moment it is logged
+        self.sink = ResultSink(RESULTS_JSONL, RESULTS_JUNIT, HISTORY_SUITE)
+        # The fixture app itself must never be blocked; any port, so warm browsers stay
+        # valid when a later run starts the fixture elsewhere
+        self.network_policy = policy_from_env(allow=["http://127.0.0.1:*"] if local else [])
         self.setup_driver()
         self.results = []
     
     def setup_driver(self):
-        """Configure Chrome for headless testing"""
+        """Configure Chrome for headless testing and lease a browser"""
         chrome_options = Options()
         chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
@@ -44,40 +81,40 @@ class EcommerceTest:
                 chrome_options.binary_location = path
                 break
         
-        try:
-            # Try Selenium Grid first
-            self.driver = webdriver.Remote(
-                command_executor='http://localhost:4444',
-                options=chrome_options
-            )
-            print("✅ Connected to Selenium Grid")
-        except:
-            # Fallback to direct ChromeDriver
-            from selenium.webdriver.chrome.service import Service
-            service = Service('/home/coder/selenium-drivers/chromedriver')
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            print("✅ Using direct ChromeDriver connection")
+        if self.pool is None:
+            pool_key = ("ecommerce-selenium-test", tuple(chrome_options.arguments),
+                        self.network_policy.name, tuple(self.network_policy.allow))
+            self.pool = open_pool(pool_key, lambda: create_driver(chrome_options, self.network_policy),
+                                  size=self.pool_size)
         
-        self.driver.implicitly_wait(10)
-        self.wait = WebDriverWait(self.driver, 15)
+        self.driver = self.pool.lease()
+        self.wait = timeouts.wait(self.driver, 15)
     
-    def log_result(self, test_name, status, details=""):
-        """Log test results"""
+    def log_result(self, test_name, status, details="", capture=True):
+        """Log test results; failures dump the flight recorder unless `capture` is off"""
         result = {
             "test": test_name,
             "status": "✅ PASS" if status else "❌ FAIL",
             "details": details
         }
         self.results.append(result)
+        self.sink.record(test_name, "pass" if status else "fail", details,
+                         backend=getattr(getattr(self, "driver", None), "backend", None))
         print(f"{result['status']} {test_name}: {details}")
+        if not status and capture and hasattr(self, "driver"):
+            try:
+                flight_recorder.dump(self.driver, test_name, details)
+            except OSError as e:
+                print(f"⚠️  Flight recorder dump failed: {e}")
     
     def test_homepage_load(self):
         """Test 1: Verify homepage loads correctly"""
         print("\n🏠 Testing Homepage Load...")
+        begin_test("Homepage Load")
         
         try:
             # Using a real demo e-commerce site
-            self.driver.get("https://www.saucedemo.com/")
+            self.driver.get(self.base_url)
             
             # Verify page loaded
             self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "login_logo")))
@@ -86,8 +123,9 @@ class EcommerceTest:
             title = self.driver.title
             self.log_result("Homepage Load", True, f"Page title: {title}")
             
-            # Take screenshot
-            self.driver.save_screenshot("/home/coder/test_homepage.png")
+            # Success screenshots only when every artifact is kept
+            if flight_recorder.default_recorder.success_artifacts:
+                self.screenshots.capture(self.driver, "/home/coder/test_homepage.png")
             
             return True
             
@@ -98,10 +136,11 @@ class EcommerceTest:
     def test_user_login(self):
         """Test 2: Test user login functionality"""
         print("\n🔐 Testing User Login...")
+        begin_test("User Login")
         
         try:
             # Navigate to login page
-            self.driver.get("https://www.saucedemo.com/")
+            self.driver.get(self.base_url)
             
             # Find login elements
             username_field = self.wait.until(
@@ -111,8 +150,8 @@ class EcommerceTest:
             login_button = self.driver.find_element(By.ID, "login-button")
             
             # Enter credentials (using demo site credentials)
-            username_field.send_keys("standard_user")
-            password_field.send_keys("secret_sauce")
+            username_field.send_keys(USERNAME)
+            password_field.send_keys(PASSWORD)
             
             # Click login
             login_button.click()
@@ -123,23 +162,49 @@ class EcommerceTest:
             )
             
             self.log_result("User Login", True, "Successfully logged in")
-            self.driver.save_screenshot("/home/coder/test_login_success.png")
+            
+            # Later journeys restore this state instead of using the login form
+            self.auth_cache.capture(self.driver, USERNAME, self.base_url)
+            if flight_recorder.default_recorder.success_artifacts:
+                self.screenshots.capture(self.driver, "/home/coder/test_login_success.png")
             
             return True
             
         except Exception as e:
             self.log_result("User Login", False, str(e))
-            self.driver.save_screenshot("/home/coder/test_login_failed.png")
             return False
     
+    def ensure_logged_in(self):
+        """Restore a cached login snapshot, falling back to the login form"""
+        token = self.auth_cache.restore(self.driver, USERNAME, self.base_url)
+        if token is not None:
+            self.driver.get(self.base_url.rstrip("/") + "/inventory.html")
+            self.auth_cache.finish_restore(self.driver, token)
+            # An expired or revoked session bounces back to the login page
+            landed = timeouts.wait(self.driver, 10).until(lambda d: d.execute_script(
+                "return document.querySelector('.inventory_list') ? 'inventory'"
+                " : document.getElementById('login-button') ? 'login' : null;"
+            ))
+            if landed == "inventory":
+                print("🔑 Restored cached login state")
+                return True
+            print("⚠️  Cached login state rejected, logging in through the form")
+            self.auth_cache.invalidate(USERNAME, self.base_url)
+        
+        test_name = current_test()
+        logged_in = self.test_user_login()
+        begin_test(test_name)
+        return logged_in
+    
     def test_product_search_and_add_to_cart(self):
         """Test 3: Search for products and add to cart"""
         print("\n🛒 Testing Product Search and Add to Cart...")
+        begin_test("Add to Cart")
         
         try:
             # Ensure we're logged in
             if "inventory" not in self.driver.current_url:
-                self.test_user_login()
+                self.ensure_logged_in()
             
             # Find all products
             products = self.wait.until(
@@ -148,11 +213,13 @@ class EcommerceTest:
             
             print(f"Found {len(products)} products")
             
-            # Add first product to cart
-            first_product = products[0]
-            product_name = first_product.find_element(By.CLASS_NAME, "inventory_item_name").text
-            add_button = first_product.find_element(By.CSS_SELECTOR, "button[class*='btn_inventory']")
-            add_button.click()
+            # Add first product to cart (name and button read in one round trip)
+            first_product = batch.query(self.driver, {
+                "name": (By.CLASS_NAME, "inventory_item_name", ["text"]),
+                "add": (By.CSS_SELECTOR, "button[class*='btn_inventory']", ["element"])
+            }, root=products[0], label="Add to Cart")
+            product_name = first_product["name"][0]["text"]
+            first_product["add"][0]["element"].click()
             
             # Verify cart badge updated
             cart_badge = self.wait.until(
@@ -166,9 +233,9 @@ class EcommerceTest:
                 f"Added '{product_name}' to cart. Cart count: {cart_count}"
             )
             
-            # Add another product
+            # Add another product and wait for the badge to count it
             products[1].find_element(By.CSS_SELECTOR, "button[class*='btn_inventory']").click()
-            time.sleep(1)
+            waits.wait_for(self.driver, waits.cart_badge_equals(int(cart_count) + 1), replaces=1)
             
             # Check updated cart count
             cart_count = self.driver.find_element(By.CLASS_NAME, "shopping_cart_badge").text
@@ -183,6 +250,7 @@ class EcommerceTest:
     def test_checkout_process(self):
         """Test 4: Test the checkout process"""
         print("\n💳 Testing Checkout Process...")
+        begin_test("Checkout Process")
         
         try:
             # Click on cart
@@ -200,12 +268,14 @@ class EcommerceTest:
             checkout_button = self.driver.find_element(By.ID, "checkout")
             checkout_button.click()
             
-            # Fill checkout information
+            # Fill checkout information in a single round trip
             self.wait.until(EC.presence_of_element_located((By.ID, "first-name")))
             
-            self.driver.find_element(By.ID, "first-name").send_keys("Test")
-            self.driver.find_element(By.ID, "last-name").send_keys("User")
-            self.driver.find_element(By.ID, "postal-code").send_keys("12345")
+            batch.fill_form(self.driver, {
+                (By.ID, "first-name"): "Test",
+                (By.ID, "last-name"): "User",
+                (By.ID, "postal-code"): "12345"
+            }, label="Checkout Process")
             
             # Continue
             continue_button = self.driver.find_element(By.ID, "continue")
@@ -219,7 +289,8 @@ class EcommerceTest:
             total_price = total_label.text
             
             self.log_result("Checkout Process", True, f"Order total: {total_price}")
-            self.driver.save_screenshot("/home/coder/test_checkout_overview.png")
+            if flight_recorder.default_recorder.success_artifacts:
+                self.screenshots.capture(self.driver, "/home/coder/test_checkout_overview.png")
             
             # Complete order
             finish_button = self.driver.find_element(By.ID, "finish")
@@ -230,7 +301,8 @@ class EcommerceTest:
             complete_text = self.driver.find_element(By.CLASS_NAME, "complete-header").text
             
             self.log_result("Order Completion", True, complete_text)
-            self.driver.save_screenshot("/home/coder/test_order_complete.png")
+            if flight_recorder.default_recorder.success_artifacts:
+                self.screenshots.capture(self.driver, "/home/coder/test_order_complete.png")
             
             return True
             
@@ -241,35 +313,23 @@ class EcommerceTest:
     def test_responsive_design(self):
         """Test 5: Test responsive design on different screen sizes"""
         print("\n📱 Testing Responsive Design...")
+        begin_test("Responsive Design")
+        
+        def visit(driver, device):
+            # Verify key elements are visible
+            is_displayed = driver.find_element(By.CLASS_NAME, "login_logo").is_displayed()
+            
+            # The emulated tab closes after the visit, so its screenshot is taken here
+            if not is_displayed or flight_recorder.default_recorder.success_artifacts:
+                filename = f"/home/coder/test_responsive_{device.name.lower().replace(' ', '_')}.png"
+                self.screenshots.capture(driver, filename)
+            return is_displayed, f"{device.width}x{device.height} - Logo visible: {is_displayed}"
         
         try:
-            # Navigate to homepage
-            self.driver.get("https://www.saucedemo.com/")
-            
-            # Test different screen sizes
-            screen_sizes = [
-                {"name": "Mobile", "width": 375, "height": 667},
-                {"name": "Tablet", "width": 768, "height": 1024},
-                {"name": "Desktop", "width": 1920, "height": 1080}
-            ]
-            
-            for size in screen_sizes:
-                self.driver.set_window_size(size["width"], size["height"])
-                time.sleep(1)  # Allow time for responsive adjustments
-                
-                # Take screenshot
-                filename = f"/home/coder/test_responsive_{size['name'].lower()}.png"
-                self.driver.save_screenshot(filename)
-                
-                # Verify key elements are visible
-                login_logo = self.driver.find_element(By.CLASS_NAME, "login_logo")
-                is_displayed = login_logo.is_displayed()
-                
-                self.log_result(
-                    f"Responsive - {size['name']}", 
-                    is_displayed, 
-                    f"{size['width']}x{size['height']} - Logo visible: {is_displayed}"
-                )
+            # Every device renders the homepage in its own emulated tab at the same time
+            for result in ViewportMatrix(self.driver, self.devices).run(self.base_url, visit):
+                self.log_result(f"Responsive - {result.device.name}", result.passed, result.details,
+                                capture=False)
             
             return True
             
@@ -277,18 +337,49 @@ class EcommerceTest:
             self.log_result("Responsive Design", False, str(e))
             return False
     
+    def check_navigation_budgets(self):
+        """Fail any page whose load timings exceeded its budget"""
+        violations = navigation.violations()
+        for url, violation in violations:
+            self.log_result(f"Performance - {url}", False, violation, capture=False)
+        if not violations:
+            self.log_result("Performance Budgets", True, f"{len(navigation.pages)} page loads within budget")
+    
+    def run_recorded(self, history, test):
+        """Run one test method and store its outcome in the run history"""
+        logged = len(self.results)
+        started = time.perf_counter()
+        with timeouts.deadline(TEST_DEADLINE):
+            passed = test()
+        duration = time.perf_counter() - started
+        failures = [r for r in self.results[logged:] if "FAIL" in r["status"]]
+        error = failures[-1]["details"] if failures else None
+        outcome = "pass" if passed and not failures else "fail"
+        history.record(HISTORY_SUITE, test.__name__, outcome, duration,
+                       getattr(self.driver, "backend", None), error)
+        return passed
+    
     def run_all_tests(self):
         """Run all e-commerce tests"""
         print("\n" + "="*60)
         print("🛍️  E-COMMERCE WEBSITE TESTING SUITE")
         print("="*60)
         
-        # Run tests
-        self.test_homepage_load()
-        self.test_user_login()
-        self.test_product_search_and_add_to_cart()
-        self.test_checkout_process()
-        self.test_responsive_design()
+        # Run tests, recently failing groups first; the journey steps depend on each other
+        groups = {
+            "Homepage Load": [self.test_homepage_load],
+            "Checkout Journey": [self.test_user_login,
+                                 self.test_product_search_and_add_to_cart,
+                                 self.test_checkout_process],
+            "Responsive Design": [self.test_responsive_design],
+        }
+        members = {name: [t.__name__ for t in tests] for name, tests in groups.items()}
+        history = RunHistory()
+        history.start_run(HISTORY_SUITE)
+        for name in history.order(HISTORY_SUITE, list(groups), members):
+            for test in groups[name]:
+                self.run_recorded(history, test)
+        self.check_navigation_budgets()
         
         # Print summary
         print("\n" + "="*60)
@@ -309,102 +400,139 @@ class EcommerceTest:
             if result['details']:
                 print(f"     → {result['details']}")
         
+        history.report(HISTORY_SUITE)
+        history.close()
+        waits.report()
+        timeouts.report()
+        flight_recorder.report()
+        timeouts.save()
+        batch.report()
+        timings.report()
+        governor.report()
+        default_factory.dispatcher.report()
+        self.network_policy.report()
+        
         # Generate HTML report
         self.generate_html_report()
     
+    def checkout_journey(self, driver, step):
+        """One virtual user: login → add to cart → checkout overview → complete"""
+        wait = timeouts.wait(driver, 15)
+        
+        with step("login"):
+            driver.get(self.base_url)
+            wait.until(EC.presence_of_element_located((By.ID, "user-name")))
+            batch.fill_form(driver, {(By.ID, "user-name"): USERNAME, (By.ID, "password"): PASSWORD},
+                            label="Load Login")
+            driver.find_element(By.ID, "login-button").click()
+            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "inventory_list")))
+        
+        with step("add to cart"):
+            driver.find_element(By.CSS_SELECTOR, ".inventory_item button[class*='btn_inventory']").click()
+            waits.wait_for(driver, waits.cart_badge_equals(1))
+        
+        with step("checkout overview"):
+            driver.find_element(By.CLASS_NAME, "shopping_cart_link").click()
+            wait.until(EC.element_to_be_clickable((By.ID, "checkout"))).click()
+            wait.until(EC.presence_of_element_located((By.ID, "first-name")))
+            batch.fill_form(driver, {
+                (By.ID, "first-name"): "Load",
+                (By.ID, "last-name"): "User",
+                (By.ID, "postal-code"): "12345"
+            }, label="Load Checkout")
+            driver.find_element(By.ID, "continue").click()
+            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "summary_info")))
+        
+        with step("complete"):
+            driver.find_element(By.ID, "finish").click()
+            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "complete-header")))
+    
+    def run_load(self, users, ramp_up, duration, interval=10):
+        """Run the checkout journey as concurrent virtual users"""
+        print("\n" + "="*60)
+        print(f"🚦 E-COMMERCE LOAD TEST against {self.base_url}")
+        print("="*60)
+        
+        # Every virtual user leases its own browser; give ours back to the pool
+        self.pool.release(self.driver)
+        load = LoadTest(self.pool, self.checkout_journey, users=users, ramp_up=ramp_up,
+                        duration=duration, interval=interval,
+                        steps=("login", "add to cart", "checkout overview", "complete"))
+        load.run()
+        load.report()
+        timeouts.save()
+        print(f"\n📄 Load results saved: {load.write_json()}")
+        governor.report()
+        default_factory.dispatcher.report()
+        governor.write_json("/home/coder/load_resources.json")
+        return load
+    
     def generate_html_report(self):
         """Generate an HTML report of test results"""
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Selenium Test Report - Coder Workspace</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1 {{ color: #333; }}
-                .summary {{ background: #f0f0f0; padding: 15px; border-radius: 5px; margin: 20px 0; }}
-                .pass {{ color: green; }}
-                .fail {{ color: red; }}
-                table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
-                th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
-                th {{ background-color: #4CAF50; color: white; }}
-                tr:nth-child(even) {{ background-color: #f2f2f2; }}
-                .screenshot {{ margin: 10px 0; }}
-                img {{ max-width: 400px; border: 1px solid #ddd; }}
-            </style>
-        </head>
-        <body>
-            <h1>🛍️ E-commerce Testing Report</h1>
-            <p>Generated from Coder Workspace Selenium Tests</p>
-            
-            <div class="summary">
-                <h2>Test Summary</h2>
-                <p>Total Tests: {len(self.results)}</p>
-                <p class="pass">✅ Passed: {sum(1 for r in self.results if "PASS" in r["status"])}</p>
-                <p class="fail">❌ Failed: {sum(1 for r in self.results if "FAIL" in r["status"])}</p>
-            </div>
-            
-            <h2>Test Results</h2>
-            <table>
-                <tr>
-                    <th>Test Name</th>
-                    <th>Status</th>
-                    <th>Details</th>
-                </tr>
-        """
+        # Screenshots are written in the background; make sure they exist before linking
+        self.screenshots.flush()
         
-        for result in self.results:
-            status_class = "pass" if "PASS" in result["status"] else "fail"
-            html_content += f"""
-                <tr>
-                    <td>{result['test']}</td>
-                    <td class="{status_class}">{result['status']}</td>
-                    <td>{result['details']}</td>
-                </tr>
-            """
-        
-        html_content += """
-            </table>
-            
+        changed = self.screenshots.changed()
+        unchanged = len(self.screenshots.stored) - len(changed)
+        screenshots = f"""
             <h2>Screenshots</h2>
-            <p>Screenshots are saved in /home/coder/ directory</p>
-            
+            <p>Only screenshots that are new or differ from the baseline are shown
+               ({unchanged} unchanged). Images are stored in {self.screenshots.store.root}</p>
+        """ + "".join(f"""
             <div class="screenshot">
-                <h3>Homepage</h3>
-                <img src="test_homepage.png" alt="Homepage Screenshot">
+                <h3>{shot.name} ({shot.status}, {shot.score:.1%} of page differs)</h3>
+                <img src="{os.path.relpath(shot.path, '/home/coder')}" alt="{shot.name} Screenshot">
             </div>
-            
-            <div class="screenshot">
-                <h3>Checkout Overview</h3>
-                <img src="test_checkout_overview.png" alt="Checkout Screenshot">
-            </div>
-            
-            <div class="screenshot">
-                <h3>Order Complete</h3>
-                <img src="test_order_complete.png" alt="Order Complete Screenshot">
-            </div>
-        </body>
-        </html>
-        """
+            """ for shot in changed)
         
-        # Save report
-        with open("/home/coder/test_report.html", "w") as f:
-            f.write(html_content)
+        # Rendered from the result stream, page by page, so soak runs stay in constant memory
+        render_html(self.sink.jsonl_path, "/home/coder/test_report.html",
+                    "🛍️ E-commerce Testing Report", extra_html=screenshots)
         
         print("\n📄 HTML report generated: /home/coder/test_report.html")
+        timings.write_json("/home/coder/test_timings.json")
+        governor.write_json("/home/coder/test_resources.json")
+        navigation.write_json("/home/coder/test_navigation.json")
     
     def cleanup(self):
         """Clean up resources"""
+        self.screenshots.close()
+        self.sink.close()
         if hasattr(self, 'driver'):
-            self.driver.quit()
+            self.pool.release(self.driver)  # no-op if already returned
+        if self.owns_pool and self.pool is not None:
+            close_pool(self.pool)
+        if self.fixture:
+            self.fixture.stop()
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="E-commerce Selenium tests for Coder Workspace")
+    parser.add_argument("--local", action="store_true",
+                        default=os.environ.get("ECOMMERCE_TARGET") == "local",
+                        help="run against the bundled fixture app instead of saucedemo.com")
+    parser.add_argument("--base-url", default=os.environ.get("ECOMMERCE_URL"),
+                        help="run against another deployment of the shop, e.g. staging")
+    parser.add_argument("--load", type=int, metavar="USERS", default=0,
+                        help="load mode: run the checkout journey as USERS concurrent browsers")
+    parser.add_argument("--ramp-up", type=float, default=30,
+                        help="seconds over which load-mode users start (default: 30)")
+    parser.add_argument("--duration", type=float, default=120,
+                        help="load-mode run time in seconds (default: 120)")
+    parser.add_argument("--report-interval", type=float, default=10,
+                        help="seconds between live load-mode reports (default: 10)")
+    args = parser.parse_args()
+    
     # Create and run test suite
-    tester = EcommerceTest()
+    tester = EcommerceTest(local=args.local, base_url=args.base_url, pool_size=max(1, args.load))
     
     try:
-        tester.run_all_tests()
+        if args.load:
+            tester.run_load(args.load, args.ramp_up, args.duration, args.report_interval)
+        else:
+            tester.run_all_tests()
     except Exception as e:
         print(f"\n❌ Test suite failed with error: {e}")
     finally:
@@ -429,20 +429,33 @@ Xvfb :99 -screen 0 1920x1080x24 -ac +extension GLX +render -noreset > /dev/null
 # Wait for Xvfb to start
 sleep 2
 
-# Start Selenium Grid with Chrome options configuration
+# Start Selenium Grid: a hub plus one single-slot Chrome node per CPU core, so a wedged
+# node only stalls its own session and clients can pick the least-loaded node
 cd /home/coder/selenium-drivers
-cat > /home/coder/selenium-config.toml << 'CONFIG'
+java -jar selenium-server.jar hub --session-request-timeout 60 > /home/coder/selenium.log 2>&1 &
+
+for i in $(seq 1 ${data.coder_parameter.cpu.value}); do
+# Each node advertises "coder:node" so a session can ask for a specific node
+cat > /home/coder/selenium-node-$i.toml << CONFIG
+[server]
+port = $((5555 + i))
+
+[events]
+publish = "tcp://localhost:4442"
+subscribe = "tcp://localhost:4443"
+
 [node]
 detect-drivers = false
+max-sessions = 1
 
 [[node.driver-configuration]]
 display-name = "Chrome"
 max-sessions = 1
 webdriver-executable = "/home/coder/selenium-drivers/chromedriver"
-stereotype = '{"browserName": "chrome", "browserVersion": "131", "platformName": "linux", "goog:chromeOptions": {"binary": "/usr/bin/google-chrome", "args": ["--headless", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu", "--disable-web-security", "--disable-features=VizDisplayCompositor", "--window-size=1920,1080"]}}'
+stereotype = '{"browserName": "chrome", "browserVersion": "131", "platformName": "linux", "goog:chromeOptions": {"binary": "/usr/bin/google-chrome", "args": ["--headless", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu", "--disable-web-security", "--disable-features=VizDisplayCompositor", "--window-size=1920,1080"]}, "coder:node": "node-$i"}'
 CONFIG
-
-java -jar selenium-server.jar standalone --config /home/coder/selenium-config.toml > /home/coder/selenium.log 2>&1 &
+java -jar selenium-server.jar node --config /home/coder/selenium-node-$i.toml > /home/coder/selenium-node-$i.log 2>&1 &
+done
 
 # Wait for Selenium to start
 sleep 5
@@ -576,8 +589,14 @@ echo -e "\nSelenium processes:"
 ps aux | grep -E "(java|selenium)" | grep -v grep
 echo -e "\nSelenium Grid status:"
 curl -s http://localhost:4444/wd/hub/status | jq . || echo "Grid not responding"
+echo -e "\nGrid nodes (busy/total slots):"
+curl -s http://localhost:4444/status | jq -r '.value.nodes[] | "\(.slots[0].stereotype["coder:node"] // .uri) \(.availability) \([.slots[] | select(.session != null)] | length)/\(.slots | length)"'
 echo -e "\nLast 20 lines of Selenium log:"
 tail -n 20 /home/coder/selenium.log
+for log in /home/coder/selenium-node-*.log; do
+  echo -e "\nLast 5 lines of $log:"
+  tail -n 5 "$log"
+done
 SCRIPT
 chmod +x /home/coder/check-selenium.sh
 
@@ -869,7 +888,7 @@ resource "coder_script" "selenium_testing" {
     /home/coder/selenium-env/bin/python quick-selenium-demo.py
     
     echo "Running selenium-test-suite.py..."
-    /home/coder/selenium-env/bin/python selenium-test-suite.py
+    /home/coder/selenium-env/bin/python selenium-test-suite.py --workers ${data.coder_parameter.cpu.value}
     
     echo "Running ecommerce-selenium-test.py..."
     /home/coder/selenium-env/bin/python ecommerce-selenium-test.py
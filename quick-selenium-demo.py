@@ -7,16 +7,28 @@ Shows that Selenium automation is working correctly
 import os
 import time
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 
+from coder_selenium.driver_factory import default_factory
+from coder_selenium import timeouts, waits
+from coder_selenium.context import begin_test, current_test
+from coder_selenium.instrumentation import timings
+from coder_selenium.nav_timing import navigation
+from coder_selenium.network_policy import PROFILES, policy_from_env
+from coder_selenium.screenshots import ScreenshotService
+from coder_selenium.tabs import PageGroup
+
 def print_banner(text):
     """Print a formatted banner"""
     print("\n" + "="*60)
     print(f"  {text}")
     print("="*60)
 
+def format_ms(value):
+    """A timing in ms, or n/a when the browser didn't report it"""
+    return "n/a" if value is None else f"{value:.0f}ms"
+
 def main():
     print_banner("🚀 SELENIUM AUTOMATION DEMO - CODER WORKSPACE")
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -43,32 +55,25 @@ def main():
             print(f"✅ Found Chrome at: {path}")
             break
     
-    # Initialize driver
-    driver = None
-    try:
-        # Try Selenium Grid first
-        print("\n🔌 Attempting to connect to Selenium Grid...")
-        driver = webdriver.Remote(
-            command_executor='http://localhost:4444',
-            options=chrome_options
-        )
+    # Initialize driver on whichever backend the Grid probe picks
+    print("\n🔌 Probing Selenium Grid...")
+    network_policy = policy_from_env()
+    driver = default_factory.create(chrome_options, network_policy)
+    if driver.backend == "grid":
         print("✅ Connected to Selenium Grid successfully!")
-        
-    except Exception as e:
-        print(f"⚠️  Grid connection failed: {e}")
-        print("🔄 Falling back to direct ChromeDriver...")
-        
-        from selenium.webdriver.chrome.service import Service
-        service = Service('/home/coder/selenium-drivers/chromedriver')
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+    else:
         print("✅ Connected via direct ChromeDriver!")
     
+    # Screenshots are written in the background while the demo keeps going
+    screenshots = ScreenshotService()
+    
     # Run demo tests
     print_banner("🧪 RUNNING AUTOMATED TESTS")
     
     try:
         # Test 1: Google Search
         print("\n📍 Test 1: Automated Google Search")
+        begin_test("Test 1: Google Search")
         driver.get("https://www.google.com")
         print(f"   → Navigated to: {driver.title}")
         
@@ -76,29 +81,37 @@ def main():
         search_box.send_keys("Coder development environments")
         search_box.submit()
         
-        time.sleep(2)  # Wait for results
+        # Wait for the results page to commit instead of a fixed 2s sleep
+        waits.wait_for(driver, waits.navigation_committed(url_contains="search"), replaces=2)
         print("   → Search completed successfully")
         
         # Take screenshot
         screenshot_path = "/home/coder/demo_google_search.png"
-        driver.save_screenshot(screenshot_path)
+        screenshots.capture(driver, screenshot_path)
         print(f"   → Screenshot saved: {screenshot_path}")
         
         # Test 2: Navigate multiple sites
         print("\n📍 Test 2: Multi-Site Navigation")
+        begin_test("Test 2: Multi-Site Navigation")
         sites = [
             ("https://github.com", "GitHub"),
             ("https://coder.com", "Coder"),
             ("https://example.com", "Example Domain")
         ]
         
-        for url, expected in sites:
-            driver.get(url)
-            time.sleep(1)
-            print(f"   → Visited {url} - Title: {driver.title}")
+        # One tab per site, all loading at once
+        started = time.perf_counter()
+        with PageGroup(driver, timeout=20) as group:
+            for (url, expected), tab in zip(sites, group.load(url for url, _ in sites)):
+                if tab.loaded:
+                    print(f"   → Visited {url} - Title: {tab.title} ({tab.elapsed:.1f}s)")
+                else:
+                    print(f"   ⚠️  {url} did not load: {tab.error}")
+        print(f"   → {len(sites)} sites in {time.perf_counter() - started:.1f}s")
         
         # Test 3: JavaScript execution
         print("\n📍 Test 3: JavaScript Automation")
+        begin_test("Test 3: JavaScript Automation")
         driver.get("https://example.com")
         
         # Inject custom content
@@ -108,28 +121,44 @@ def main():
         
         # Take screenshot of modified page
         screenshot_path = "/home/coder/demo_js_injection.png"
-        driver.save_screenshot(screenshot_path)
+        screenshots.capture(driver, screenshot_path)
         print(f"   → Modified page with JavaScript")
         print(f"   → Screenshot saved: {screenshot_path}")
         
         # Test 4: Performance metrics
         print("\n📍 Test 4: Performance Metrics")
-        driver.get("https://www.google.com")
+        begin_test("Test 4: Performance Metrics")
         
-        # Get performance timing
-        performance_timing = driver.execute_script("""
-            return {
-                loadTime: performance.timing.loadEventEnd - performance.timing.navigationStart,
-                domReady: performance.timing.domContentLoadedEventEnd - performance.timing.navigationStart,
-                resources: performance.getEntriesByType('resource').length
-            }
-        """)
+        # Performance numbers are only meaningful with every asset loading
+        PROFILES["full"].apply(driver)
+        driver.get("https://www.google.com")
         
-        print(f"   → Page Load Time: {performance_timing['loadTime']}ms")
-        print(f"   → DOM Ready Time: {performance_timing['domReady']}ms")
-        print(f"   → Resources Loaded: {performance_timing['resources']}")
+        # Timing is collected automatically after every driver.get; it is missing when
+        # the browser couldn't report it, and single metrics are None without a navigation entry
+        page = navigation.last()
+        if page is None or page["test"] != current_test():
+            print("   ⚠️  No navigation timing for this page")
+        else:
+            resource_count = sum(group["count"] for group in (page.get("resources") or {}).values())
+            
+            print(f"   → Time to First Byte: {format_ms(page['ttfb_ms'])}")
+            print(f"   → DOM Ready Time: {format_ms(page['dom_content_loaded_ms'])}")
+            print(f"   → Page Load Time: {format_ms(page['load_ms'])}")
+            cls = "n/a" if page.get("cls") is None else f"{page['cls']:.3f}"
+            print(f"   → Largest Contentful Paint: {format_ms(page['lcp_ms'])}, CLS: {cls}")
+            print(f"   → Resources Loaded: {resource_count} ({page['resource_transfer_bytes']} bytes)")
+        
+        violations = navigation.violations()
+        for url, violation in violations:
+            print(f"   ❌ Budget exceeded on {url}: {violation}")
+        if violations:
+            raise AssertionError(f"{len(violations)} navigation budget(s) exceeded")
         
         print_banner("✅ ALL TESTS COMPLETED SUCCESSFULLY!")
+        waits.report()
+        timeouts.report()
+        timings.report()
+        network_policy.report()
         
         # Summary
         print("\n📊 DEMO SUMMARY:")
@@ -156,9 +185,13 @@ def main():
         traceback.print_exc()
         
     finally:
+        screenshots.close()
         if driver:
             driver.quit()
             print("\n🧹 Cleanup completed - browser closed")
+        timings.write_json("/home/coder/demo_timings.json")
+        timeouts.save()
+        navigation.write_json("/home/coder/demo_navigation.json")
     
     print(f"\n⏱️  Demo completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -0,0 +1,267 @@
+#!/home/coder/selenium-env/bin/python3
+"""
+Selenium Stack Benchmark - Measures the infrastructure, not the site
+Session start, get, find_element, execute_script and screenshot costs for the Grid and
+direct ChromeDriver under different Chrome flag sets, compared against a saved baseline
+"""
+
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import selenium
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+
+from coder_selenium.driver_factory import CHROMEDRIVER_PATH, GRID_URL, DriverFactory
+from coder_selenium.fixture_app import FixtureServer
+from coder_selenium.instrumentation import percentile
+
+RESULTS_PATH = "/home/coder/selenium-benchmark.json"
+BASELINE_PATH = "/home/coder/selenium-benchmark-baseline.json"
+MAIN_TF = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.tf")
+
+# The Options every test script builds
+SCRIPT_FLAGS = ["--headless=new", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
+                "--window-size=1920,1080"]
+
+# Fallback copy of the Grid node stereotype args, used when main.tf isn't next to this script
+STEREOTYPE_FLAGS = ["--headless", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu",
+                    "--disable-web-security", "--disable-features=VizDisplayCompositor",
+                    "--window-size=1920,1080"]
+
+OPERATIONS = ["session_start", "session_quit", "get", "find_element", "execute_script", "save_screenshot"]
+
+
+def stereotype_flags(path=MAIN_TF):
+    """Chrome args from the Grid node stereotype in main.tf"""
+    try:
+        with open(path) as f:
+            match = re.search(r"stereotype = '(.*)'", f.read())
+        return json.loads(match.group(1))["goog:chromeOptions"]["args"]
+    except (OSError, AttributeError, ValueError, KeyError):
+        return STEREOTYPE_FLAGS
+
+
+def chrome_options(flags):
+    options = Options()
+    for flag in flags:
+        options.add_argument(flag)
+    for path in ['/usr/bin/google-chrome', '/usr/bin/google-chrome-stable',
+                 '/usr/bin/chromium-browser', '/usr/bin/chromium']:
+        if os.path.exists(path):
+            options.binary_location = path
+            break
+    return options
+
+
+def new_session(backend, flags):
+    """A bare driver: no instrumentation, so only Selenium and Chrome are measured"""
+    options = chrome_options(flags)
+    if backend == "grid":
+        return webdriver.Remote(command_executor=GRID_URL, options=options)
+    return webdriver.Chrome(service=Service(CHROMEDRIVER_PATH), options=options)
+
+
+def stats(samples):
+    """Summary of durations in seconds, reported in milliseconds"""
+    ms = [s * 1000 for s in samples]
+    return {
+        "n": len(ms),
+        "mean_ms": statistics.fmean(ms),
+        "stdev_ms": statistics.stdev(ms) if len(ms) > 1 else 0.0,
+        "min_ms": min(ms),
+        "p50_ms": percentile(ms, 50),
+        "p90_ms": percentile(ms, 90),
+        "p99_ms": percentile(ms, 99),
+        "max_ms": max(ms),
+    }
+
+
+def timed(fn, iterations, warmup):
+    """Run fn warmup + iterations times; return the timed durations"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def bench_sessions(backend, flags, iterations, warmup):
+    starts, quits = [], []
+    for i in range(warmup + iterations):
+        started = time.perf_counter()
+        driver = new_session(backend, flags)
+        created = time.perf_counter()
+        driver.quit()
+        if i >= warmup:
+            starts.append(created - started)
+            quits.append(time.perf_counter() - created)
+    return starts, quits
+
+
+def bench_commands(backend, flags, url, iterations, warmup):
+    driver = new_session(backend, flags)
+    screenshot = os.path.join(tempfile.gettempdir(), "selenium-benchmark.png")
+    try:
+        versions = {
+            "chrome": driver.capabilities.get("browserVersion"),
+            "chromedriver": driver.capabilities.get("chrome", {}).get("chromedriverVersion", "").split(" ")[0],
+        }
+        driver.get(url)
+        samples = {
+            "get": timed(lambda: driver.get(url), iterations, warmup),
+            "find_element": timed(lambda: driver.find_element(By.ID, "user-name"), iterations, warmup),
+            "execute_script": timed(lambda: driver.execute_script("return 1;"), iterations, warmup),
+            "save_screenshot": timed(lambda: driver.save_screenshot(screenshot), iterations, warmup),
+        }
+    finally:
+        driver.quit()
+    return samples, versions
+
+
+def run_benchmarks(backends, flag_sets, iterations, warmup, session_iterations):
+    fixture = FixtureServer().start()
+    url = fixture.base_url  # the login page: static HTML, no network beyond localhost
+    results, versions = {}, {}
+    try:
+        for backend in backends:
+            for name, flags in flag_sets.items():
+                key = f"{backend}/{name}"
+                print(f"\n⏱️  {key}: {' '.join(flags)}")
+                try:
+                    starts, quits = bench_sessions(backend, flags, session_iterations, 1)
+                    samples, versions[key] = bench_commands(backend, flags, url, iterations, warmup)
+                except Exception as e:
+                    print(f"   ❌ Skipped: {str(e).splitlines()[0]}")
+                    continue
+                samples.update(session_start=starts, session_quit=quits)
+                results[key] = {op: stats(samples[op]) for op in OPERATIONS}
+                for op in OPERATIONS:
+                    s = results[key][op]
+                    print(f"   {op:<16} p50 {s['p50_ms']:8.1f} ms   p90 {s['p90_ms']:8.1f} ms"
+                          f"   ±{s['stdev_ms']:.1f} (n={s['n']})")
+    finally:
+        fixture.stop()
+    return results, versions
+
+
+def compare(current, baseline, tolerance, floor_ms):
+    """Print p50 deltas against the baseline; return the regressions"""
+    print("\n" + "="*60)
+    print("📊 COMPARISON WITH BASELINE (p50)")
+    print("="*60)
+    for key, version in current["versions"].items():
+        old = baseline.get("versions", {}).get(key, {})
+        for component, value in version.items():
+            if old.get(component) and old[component] != value:
+                print(f"🔄 {key} {component}: {old[component]} → {value}")
+    old_selenium = baseline.get("meta", {}).get("selenium")
+    if old_selenium and old_selenium != current["meta"]["selenium"]:
+        print(f"🔄 selenium: {old_selenium} → {current['meta']['selenium']}")
+
+    regressions = []
+    for key, ops in current["results"].items():
+        base_ops = baseline.get("results", {}).get(key)
+        if not base_ops:
+            print(f"   {key}: not in baseline")
+            continue
+        for op, s in ops.items():
+            if op not in base_ops:
+                continue
+            before, after = base_ops[op]["p50_ms"], s["p50_ms"]
+            change = (after - before) / before if before else 0.0
+            # Sub-millisecond operations are too noisy for a relative threshold alone
+            regressed = change > tolerance and after - before > floor_ms
+            marker = "❌" if regressed else ("✅" if change < -tolerance else "  ")
+            print(f"{marker} {key:<24} {op:<16} {before:8.1f} → {after:8.1f} ms ({change:+.0%})")
+            if regressed:
+                regressions.append((key, op, before, after))
+    return regressions
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the Selenium stack in this workspace")
+    parser.add_argument("--backend", choices=["grid", "direct", "both"], default="both")
+    parser.add_argument("--flags", action="append", default=[], metavar="NAME=ARGS",
+                        help='extra Chrome flag set, e.g. --flags "lean=--headless=new --no-sandbox"')
+    parser.add_argument("--iterations", type=int, default=30, help="timed iterations per command")
+    parser.add_argument("--warmup", type=int, default=5, help="untimed iterations per command")
+    parser.add_argument("--sessions", type=int, default=5, help="timed session start/quit cycles")
+    parser.add_argument("--output", default=RESULTS_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed p50 slowdown before a regression is reported (default: 0.2 = 20%%)")
+    parser.add_argument("--floor-ms", type=float, default=2.0,
+                        help="ignore slowdowns smaller than this many milliseconds (default: 2)")
+    args = parser.parse_args()
+
+    flag_sets = {"scripts": SCRIPT_FLAGS, "stereotype": stereotype_flags()}
+    for spec in args.flags:
+        name, _, flags = spec.partition("=")
+        flag_sets[name] = flags.split()
+
+    backends = ["grid", "direct"] if args.backend == "both" else [args.backend]
+    if "grid" in backends and not DriverFactory().probe_grid():
+        print(f"⚠️  Selenium Grid at {GRID_URL} is not ready; benchmarking direct ChromeDriver only")
+        backends.remove("grid")
+
+    print("="*60)
+    print("  🏁 SELENIUM STACK BENCHMARK")
+    print("="*60)
+    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Iterations: {args.iterations} (+{args.warmup} warmup), sessions: {args.sessions}")
+
+    results, versions = run_benchmarks(backends, flag_sets, args.iterations, args.warmup, args.sessions)
+    current = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "selenium": selenium.__version__,
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "sessions": args.sessions,
+        },
+        "flag_sets": flag_sets,
+        "versions": versions,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(current, f, indent=2)
+    print(f"\n📄 Results saved: {args.output}")
+
+    regressions = []
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"📌 Baseline saved: {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(current, json.load(f), args.tolerance, args.floor_ms)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        else:
+            print("\n✅ No regressions against the baseline")
+    else:
+        print(f"ℹ️  No baseline at {args.baseline}; run with --save-baseline to create one")
+
+    return 1 if regressions or not results else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/home/coder/selenium-env/bin/python3
+"""
+Selenium Daemon Client - Run test scripts in the warm test daemon
+Only the standard library is imported here, so a run starts in milliseconds
+
+Examples:
+    ./selenium-client.py selenium-test-suite.py test_01_google_search
+    ./selenium-client.py ecommerce-selenium-test.py --local
+    ./selenium-client.py --status
+    ./selenium-client.py --stop
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+SOCKET_PATH = os.environ.get("SELENIUM_DAEMON_SOCKET", "/home/coder/.selenium-daemon.sock")
+DAEMON_LOG = "/home/coder/selenium-daemon.log"
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def connect():
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(SOCKET_PATH)
+    return sock
+
+
+def start_daemon(timeout=60):
+    """Launch the daemon in the background and wait until it accepts connections"""
+    print(f"🚀 Starting Selenium daemon (log: {DAEMON_LOG})", file=sys.stderr)
+    with open(DAEMON_LOG, "a") as log:
+        subprocess.Popen([sys.executable, "-u", "-m", "coder_selenium.daemon"], cwd=REPO_DIR,
+                         stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                         start_new_session=True)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            return connect()
+        except OSError:
+            time.sleep(0.1)
+    sys.exit(f"❌ Daemon did not start within {timeout}s; see {DAEMON_LOG}")
+
+
+def stop_daemon(timeout=60):
+    """Ask the daemon to stop and wait until its socket is gone"""
+    for _ in request({"cmd": "stop"}, autostart=False):
+        pass
+    deadline = time.monotonic() + timeout
+    while os.path.exists(SOCKET_PATH) and time.monotonic() < deadline:
+        time.sleep(0.1)
+
+
+def request(message, autostart=True):
+    """Send one request and yield the daemon's replies"""
+    try:
+        sock = connect()
+    except OSError:
+        if not autostart:
+            sys.exit("ℹ️  Selenium daemon is not running")
+        sock = start_daemon()
+    with sock, sock.makefile("rb") as replies:
+        sock.sendall((json.dumps(message) + "\n").encode())
+        for line in replies:
+            yield json.loads(line)
+
+
+def main(argv):
+    if not argv or argv[0] in ("-h", "--help"):
+        print(__doc__.strip())
+        return 0
+    if argv[0] == "--status":
+        for reply in request({"cmd": "status"}, autostart=False):
+            print(json.dumps(reply["status"], indent=2))
+        return 0
+    if argv[0] == "--stop":
+        for reply in request({"cmd": "stop"}, autostart=False):
+            print("👋 Selenium daemon stopping")
+        return 0
+    if argv[0] == "--start":
+        for reply in request({"cmd": "status"}):
+            print(f"✅ Selenium daemon running (pid {reply['status']['pid']})")
+        return 0
+
+    script = os.path.abspath(argv[0])
+    if not os.path.exists(script):
+        script = os.path.join(REPO_DIR, argv[0])
+    message = {"cmd": "run", "script": script, "args": argv[1:],
+               "cwd": os.getcwd(), "env": dict(os.environ)}
+    code = 1
+    for attempt in range(2):
+        restart = None
+        for reply in request(message):
+            if "out" in reply:
+                sys.stdout.write(reply["out"])
+                sys.stdout.flush()
+            if "exit" in reply:
+                code = reply["exit"]
+            restart = reply.get("restart", restart)
+        if not restart:
+            return code
+        # The new daemon inherits this environment, so the retry runs with it
+        print(f"🔄 {', '.join(restart)} changed since the daemon started; restarting it", file=sys.stderr)
+        stop_daemon()
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -5,19 +5,41 @@ Demonstrates various automated testing scenarios
 """
 
 import unittest
-import time
 import os
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
 
+from coder_selenium.driver_factory import create_driver, default_factory
+from coder_selenium.history import RunHistory, history_result_class, record_result
+from coder_selenium.parallel import iter_tests, run_parallel
+from coder_selenium.screenshot_store import ScreenshotStore
+from coder_selenium.screenshots import ScreenshotService
+from coder_selenium.session_pool import close_pool, open_pool
+from coder_selenium.static import NeedsBrowser, StaticDriver, is_static_eligible, static_eligible
+from coder_selenium.tabs import PageGroup
+from coder_selenium import batch, flight_recorder, governor, static, timeouts, waits
+from coder_selenium.context import begin_test
+from coder_selenium.instrumentation import timings
+from coder_selenium.nav_timing import navigation
+from coder_selenium.network_policy import policy_from_env
+from coder_selenium.replay_proxy import MODES, ReplayProxy
+from coder_selenium.results import ResultSink
+
+@flight_recorder.dump_on_failure
 class CoderSeleniumTests(unittest.TestCase):
     """Test suite demonstrating Selenium automation in Coder Workspace"""
     
+    # Warm browsers kept by the session pool, and how often each is reused
+    pool_size = int(os.environ.get("SELENIUM_POOL_SIZE", "1"))
+    pool_max_uses = int(os.environ.get("SELENIUM_POOL_MAX_USES", "20"))
+    # passthrough (live network), record or replay through the local proxy
+    network_mode = os.environ.get("SELENIUM_NETWORK_MODE", "passthrough")
+    # No single test may spend longer than this waiting on lookups and explicit waits
+    test_deadline = float(os.environ.get("SELENIUM_TEST_DEADLINE", "120"))
+    
     @classmethod
     def setUpClass(cls):
         """Set up Chrome options for headless testing"""
@@ -40,29 +62,66 @@ class CoderSeleniumTests(unittest.TestCase):
             if os.path.exists(path):
                 cls.chrome_options.binary_location = path
                 break
+        
+        # Route Chrome through the record/replay proxy unless running live
+        cls.proxy = ReplayProxy(cls.network_mode, "selenium-test-suite").start()
+        cls.proxy.configure(cls.chrome_options)
+        
+        # Network profile (full/lean) applied to every session at start
+        cls.network_policy = policy_from_env()
+        
+        # Screenshots are decoded and stored by content hash off the test thread
+        cls.screenshots = ScreenshotService(store=ScreenshotStore())
+        
+        # Keep warm browsers around instead of launching one per test (and, under the
+        # daemon, across runs; proxied browsers are tied to this run's proxy port)
+        pool_key = None if cls.proxy.active else (
+            "selenium-test-suite", tuple(cls.chrome_options.arguments), cls.network_policy.name
+        )
+        cls.pool = open_pool(
+            pool_key,
+            cls._create_driver,
+            size=cls.pool_size,
+            max_uses=cls.pool_max_uses
+        )
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Quit all pooled browsers and finish pending screenshots"""
+        close_pool(cls.pool)
+        cls.proxy.stop()
+        cls.screenshots.close()
+        cls.network_policy.report()
+    
+    @classmethod
+    def _create_driver(cls):
+        """Launch a new browser for the session pool"""
+        return create_driver(cls.chrome_options, cls.network_policy)
     
     def setUp(self):
-        """Create a new browser instance for each test"""
-        try:
-            # Try connecting to Selenium Grid first
-            self.driver = webdriver.Remote(
-                command_executor='http://localhost:4444',
-                options=self.chrome_options
-            )
-        except Exception as e:
-            print(f"Failed to connect to Selenium Grid: {e}")
-            print("Falling back to direct ChromeDriver connection...")
-            # Fallback to direct ChromeDriver
-            from selenium.webdriver.chrome.service import Service
-            service = Service('/home/coder/selenium-drivers/chromedriver')
-            self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-        
-        self.driver.implicitly_wait(10)
+        """Lease a warm browser from the pool for each test (DOM-only tests try without one)"""
+        begin_test(self.id().rsplit(".", 1)[-1])
+        self.enterContext(timeouts.deadline(self.test_deadline))
+        if is_static_eligible(getattr(self, self._testMethodName)):
+            proxy = f"http://127.0.0.1:{self.proxy.port}" if self.proxy.active else None
+            self.driver = StaticDriver(proxy=proxy)
+        else:
+            self.driver = self.pool.lease()
+    
+    def use_browser(self):
+        """Swap the static driver for a pooled browser"""
+        self.driver = self.pool.lease()
+        return self.driver
     
     def tearDown(self):
-        """Close the browser after each test"""
-        if self.driver:
-            self.driver.quit()
+        """Hand the browser back to the pool (reset or recycled)"""
+        if self.driver and not isinstance(self.driver, StaticDriver):
+            self.pool.release(self.driver)
+        
+        # Page-load regressions fail the test that loaded the page
+        violations = navigation.violations(self.id().rsplit(".", 1)[-1])
+        if violations:
+            self.fail("Navigation budget exceeded: " + "; ".join(f"{url}: {v}" for url, v in violations))
     
     def test_01_google_search(self):
         """Test 1: Basic Google search functionality"""
@@ -79,12 +138,12 @@ class CoderSeleniumTests(unittest.TestCase):
         
         # Wait for results - Google may have different IDs
         try:
-            WebDriverWait(self.driver, 10).until(
+            timeouts.wait(self.driver, 10).until(
                 EC.presence_of_element_located((By.ID, "search"))
             )
         except TimeoutException:
             # Try alternative selectors
-            WebDriverWait(self.driver, 10).until(
+            timeouts.wait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "[data-async-context]"))
             )
         
@@ -103,22 +162,23 @@ class CoderSeleniumTests(unittest.TestCase):
         self.assertIn("GitHub", self.driver.title)
         
         # Search for Coder repository
-        search_button = WebDriverWait(self.driver, 10).until(
+        search_button = timeouts.wait(self.driver, 10).until(
             EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-target='qbsearch-input.inputButtonText']"))
         )
         search_button.click()
         
-        search_input = WebDriverWait(self.driver, 10).until(
+        search_input = timeouts.wait(self.driver, 10).until(
             EC.presence_of_element_located((By.ID, "query-builder-test"))
         )
         search_input.send_keys("coder/coder")
         search_input.send_keys(Keys.RETURN)
         
-        # Wait for results
-        time.sleep(2)  # GitHub search can be slow
+        # Wait for the search results page instead of a fixed 2s sleep
+        waits.wait_for(self.driver, waits.navigation_committed(url_contains="search"), replaces=2)
         
         print("✅ Successfully searched GitHub")
     
+    @static_eligible
     def test_03_form_interaction(self):
         """Test 3: Form filling and submission"""
         print("\n📝 Test 3: Form Interaction")
@@ -129,11 +189,9 @@ class CoderSeleniumTests(unittest.TestCase):
         # Find and interact with form elements
         try:
             # Accept cookies if present
-            try:
-                accept_button = self.driver.find_element(By.ID, "accept-choices")
+            accept_button = timeouts.probe(self.driver, By.ID, "accept-choices")
+            if accept_button:
                 accept_button.click()
-            except:
-                pass  # No cookie banner
             
             # Scroll to the form example
             self.driver.execute_script("window.scrollTo(0, 500)")
@@ -143,6 +201,8 @@ class CoderSeleniumTests(unittest.TestCase):
             self.assertTrue(len(form_elements) > 0, "No form elements found")
             
             print(f"✅ Found {len(form_elements)} form input elements")
+        except NeedsBrowser:
+            raise
         except Exception as e:
             print(f"⚠️  Form interaction test skipped: {e}")
     
@@ -184,14 +244,18 @@ class CoderSeleniumTests(unittest.TestCase):
         
         # Take a screenshot
         screenshot_path = "/home/coder/selenium-screenshot.png"
-        self.driver.save_screenshot(screenshot_path)
+        self.screenshots.capture(self.driver, screenshot_path)
         
-        # Verify screenshot was created
+        # Verify screenshot was stored once the writer has caught up
+        self.screenshots.flush()
+        self.assertIn(screenshot_path, self.screenshots.stored, "Screenshot was not created")
+        stored = self.screenshots.stored[screenshot_path]
+        screenshot_path = stored.path
         self.assertTrue(os.path.exists(screenshot_path), "Screenshot was not created")
         file_size = os.path.getsize(screenshot_path)
         self.assertGreater(file_size, 0, "Screenshot file is empty")
         
-        print(f"✅ Screenshot saved: {screenshot_path} ({file_size} bytes)")
+        print(f"✅ Screenshot {stored.status}: {screenshot_path} ({file_size} bytes)")
     
     def test_06_wait_conditions(self):
         """Test 6: Demonstrate various wait conditions"""
@@ -203,13 +267,13 @@ class CoderSeleniumTests(unittest.TestCase):
         # Wait for specific element to be present
         try:
             # Wait for search box to be present
-            search_box = WebDriverWait(self.driver, 10).until(
+            search_box = timeouts.wait(self.driver, 10).until(
                 EC.presence_of_element_located((By.NAME, "q"))
             )
             print("✅ Search box is present")
             
             # Wait for title to contain specific text
-            WebDriverWait(self.driver, 10).until(
+            timeouts.wait(self.driver, 10).until(
                 EC.title_contains("Google")
             )
             print("✅ Page title contains 'Google'")
@@ -228,26 +292,23 @@ class CoderSeleniumTests(unittest.TestCase):
         # Get the main window handle
         main_window = self.driver.current_window_handle
         
-        # Open a new window using JavaScript
-        self.driver.execute_script("window.open('https://example.com', '_blank');")
-        
-        # Wait for new window
-        WebDriverWait(self.driver, 10).until(
-            lambda driver: len(driver.window_handles) > 1
-        )
-        
-        # Switch to new window
-        all_windows = self.driver.window_handles
-        self.driver.switch_to.window(all_windows[1])
-        
-        # Verify we're in the new window
-        self.assertIn("Example", self.driver.title)
-        print("✅ Switched to new window")
-        
-        # Switch back to main window
-        self.driver.switch_to.window(main_window)
-        print("✅ Switched back to main window")
+        # Open a new tab and wait for its own load event
+        with PageGroup(self.driver, timeout=10) as group:
+            tab, = group.load(["https://example.com"])
+            self.assertTrue(tab.loaded, tab.error)
+            
+            # Switch to new window
+            self.driver.switch_to.window(tab.handle)
+            
+            # Verify we're in the new window
+            self.assertIn("Example", self.driver.title)
+            print("✅ Switched to new window")
+            
+            # Switch back to main window
+            self.driver.switch_to.window(main_window)
+            print("✅ Switched back to main window")
     
+    @static_eligible
     def test_08_element_attributes(self):
         """Test 8: Read and verify element attributes"""
         print("\n🏷️  Test 8: Element Attributes")
@@ -255,18 +316,12 @@ class CoderSeleniumTests(unittest.TestCase):
         # Navigate to Google
         self.driver.get("https://www.google.com")
         
-        # Find the search box
-        search_box = self.driver.find_element(By.NAME, "q")
-        
-        # Get various attributes
-        attributes = {
-            "name": search_box.get_attribute("name"),
-            "tag": search_box.tag_name,
-            "class": search_box.get_attribute("class"),
-            "maxlength": search_box.get_attribute("maxlength"),
-            "title": search_box.get_attribute("title"),
-            "aria-label": search_box.get_attribute("aria-label")
-        }
+        # Find the search box and read its attributes in one round trip
+        attributes = batch.query_one(
+            self.driver, By.NAME, "q",
+            ["name", "tag", "class", "maxlength", "title", "aria-label"],
+            label="test_08_element_attributes"
+        )
         
         # Verify attributes
         self.assertEqual(attributes["name"], "q")
@@ -275,44 +330,100 @@ class CoderSeleniumTests(unittest.TestCase):
         print(f"✅ Element attributes: {attributes}")
 
 
+SUITE_NAME = "selenium-test-suite"
+RESULTS_JSONL = "/home/coder/suite_results.jsonl"
+RESULTS_JUNIT = "/home/coder/suite_results.xml"
+
+
 def run_individual_test(test_name):
     """Run a specific test by name"""
+    history = RunHistory()
+    history.start_run(SUITE_NAME)
+    sink = ResultSink(RESULTS_JSONL, RESULTS_JUNIT, SUITE_NAME)
     suite = unittest.TestLoader().loadTestsFromName(f'__main__.CoderSeleniumTests.{test_name}')
-    runner = unittest.TextTestRunner(verbosity=2)
-    return runner.run(suite)
+    runner = unittest.TextTestRunner(verbosity=2,
+                                     resultclass=sink.result_class(history_result_class(history, SUITE_NAME)))
+    try:
+        return runner.run(suite)
+    finally:
+        sink.close()
 
 
-def run_all_tests():
+def ordered_suite(history):
+    """All tests, recent failures first and then longest first"""
+    tests = {t._testMethodName: t for t in iter_tests(unittest.TestLoader().loadTestsFromTestCase(CoderSeleniumTests))}
+    return unittest.TestSuite(tests[name] for name in history.order(SUITE_NAME, list(tests)))
+
+
+def run_all_tests(workers=1):
     """Run all tests in the suite"""
     print("🚀 Running Selenium Test Suite in Coder Workspace")
     print("=" * 60)
     
-    # Check Selenium Grid status using urllib
-    import urllib.request
-    import urllib.error
-    try:
-        with urllib.request.urlopen("http://localhost:4444/wd/hub/status", timeout=5) as response:
-            if response.status == 200:
-                print("✅ Selenium Grid is running")
-            else:
-                print("⚠️  Selenium Grid returned status:", response.status)
-    except (urllib.error.URLError, urllib.error.HTTPError, Exception):
+    # Probe the Grid once; every test reuses this decision
+    if default_factory.backend == "grid":
+        print("✅ Selenium Grid is running")
+    else:
         print("⚠️  Selenium Grid not responding, will use direct ChromeDriver")
     
     print("=" * 60)
     
-    # Run the test suite
-    unittest.main(argv=[''], exit=False, verbosity=2)
+    # Run the test suite, failing-first so CI fails fast and workers stay balanced
+    history = RunHistory()
+    history.start_run(SUITE_NAME)
+    suite = ordered_suite(history)
+    # Results reach disk as they happen: `tail -f` the JSONL to follow a run
+    sink = ResultSink(RESULTS_JSONL, RESULTS_JUNIT, SUITE_NAME)
+    
+    def on_result(test, res, duration):
+        record_result(history, SUITE_NAME, test, res, duration)
+        sink.record_result(test, res, duration)
+    
+    if workers > 1:
+        # One warm browser per worker
+        print(f"⚡ Running in parallel on {workers} workers")
+        CoderSeleniumTests.pool_size = workers
+        result = run_parallel(suite, workers, verbosity=2, on_result=on_result)
+    else:
+        runner = unittest.TextTestRunner(verbosity=2,
+                                         resultclass=sink.result_class(history_result_class(history, SUITE_NAME)))
+        result = runner.run(suite)
+    sink.close()
+    print(f"🧾 Results streamed to {RESULTS_JSONL} and {RESULTS_JUNIT}")
+    history.report(SUITE_NAME)
+    
+    waits.report()
+    timeouts.report()
+    flight_recorder.report()
+    timeouts.save()
+    batch.report()
+    static.report()
+    timings.report()
+    timings.write_json("/home/coder/suite_timings.json")
+    governor.report()
+    governor.write_json("/home/coder/suite_resources.json")
+    navigation.write_json("/home/coder/suite_navigation.json")
+    for backend, stats in default_factory.summary().items():
+        print(f"⏱️  {backend}: {stats['count']} sessions, {stats['mean_ms']:.0f} ms average start")
+    default_factory.dispatcher.report()
+    return result
 
 
 if __name__ == "__main__":
-    import sys
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Selenium test suite for Coder Workspace")
+    parser.add_argument("test_name", nargs="?", help="run a single test, e.g. test_01_google_search")
+    parser.add_argument("--workers", type=int, default=1, help="number of parallel browser sessions")
+    parser.add_argument("--network-mode", choices=MODES, default=CoderSeleniumTests.network_mode,
+                        help="live network, or record/replay traffic through a local proxy")
+    args = parser.parse_args()
+    CoderSeleniumTests.network_mode = args.network_mode
     
-    if len(sys.argv) > 1:
+    if args.test_name:
         # Run specific test
-        test_name = sys.argv[1]
-        print(f"Running specific test: {test_name}")
-        run_individual_test(test_name)
+        print(f"Running specific test: {args.test_name}")
+        run_individual_test(args.test_name)
     else:
         # Run all tests
-        run_all_tests()
+        run_all_tests(workers=args.workers)
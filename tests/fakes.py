@@ -0,0 +1,53 @@
+"""
+In-process stand-ins for WebDriver sessions, so the helpers can be tested without a browser
+"""
+
+import json
+
+from selenium.common.exceptions import WebDriverException
+
+
+class FakeDriver:
+    """Records CDP commands and page loads; serves a canned performance log"""
+
+    def __init__(self, performance_log=()):
+        self.session_id = "fake-session-0001"
+        self.capabilities = {"browserName": "chrome"}
+        self.cdp = []  # (cmd, params)
+        self.visited = []
+        self.performance_log = list(performance_log)
+        self.current_url = "about:blank"
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+        return {}
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+    def get_log(self, kind):
+        if kind != "performance":
+            raise WebDriverException(f"no {kind} log")
+        entries, self.performance_log = self.performance_log, []
+        return entries
+
+    def execute_script(self, script, *args):
+        return []
+
+    def execute_async_script(self, script, *args):
+        raise WebDriverException("no timing in a fake browser")
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def quit(self):
+        pass
+
+
+def performance_entry(method, **params):
+    """One goog:loggingPrefs performance log entry"""
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
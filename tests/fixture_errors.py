@@ -0,0 +1,30 @@
+"""
+A suite whose class fixture fails next to one that passes, for the result recorders' tests
+"""
+
+import unittest
+
+
+class Cases:
+    """Nested so discovery doesn't run them directly"""
+
+    class BrokenFixture(unittest.TestCase):
+        @classmethod
+        def setUpClass(cls):
+            raise RuntimeError("no browser")
+
+        def test_never_runs(self):
+            pass
+
+    class Passing(unittest.TestCase):
+        def test_passes(self):
+            pass
+
+
+SET_UP_CLASS = f"setUpClass ({unittest.util.strclass(Cases.BrokenFixture)})"
+
+
+def fixture_error_suite():
+    loader = unittest.TestLoader()
+    return unittest.TestSuite([loader.loadTestsFromTestCase(Cases.BrokenFixture),
+                               loader.loadTestsFromTestCase(Cases.Passing)])
@@ -0,0 +1,48 @@
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+
+from coder_selenium.auth_state import AuthStateCache
+
+BASE_URL = "https://shop.example.com/inventory.html"
+
+
+class SnapshotDriver:
+    """Just enough of a logged-in session for capture()"""
+
+    def execute_script(self, script, *args):
+        return {"local": {"cart": "[1]"}, "session": {}}
+
+    def get_cookies(self):
+        return [{"name": "session-username", "value": "standard_user", "expiry": time.time() + 600}]
+
+
+class AuthStateCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "auth.json")
+
+    def test_corrupt_cache_starts_empty_and_is_rewritten(self):
+        with open(self.path, "w") as f:
+            f.write('{"standard_user@https://shop.exa')  # torn write
+
+        cache = AuthStateCache(self.path)
+        self.assertEqual(cache.entries, {})
+        self.assertIsNone(cache.get("standard_user", BASE_URL))
+
+        cache.capture(SnapshotDriver(), "standard_user", BASE_URL)
+
+        with open(self.path) as f:
+            self.assertEqual(list(json.load(f)), ["standard_user@https://shop.example.com"])
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["auth.json"])
+        self.assertIsNotNone(AuthStateCache(self.path).get("standard_user", BASE_URL))
+
+
+if __name__ == "__main__":
+    unittest.main()
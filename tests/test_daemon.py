@@ -0,0 +1,21 @@
+import unittest
+from unittest import mock
+
+from coder_selenium.daemon import Daemon
+
+
+class DaemonSettingsTest(unittest.TestCase):
+    def test_run_env_that_changes_an_import_time_setting_asks_for_a_restart(self):
+        with mock.patch.dict("os.environ", {"SELENIUM_ARTIFACTS": "failures"}, clear=True):
+            daemon = Daemon("/nonexistent.sock")
+
+        self.assertEqual(daemon.changed_settings({"SELENIUM_ARTIFACTS": "failures", "RESPONSIVE_DEVICES": "iPad"}), [])
+        self.assertEqual(daemon.changed_settings({"SELENIUM_ARTIFACTS": "failures", "NAV_BUDGETS": "x.json"}),
+                         ["NAV_BUDGETS"])
+        self.assertEqual(daemon.changed_settings({"SELENIUM_ARTIFACTS": "always"}), ["SELENIUM_ARTIFACTS"])
+        self.assertEqual(daemon.changed_settings({"SELENIUM_ARTIFACTS": "failures", "SELENIUM_DISPATCH": "0"}),
+                         ["SELENIUM_DISPATCH"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+
+from selenium.webdriver.chrome.options import Options
+
+from coder_selenium import dispatcher
+from coder_selenium.dispatcher import NODE_CAPABILITY, GridDispatcher, parse_status
+from coder_selenium.driver_factory import DriverFactory
+
+from tests.fakes import FakeDriver
+
+
+def node(name, busy, slots=2, availability="UP"):
+    return {
+        "uri": f"http://{name}:5555",
+        "availability": availability,
+        "slots": [{"stereotype": {"browserName": "chrome", NODE_CAPABILITY: name},
+                   "session": {"sessionId": str(i)} if i < busy else None}
+                  for i in range(slots)],
+    }
+
+
+def status(*nodes):
+    return {"value": {"ready": True, "nodes": list(nodes)}}
+
+
+class FakeGrid(HTTPServer):
+    """Serves a canned /status payload"""
+
+    def __init__(self, payload):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(payload).encode()
+                self.send_response(200 if self.path == "/status" else 404)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class GridFactory(DriverFactory):
+    """Factory on the Grid backend whose sessions come from `create_session(backend, options)`"""
+
+    def __init__(self, grid_status, create_session):
+        super().__init__(grid_url="http://grid.invalid")
+        self._backend = "grid"
+        self.dispatcher.status = lambda: grid_status
+        self.create_session = create_session
+        self.sessions = []
+
+    def _create(self, backend, options):
+        self.sessions.append((backend, options.capabilities.get(NODE_CAPABILITY)))
+        return self.create_session(backend, options)
+
+
+class ParseStatusTest(unittest.TestCase):
+    def test_counts_busy_slots_of_coder_nodes_only(self):
+        standalone = {"uri": "http://standalone:4444", "availability": "UP",
+                      "slots": [{"stereotype": {"browserName": "chrome"}, "session": None}]}
+
+        nodes = parse_status(status(node("node-1", 1), node("node-2", 0, availability="DOWN"), standalone))
+
+        self.assertEqual([(n.name, n.up, n.busy, n.slots, n.free) for n in nodes],
+                         [("node-1", True, 1, 2, 1), ("node-2", False, 0, 2, 2)])
+
+    def test_reads_status_from_the_grid(self):
+        grid = FakeGrid(status(node("node-1", 2), node("node-2", 1)))
+        self.addCleanup(grid.server_close)
+        self.addCleanup(grid.shutdown)
+
+        self.assertEqual(GridDispatcher(grid.url).choose(), "node-2")
+
+    def test_unreachable_grid_leaves_placement_to_the_grid(self):
+        self.assertIsNone(GridDispatcher("http://127.0.0.1:9", timeout=0.2).choose())
+
+
+class DispatchTest(unittest.TestCase):
+    def test_least_loaded_node_counting_pending_sessions(self):
+        grid = GridDispatcher("http://grid.invalid")
+        grid.status = lambda: status(node("node-1", 1, slots=4), node("node-2", 0, slots=2))
+
+        self.assertEqual([grid.choose() for _ in range(3)], ["node-2", "node-1", "node-1"])  # tie: most free slots
+
+    def test_full_grid_falls_back_to_direct(self):
+        factory = GridFactory(status(node("node-1", 2), node("node-2", 2)),
+                              lambda backend, options: FakeDriver())
+
+        driver = factory.create(Options())
+
+        self.assertEqual(factory.sessions, [("direct", None)])
+        self.assertEqual((driver.backend, driver.node), ("direct", None))
+        self.assertEqual(factory.dispatcher.placements, {"direct": 1})
+
+    def test_failed_node_sits_out_the_cooldown(self):
+        def create_session(backend, options):
+            if options.capabilities.get(NODE_CAPABILITY) == "node-1":
+                raise RuntimeError("session not created")
+            return FakeDriver()
+
+        factory = GridFactory(status(node("node-1", 0, slots=4), node("node-2", 1)), create_session)
+        now = [1000.0]
+        with mock.patch.object(dispatcher.time, "monotonic", lambda: now[0]):
+            first = factory.create(Options())
+            now[0] += 59
+            second = factory.create(Options())
+            now[0] += 2
+            after_cooldown = factory.dispatcher.choose()
+
+        # node-1 failed, so that session fell back to direct and the next one avoided it
+        self.assertEqual((first.backend, first.node), ("direct", None))
+        self.assertEqual((second.backend, second.node), ("grid", "node-2"))
+        self.assertEqual(factory.dispatcher.placements, {"direct": 1, "node-2": 1})
+        # 61 seconds later node-1 (least loaded) is back in rotation
+        self.assertEqual(after_cooldown, "node-1")
+
+    def test_clear_forgets_placements(self):
+        grid = GridDispatcher("http://grid.invalid")
+        grid.started("grid", "node-1")
+
+        grid.clear()
+
+        self.assertEqual(grid.placements, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from coder_selenium import batch
+from coder_selenium.flight_recorder import FlightRecorder
+
+from tests.fakes import FakeDriver
+
+PASSWORD = "secret_sauce"
+SESSION_COOKIE = "a1b2c3-session-token"
+
+
+class WireDriver(FakeDriver):
+    """Sends scripts, cookies and CDP commands through execute(), like a real driver"""
+
+    def execute_script(self, script, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT, {"script": script, "args": list(args)})["value"]
+
+    def add_cookie(self, cookie):
+        self.execute(Command.ADD_COOKIE, {"cookie": cookie})
+
+    def execute_cdp_cmd(self, cmd, params):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+
+    def get_screenshot_as_png(self):
+        return b""
+
+
+class RedactionTest(unittest.TestCase):
+    def test_credentials_never_reach_the_dump(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        recorder = FlightRecorder(directory=directory)
+        driver = recorder.instrument(WireDriver())
+
+        batch.fill_form(driver, {(By.ID, "user-name"): "standard_user", (By.ID, "password"): PASSWORD})
+        driver.add_cookie({"name": "session-username", "value": SESSION_COOKIE})
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [{"name": "sid", "value": SESSION_COOKIE}]})
+        driver.execute(Command.SEND_KEYS_TO_ELEMENT, {"id": "e1", "text": PASSWORD})
+        path = recorder.dump(driver, "test_login", "AssertionError: not logged in")
+
+        dumped = ""
+        for name in os.listdir(path):
+            with open(os.path.join(path, name), encoding="utf-8") as f:
+                dumped += f.read()
+        self.assertNotIn(PASSWORD, dumped)
+        self.assertNotIn(SESSION_COOKIE, dumped)
+        # The commands themselves are still there for debugging
+        for command in (Command.W3C_EXECUTE_SCRIPT, Command.ADD_COOKIE, "Network.setCookies", "session-username"):
+            self.assertIn(command, dumped)
+
+
+if __name__ == "__main__":
+    unittest.main()
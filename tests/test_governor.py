@@ -0,0 +1,61 @@
+import unittest
+from unittest import mock
+
+from selenium.webdriver.chrome.options import Options
+
+from coder_selenium import governor as governor_module
+from coder_selenium.driver_factory import DriverFactory
+from coder_selenium.governor import MB, ResourceGovernor
+
+from tests.fakes import FakeDriver
+
+
+class FailingFactory(DriverFactory):
+    def __init__(self):
+        super().__init__()
+        self._backend = "direct"
+
+    def _create(self, backend, options):
+        raise RuntimeError("chromedriver did not start")
+
+
+class AdmissionTest(unittest.TestCase):
+    def setUp(self):
+        # 1500 MB used of a 4000 MB pod: 1900 MB below the 85% watermark, room for two 1000 MB browsers
+        patcher = mock.patch.object(governor_module, "pod_memory", lambda: (1500 * MB, 4000 * MB))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.governor = ResourceGovernor(watermark=0.85, browser_cap_mb=1000, interval=0.01,
+                                         admission_timeout=0.05)
+        self.governor.enabled = True
+        self.governor._ensure_sampler = lambda: None  # no /proc sampling in tests
+
+    def test_burst_of_admissions_reserves_the_cap_for_each_launching_browser(self):
+        self.assertEqual(self.governor.admit(), 0.0)
+        self.assertEqual(self.governor.admit(), 0.0)
+        self.assertEqual(self.governor.reserved, 2)
+        self.assertFalse(self.governor.has_capacity())
+        with self.assertRaises(RuntimeError):
+            self.governor.admit()
+
+    def test_register_and_release_hand_back_the_reservation(self):
+        self.governor.admit()
+        self.governor.admit()
+
+        self.governor.register(FakeDriver())
+        self.assertEqual(self.governor.reserved, 1)
+        self.governor.release()
+        self.assertEqual(self.governor.reserved, 0)
+        self.assertTrue(self.governor.has_capacity())
+
+    def test_failed_launch_releases_its_reservation(self):
+        reserved = governor_module.governor.reserved
+
+        with self.assertRaises(RuntimeError):
+            FailingFactory().create(Options())
+
+        self.assertEqual(governor_module.governor.reserved, reserved)
+
+
+if __name__ == "__main__":
+    unittest.main()
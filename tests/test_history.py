@@ -0,0 +1,46 @@
+import io
+import unittest
+
+from coder_selenium.history import RunHistory, history_result_class, record_result
+from coder_selenium.parallel import run_parallel
+
+from tests.fixture_errors import SET_UP_CLASS, fixture_error_suite
+
+
+class HistoryFixtureErrorTest(unittest.TestCase):
+    def setUp(self):
+        self.history = RunHistory(":memory:")
+        self.history.start_run("suite")
+        self.addCleanup(self.history.close)
+
+    def outcomes(self):
+        return dict(self.history._db.execute("SELECT test, outcome FROM results"))
+
+    def test_serial_run_records_failing_set_up_class(self):
+        runner = unittest.TextTestRunner(stream=io.StringIO(),
+                                         resultclass=history_result_class(self.history, "suite"))
+        result = runner.run(fixture_error_suite())
+
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(self.outcomes(), {
+            SET_UP_CLASS: "error",
+            "test_passes": "pass",
+        })
+
+    def test_parallel_run_reports_failing_set_up_class(self):
+        def on_result(test, result, duration):
+            record_result(self.history, "suite", test, result, duration)
+
+        result = run_parallel(fixture_error_suite(), 2, verbosity=0, stream=io.StringIO(), on_result=on_result)
+
+        self.assertEqual(result.testsRun, 1)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("RuntimeError: no browser", result.errors[0][1])
+        self.assertEqual(self.outcomes(), {
+            SET_UP_CLASS: "error",
+            "test_passes": "pass",
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
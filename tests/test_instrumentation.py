@@ -0,0 +1,24 @@
+import unittest
+
+from coder_selenium.instrumentation import percentile
+
+
+class PercentileTest(unittest.TestCase):
+    def test_exact_rank_boundaries(self):
+        self.assertEqual(percentile([1, 2], 50), 1)
+        self.assertEqual(percentile(range(1, 7), 50), 3)
+        self.assertEqual(percentile(range(1, 101), 99), 99)
+        self.assertEqual(percentile(range(1, 101), 7), 7)
+
+    def test_between_ranks_rounds_up(self):
+        self.assertEqual(percentile([1, 2, 3], 50), 2)
+        self.assertEqual(percentile(range(1, 11), 95), 10)
+
+    def test_extremes(self):
+        self.assertEqual(percentile([], 50), 0.0)
+        self.assertEqual(percentile([5, 1, 3], 0), 1)
+        self.assertEqual(percentile([5, 1, 3], 100), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import threading
+import time
+import unittest
+from collections import deque
+
+from selenium.common.exceptions import TimeoutException
+
+from coder_selenium.load import LoadStats
+
+
+def fixed_stats():
+    """Two minutes of load: ten timed logins, three passed journeys and three failures"""
+    stats = LoadStats(steps=("login", "checkout"))
+    for tenths in range(10, 0, -1):
+        stats.record_step("login", tenths / 10)
+    for _ in range(3):
+        stats.record_journey(True)
+    stats.record_journey(False, "checkout", TimeoutException("Timed out after 10 seconds"))
+    stats.record_journey(False, "checkout", TimeoutException("Timed out after 12 seconds"))
+    stats.record_journey(False, None, RuntimeError("no browser"))
+    stats.started, stats.ended = 1000.0, 1120.0
+    return stats
+
+
+class LoadStatsTest(unittest.TestCase):
+    def test_summary(self):
+        summary = fixed_stats().summary()
+
+        self.assertEqual((summary["elapsed_s"], summary["journeys"], summary["passed"], summary["failed"]),
+                         (120.0, 6, 3, 3))
+        self.assertEqual(summary["error_rate"], 0.5)
+        self.assertEqual(summary["journeys_per_minute"], 1.5)
+
+    def test_step_percentiles(self):
+        steps = fixed_stats().summary()["steps"]
+
+        login = steps["login"]
+        self.assertEqual(login["count"], 10)
+        for key, expected in (("p50_ms", 500), ("p90_ms", 900), ("p99_ms", 1000), ("max_ms", 1000)):
+            self.assertAlmostEqual(login[key], expected, msg=key)
+        # Declared steps are reported even when no journey reached them
+        self.assertEqual(steps["checkout"], {"count": 0, "p50_ms": 0, "p90_ms": 0, "p99_ms": 0, "max_ms": 0})
+
+    def test_errors_grouped_by_step_and_signature(self):
+        errors = fixed_stats().summary()["errors"]
+
+        self.assertEqual(errors, [
+            {"step": "checkout", "error": "TimeoutException: Message: Timed out after N seconds", "count": 2},
+            {"step": "setup", "error": "RuntimeError: no browser", "count": 1},
+        ])
+
+    def test_rate_counts_the_last_window(self):
+        stats = LoadStats()
+        now = time.monotonic()
+        stats.started = now - 300
+        stats.finished = deque([now - 200, now - 90, now - 30, now - 10])
+
+        self.assertAlmostEqual(stats.rate(window=60), 2.0, places=2)
+        self.assertEqual(len(stats.finished), 2)
+
+    def test_concurrent_recording(self):
+        stats = LoadStats()
+
+        def user():
+            for _ in range(250):
+                stats.record_step("inventory", 0.01)
+                stats.record_journey(True)
+
+        threads = [threading.Thread(target=user) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(stats.steps["inventory"]), 1000)
+        self.assertEqual(stats.passed, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from coder_selenium.nav_timing import NavigationCollector
+
+DEFAULT = {"ttfb_ms": 3000, "load_ms": 15000}
+
+
+class BudgetForTest(unittest.TestCase):
+    def setUp(self):
+        self.navigation = NavigationCollector({
+            "": DEFAULT,
+            "https://example.com": {"load_ms": 3000},
+            "https://example.com/shop/": {"load_ms": 5000},
+            "http://127.0.0.1": {"ttfb_ms": 200},
+            "/": {"ttfb_ms": 800},
+            "/checkout": {"ttfb_ms": 1000},
+        })
+
+    def test_longest_url_prefix_wins(self):
+        self.assertEqual(self.navigation.budget_for("https://example.com/shop/cart?id=1")["load_ms"], 5000)
+        self.assertEqual(self.navigation.budget_for("https://example.com/about")["load_ms"], 3000)
+        self.assertEqual(self.navigation.budget_for("http://127.0.0.1:8765/app")["ttfb_ms"], 200)
+
+    def test_url_prefix_ends_at_a_boundary(self):
+        self.assertEqual(self.navigation.budget_for("https://example.community/about"), DEFAULT)
+
+    def test_path_keys_match_only_that_path(self):
+        self.assertEqual(self.navigation.budget_for("https://example.com/"), {"ttfb_ms": 800, "load_ms": 3000})
+        self.assertEqual(self.navigation.budget_for("https://shop.test/checkout")["ttfb_ms"], 1000)
+        self.assertEqual(self.navigation.budget_for("https://shop.test/checkout/done"), DEFAULT)
+        self.assertEqual(self.navigation.budget_for("https://shop.test/products"), DEFAULT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from selenium.webdriver.chrome.options import Options
+
+from coder_selenium import network_policy
+from coder_selenium.driver_factory import DriverFactory
+from coder_selenium.network_policy import NetworkPolicy
+
+from tests.fakes import FakeDriver, performance_entry
+
+
+class FakeFactory(DriverFactory):
+    def __init__(self, driver):
+        super().__init__()
+        self._backend = "direct"  # no Grid probe
+        self.driver = driver
+
+    def _create(self, backend, options):
+        return self.driver
+
+
+class NetworkPolicyAttachTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(network_policy, "SIZES_PATH", "/nonexistent/sizes.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_factory_sends_blocked_urls_and_accounts_for_pages(self):
+        blocked_url = "https://cdn.example.com/hero.png"
+        driver = FakeDriver(performance_log=[
+            performance_entry("Network.requestWillBeSent", requestId="1", request={"url": blocked_url}),
+            performance_entry("Network.loadingFailed", requestId="1", blockedReason="inspector"),
+        ])
+        policy = NetworkPolicy("lean", block=["*tracker.example*"], block_types=("image",))
+        policy._sizes = {blocked_url: 2048}
+
+        FakeFactory(driver).create(Options(), policy)
+        driver.get("https://shop.example.com/")
+
+        blocked = [params for cmd, params in driver.cdp if cmd == "Network.setBlockedURLs"]
+        self.assertEqual(len(blocked), 1)
+        patterns = [rule["urlPattern"] for rule in blocked[0]["urlPatterns"] if rule["block"]]
+        self.assertIn("*tracker.example*", patterns)
+        self.assertIn("*.png*", patterns)
+
+        self.assertEqual(len(policy.pages), 1)
+        page = policy.pages[0]
+        self.assertEqual(page["url"], "https://shop.example.com/")
+        self.assertEqual(page["blocked_requests"], 1)
+        self.assertEqual(page["bytes_avoided"], 2048)
+        self.assertEqual(page["unknown_sizes"], 0)
+
+    def test_full_profile_learns_sizes(self):
+        driver = FakeDriver()
+        driver.execute_script = lambda script, *args: [["https://cdn.example.com/a.js", 512]]
+        policy = NetworkPolicy("full")
+
+        FakeFactory(driver).create(Options(), policy)
+        driver.get("https://shop.example.com/")
+
+        self.assertEqual(policy._sizes, {"https://cdn.example.com/a.js": 512})
+        self.assertEqual([cmd for cmd, _ in driver.cdp].count("Network.setBlockedURLs"), 1)
+
+    def test_flight_recorder_keeps_the_performance_log(self):
+        options = Options()
+        policy = NetworkPolicy("lean", block=["*tracker.example*"])
+
+        FakeFactory(FakeDriver()).create(options, policy)
+
+        self.assertEqual(options.capabilities["goog:loggingPrefs"], {"performance": "ALL", "browser": "ALL"})
+
+
+class ResourceSizesTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "sizes.json")
+        patcher = mock.patch.object(network_policy, "SIZES_PATH", self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_corrupt_sizes_file_starts_empty_and_is_replaced(self):
+        with open(self.path, "w") as f:
+            f.write('{"https://cdn.example.com/a.js": 5')  # torn write
+
+        policy = NetworkPolicy("full")
+        self.assertEqual(policy._sizes, {})
+
+        policy._sizes = {"https://cdn.example.com/a.js": 512}
+        policy.save_sizes()
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"https://cdn.example.com/a.js": 512})
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["sizes.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from coder_selenium.replay_proxy import Archive, ReplayProxy, request_key
+
+
+class Upstream(BaseHTTPRequestHandler):
+    """Origin server the proxy records from; counts what reaches it"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.hits.append(self.path)
+        body = f"<h1>Products</h1><p>{self.path}</p>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("X-Inventory", "6")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def fetch(proxy, url):
+    """(status, headers, body) for a GET through the proxy"""
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({"http": f"http://127.0.0.1:{proxy.port}"}))
+    try:
+        with opener.open(url, timeout=10) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+class ReplayProxyTest(unittest.TestCase):
+    def setUp(self):
+        self.archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.archive_dir)
+        self.upstream = ThreadingHTTPServer(("127.0.0.1", 0), Upstream)
+        self.upstream.hits = []
+        threading.Thread(target=self.upstream.serve_forever, daemon=True).start()
+        self.addCleanup(self.upstream.server_close)
+        self.url = f"http://127.0.0.1:{self.upstream.server_address[1]}/inventory.html"
+
+    def proxy(self, mode):
+        with contextlib.redirect_stdout(io.StringIO()):
+            proxy = ReplayProxy(mode, "saucedemo", self.archive_dir).start()
+        self.addCleanup(self.stop, proxy)
+        return proxy
+
+    def stop(self, proxy):
+        with contextlib.redirect_stdout(io.StringIO()):
+            proxy.stop()
+
+    def test_record_then_replay_without_the_network(self):
+        recorder = self.proxy("record")
+        recorded = fetch(recorder, self.url)
+        self.stop(recorder)
+        self.upstream.shutdown()
+
+        replayer = self.proxy("replay")
+        status, headers, body = fetch(replayer, self.url)
+
+        self.assertEqual(self.upstream.hits, ["/inventory.html"])
+        self.assertEqual((status, body), (recorded[0], recorded[2]))
+        self.assertEqual(body, b"<h1>Products</h1><p>/inventory.html</p>")
+        self.assertEqual(headers["X-Inventory"], "6")
+
+        status, _, _ = fetch(replayer, self.url.replace("inventory", "cart"))
+        self.assertEqual(status, 404)
+        self.assertEqual(replayer.httpd.misses, [f"GET {self.url.replace('inventory', 'cart')}"])
+
+    def test_replay_needs_a_recording(self):
+        with self.assertRaises(RuntimeError):
+            ReplayProxy("replay", "missing", self.archive_dir).start()
+
+
+class ArchiveTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "run")
+
+    def test_rebuilds_a_lost_index(self):
+        archive = Archive(self.path).open_for_record()
+        keys = [request_key("GET", f"https://www.saucedemo.com/{page}", None) for page in ("a", "b", "c")]
+        for i, key in enumerate(keys):
+            archive.add(key, 200, "OK", [["Content-Type", "text/plain"]], f"page {i}".encode())
+        archive.close_record()
+        os.remove(archive.index_path)  # e.g. the recording run crashed
+
+        replay = Archive(self.path).open_for_replay()
+        self.addCleanup(replay.close_replay)
+        self.assertEqual([replay.lookup(key)[3] for key in keys], [b"page 0", b"page 1", b"page 2"])
+        self.assertIsNone(replay.lookup(request_key("POST", "https://www.saucedemo.com/a", b"x")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+from coder_selenium.history import RunHistory, history_result_class
+from coder_selenium.parallel import run_parallel
+from coder_selenium.results import ResultSink, iter_results
+
+from tests.fixture_errors import SET_UP_CLASS, fixture_error_suite
+
+
+class SinkFixtureErrorTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.jsonl = os.path.join(directory, "results.jsonl")
+        self.junit = os.path.join(directory, "results.xml")
+        self.sink = ResultSink(self.jsonl, self.junit, "suite")
+
+    def assertStreamed(self):
+        self.sink.close()
+        self.assertEqual({(r["test"], r["status"]) for r in iter_results(self.jsonl)},
+                         {(SET_UP_CLASS, "error"), ("test_passes", "pass")})
+        cases = ET.parse(self.junit).getroot().iter("testcase")
+        self.assertEqual({(case.get("classname"), case.get("name")) for case in cases},
+                         {("suite", SET_UP_CLASS), ("Passing", "test_passes")})
+
+    def test_serial_run_streams_failing_set_up_class(self):
+        history = RunHistory(":memory:")
+        self.addCleanup(history.close)
+        history.start_run("suite")
+        runner = unittest.TextTestRunner(
+            stream=io.StringIO(), resultclass=self.sink.result_class(history_result_class(history, "suite")))
+
+        result = runner.run(fixture_error_suite())
+
+        self.assertEqual(len(result.errors), 1)
+        self.assertStreamed()
+
+    def test_parallel_run_streams_failing_set_up_class(self):
+        run_parallel(fixture_error_suite(), 2, verbosity=0, stream=io.StringIO(), on_result=self.sink.record_result)
+
+        self.assertStreamed()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import hashlib
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from coder_selenium import screenshot_store
+from coder_selenium.screenshot_store import ScreenshotStore
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def png(color):
+    if Image is None:
+        return bytes(color)  # byte comparison only
+    output = io.BytesIO()
+    Image.new("RGB", (64, 64), color).save(output, format="PNG")
+    return output.getvalue()
+
+
+RED, BLUE = png((255, 0, 0)), png((0, 0, 255))
+
+
+class ScreenshotAcceptTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        ScreenshotStore(self.root, accept_changes=False).record("login", RED)
+
+    def main(self, *args):
+        with mock.patch.object(sys, "argv", ["screenshot_store", *args, "--store", self.root]), \
+                redirect_stdout(io.StringIO()) as out:
+            code = screenshot_store.main()
+        return code, out.getvalue()
+
+    def test_changes_stay_pending_until_accepted(self):
+        store = ScreenshotStore(self.root, accept_changes=False)
+        changed = store.record("login", BLUE)
+        self.assertEqual(changed.status, "changed")
+
+        code, out = self.main("list")
+        self.assertEqual(code, 0)
+        self.assertIn(changed.digest, out)
+        self.assertEqual(ScreenshotStore(self.root).baselines["login"], hashlib.sha256(RED).hexdigest())
+
+        self.assertEqual(self.main("accept", "login")[0], 0)
+        reloaded = ScreenshotStore(self.root, accept_changes=False)
+        self.assertEqual(reloaded.baselines["login"], changed.digest)
+        self.assertEqual(reloaded.pending, {})
+        self.assertEqual(reloaded.record("login", BLUE).status, "unchanged")
+
+    def test_accept_unknown_name_fails(self):
+        self.assertEqual(self.main("accept", "checkout")[0], 1)
+
+    def test_reverting_to_the_baseline_clears_the_pending_change(self):
+        store = ScreenshotStore(self.root, accept_changes=False)
+        store.record("login", BLUE)
+        store.record("login", RED)
+
+        self.assertEqual(ScreenshotStore(self.root).pending, {})
+
+    def test_screenshot_accept_env_accepts_changes_as_they_are_captured(self):
+        with mock.patch.dict("os.environ", {"SCREENSHOT_ACCEPT": "1"}):
+            store = ScreenshotStore(self.root)
+
+        accepted = store.record("login", BLUE)
+
+        self.assertEqual(accepted.status, "accepted")
+        self.assertEqual(ScreenshotStore(self.root).baselines["login"], accepted.digest)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import threading
+import unittest
+
+from coder_selenium.session_pool import SessionPool
+
+from tests.fakes import FakeDriver
+
+
+class CountingDriver(FakeDriver):
+    def __init__(self):
+        super().__init__()
+        self.quits = 0
+
+    def quit(self):
+        self.quits += 1
+
+
+class SessionPoolCloseTest(unittest.TestCase):
+    def test_browser_that_finishes_starting_after_close_is_quit(self):
+        started, finish = threading.Event(), threading.Event()
+        driver = CountingDriver()
+
+        def factory():
+            started.set()
+            finish.wait(5)
+            return driver
+
+        pool = SessionPool(factory, size=1)
+        refill = threading.Thread(target=pool._launch)
+        refill.start()
+        self.assertTrue(started.wait(5))
+
+        pool.close()
+        finish.set()
+        refill.join(5)
+
+        self.assertEqual(driver.quits, 1)
+        self.assertEqual(pool._total, 0)
+        self.assertTrue(pool._idle.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
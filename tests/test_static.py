@@ -0,0 +1,84 @@
+import unittest
+import urllib.parse
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from coder_selenium.static import NeedsBrowser, StaticDriver
+
+INVENTORY = """<!DOCTYPE html>
+<html><head><title>Swag Labs</title><script>document.title = "ignored"</script></head>
+<body>
+<div class="inventory_list" id="inventory">
+  <div class="inventory_item"><div class="inventory_item_name">Sauce Labs Backpack</div>
+    <div class="inventory_item_price">$29.99</div>
+    <button data-test="add-to-cart-sauce-labs-backpack" class="btn btn_primary">Add to cart</button></div>
+  <div class="inventory_item"><div class="inventory_item_name">Sauce Labs Bike Light</div>
+    <div class="inventory_item_price">$9.99</div>
+    <button data-test="add-to-cart-sauce-labs-bike-light" class="btn btn_primary">Add to cart</button></div>
+</div>
+<ul id="sort"><li>Name (A to Z)<li>Price (low to high)</ul>
+<a href="/cart.html" class="shopping_cart_link">Cart</a>
+<input name="quantity">
+</body></html>
+"""
+
+
+def static_page(html):
+    """A StaticDriver that has loaded `html` without touching the network"""
+    driver = StaticDriver()
+    driver.get("data:text/html;charset=utf-8," + urllib.parse.quote(html))
+    return driver
+
+
+class StaticDriverTest(unittest.TestCase):
+    def setUp(self):
+        self.driver = static_page(INVENTORY)
+
+    def test_locator_strategies(self):
+        self.assertEqual(self.driver.title, "Swag Labs")
+        self.assertEqual(len(self.driver.find_elements(By.CLASS_NAME, "inventory_item")), 2)
+        self.assertEqual(self.driver.find_element(By.ID, "inventory").tag_name, "div")
+        self.assertEqual(self.driver.find_element(By.LINK_TEXT, "Cart").get_attribute("href"), "/cart.html")
+        self.assertEqual(self.driver.find_element(By.NAME, "quantity").get_attribute("value"), "")
+
+    def test_css_selectors(self):
+        names = self.driver.find_elements(By.CSS_SELECTOR, "#inventory > .inventory_item .inventory_item_name")
+        self.assertEqual([e.text for e in names], ["Sauce Labs Backpack", "Sauce Labs Bike Light"])
+        button = self.driver.find_element(By.CSS_SELECTOR, "button[data-test$='bike-light'].btn_primary")
+        self.assertEqual(button.text, "Add to cart")
+        self.assertEqual(len(self.driver.find_elements(By.CSS_SELECTOR, ".inventory_item_price, a")), 3)
+        self.assertEqual(self.driver.find_elements(By.CSS_SELECTOR, "body > .inventory_item"), [])
+
+    def test_implied_end_tags(self):
+        options = self.driver.find_elements(By.CSS_SELECTOR, "#sort > li")
+        self.assertEqual([e.text for e in options], ["Name (A to Z)", "Price (low to high)"])
+
+    def test_scoped_lookup(self):
+        item = self.driver.find_elements(By.CLASS_NAME, "inventory_item")[1]
+        self.assertEqual(item.find_element(By.CLASS_NAME, "inventory_item_price").text, "$9.99")
+
+    def test_missing_element(self):
+        with self.assertRaises(NoSuchElementException):
+            self.driver.find_element(By.ID, "checkout")
+
+    def test_falls_back_for_what_needs_a_browser(self):
+        for attempt in (
+            lambda: self.driver.find_element(By.XPATH, "//button"),
+            lambda: self.driver.find_element(By.CSS_SELECTOR, "li:first-child"),
+            lambda: self.driver.find_element(By.CSS_SELECTOR, "div + ul"),
+            lambda: self.driver.find_element(By.ID, "inventory").click(),
+            lambda: self.driver.execute_script("return document.title"),
+            lambda: self.driver.get_screenshot_as_png(),
+        ):
+            with self.subTest(), self.assertRaises(NeedsBrowser):
+                attempt()
+        self.assertIsNone(self.driver.execute_script("window.scrollTo(0, 0);"))
+
+    def test_non_html_response_needs_a_browser(self):
+        with self.assertRaises(NeedsBrowser):
+            StaticDriver().get("data:application/json,{}")
+
+
+if __name__ == "__main__":
+    unittest.main()
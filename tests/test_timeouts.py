@@ -0,0 +1,89 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from coder_selenium.context import begin_test
+from coder_selenium.timeouts import TimeoutPolicy
+
+from tests.fakes import FakeDriver
+
+LOCATOR = "css selector=#checkout"
+
+
+def missing_element_driver():
+    """A driver whose element lookups never find anything"""
+    driver = FakeDriver()
+
+    def execute(driver_command, params=None):
+        if driver_command == Command.FIND_ELEMENT:
+            raise NoSuchElementException(f"no {params['value']}")
+        return {"value": None}
+
+    driver.execute = execute
+    return driver
+
+
+class TimeoutPolicyTest(unittest.TestCase):
+    def setUp(self):
+        begin_test("timeouts")
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "latency.json")
+
+    def policy(self, **kwargs):
+        policy = TimeoutPolicy(self.path, poll=0.01, **kwargs)
+        policy.latencies = {LOCATOR: [0.01] * 5}
+        return policy
+
+    def find(self, policy):
+        driver = policy.instrument(missing_element_driver())
+        started = time.monotonic()
+        try:
+            driver.execute(Command.FIND_ELEMENT, {"using": By.CSS_SELECTOR, "value": "#checkout"})
+        finally:
+            self.elapsed = time.monotonic() - started
+
+    def test_learned_budget_never_drops_below_the_floor(self):
+        self.assertEqual(self.policy().budget(LOCATOR), (2.0, "learned"))
+        self.assertEqual(self.policy(floor=0.1).budget(LOCATOR), (0.1, "learned"))
+
+    def test_learned_miss_raises_no_such_element_after_its_budget(self):
+        policy = self.policy(floor=0.1)
+
+        with self.assertRaises(NoSuchElementException):
+            self.find(policy)
+
+        self.assertGreaterEqual(self.elapsed, 0.1)
+        self.assertLess(self.elapsed, 1.0)
+        self.assertEqual(policy.savings["timeouts"]["learned"]["count"], 1)
+
+    def test_deadline_cuts_a_learned_budget_short(self):
+        policy = self.policy(floor=5.0)
+
+        with policy.deadline(0.1), self.assertRaises(TimeoutException) as caught:
+            self.find(policy)
+
+        self.assertIn("#checkout", caught.exception.msg)
+        self.assertLess(self.elapsed, 1.0)
+        self.assertEqual(list(policy.savings["timeouts"]), ["deadline"])
+
+    def test_save_replaces_the_file_atomically(self):
+        policy = self.policy()
+        policy.observe(LOCATOR, 0.02)
+
+        policy.save()
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {LOCATOR: [0.01] * 5 + [0.02]})
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["latency.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from coder_selenium.tabs import NAVIGATE_JS, STATE_JS
+from coder_selenium.viewports import DEVICES, ViewportMatrix
+
+
+class SwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class TabbedDriver:
+    """Tabs that remember the device metrics each page was loaded with"""
+
+    def __init__(self, broken_widths=()):
+        self.broken_widths = set(broken_widths)
+        self.tabs = {"main": {"url": "about:blank", "metrics": None, "loaded_with": None}}
+        self.current_window_handle = "main"
+        self.switch_to = SwitchTo(self)
+
+    @property
+    def window_handles(self):
+        return list(self.tabs)
+
+    @property
+    def tab(self):
+        return self.tabs[self.current_window_handle]
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Target.createTarget":
+            handle = f"tab-{len(self.tabs)}"
+            self.tabs[handle] = {"url": params["url"], "metrics": None, "loaded_with": None}
+            return {"targetId": handle}
+        if cmd == "Emulation.setDeviceMetricsOverride":
+            if params["width"] in self.broken_widths:
+                return None  # what try_cdp reports when the command fails
+            self.tab["metrics"] = (params["width"], params["height"])
+        return {}
+
+    def execute_script(self, script, *args):
+        if script == NAVIGATE_JS:
+            self.tab["url"], self.tab["loaded_with"] = args[0], self.tab["metrics"]
+            return None
+        if script == STATE_JS:
+            return ["complete", self.tab["url"], "Shop"]
+        return [1, 1, 1, 1]  # viewport_settled
+
+    def close(self):
+        del self.tabs[self.current_window_handle]
+
+
+class ViewportMatrixTest(unittest.TestCase):
+    def test_each_tab_loads_after_its_device_is_emulated(self):
+        driver = TabbedDriver()
+        devices = [DEVICES["Mobile"], DEVICES["Desktop"]]
+
+        results = ViewportMatrix(driver, devices, timeout=1).run(
+            "https://shop.example.com/", lambda d, device: (True, d.tab["loaded_with"]))
+
+        self.assertEqual([(r.device.name, r.passed, r.details) for r in results],
+                         [("Mobile", True, (375, 667)), ("Desktop", True, (1920, 1080))])
+        self.assertEqual(list(driver.tabs), ["main"])
+
+    def test_device_whose_emulation_fails_is_a_failure(self):
+        driver = TabbedDriver(broken_widths={768})
+        devices = [DEVICES["Mobile"], DEVICES["Tablet"], DEVICES["Desktop"]]
+        visited = []
+
+        results = ViewportMatrix(driver, devices, timeout=1).run(
+            "https://shop.example.com/", lambda d, device: (visited.append(device.name) or True, ""))
+
+        self.assertEqual([(r.device.name, r.passed) for r in results],
+                         [("Mobile", True), ("Tablet", False), ("Desktop", True)])
+        self.assertEqual(results[1].details, "device emulation failed")
+        self.assertEqual(visited, ["Mobile", "Desktop"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from selenium.common.exceptions import TimeoutException
+
+from coder_selenium.context import begin_test
+from coder_selenium.waits import WaitRecorder
+
+from tests.fakes import FakeDriver
+
+
+class WaitRecorderTest(unittest.TestCase):
+    def setUp(self):
+        begin_test("waits")
+        self.recorder = WaitRecorder()
+
+    def test_met_condition_reclaims_the_replaced_sleep(self):
+        self.recorder.wait_for(FakeDriver(), lambda driver: True, replaces=2)
+
+        entry = self.recorder.records["waits"]
+        self.assertGreater(entry["reclaimed"], 1.9)
+        self.assertAlmostEqual(entry["reclaimed"], 2 - entry["waited"])
+
+    def test_timed_out_wait_reclaims_nothing(self):
+        with self.assertRaises(TimeoutException):
+            self.recorder.wait_for(FakeDriver(), lambda driver: False, timeout=0.05, replaces=0.01, poll=0.01)
+        self.recorder.wait_for(FakeDriver(), lambda driver: False, timeout=0.05, replaces=0.01, poll=0.01,
+                               optional=True)
+
+        entry = self.recorder.records["waits"]
+        self.assertGreater(entry["waited"], 0.09)
+        self.assertEqual(entry["reclaimed"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()